@@ -25,7 +25,9 @@ from app import models  # noqa
 target_metadata = models.Base.metadata
 
 def get_url():
-    return os.environ.get("DATABASE_URL")
+    # 앱과 같은 기본값을 쓰도록 app.database 의 DATABASE_URL 을 따른다
+    from app.database import DATABASE_URL
+    return DATABASE_URL
 
 def run_migrations_offline():
     url = get_url()
@@ -34,7 +36,24 @@ def run_migrations_offline():
     with context.begin_transaction():
         context.run_migrations()
 
+def run_migrations_on(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite 는 ALTER 제약이 많아 autogenerate 시 batch 모드로 생성
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
 def run_migrations_online():
+    # 호출한 쪽이 연결을 넘긴 경우 (tests/test_migrations.py 의 스크래치 DB)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations_on(connection)
+        return
+
     configuration = config.get_section(config.config_ini_section)
     configuration['sqlalchemy.url'] = get_url()
     connectable = engine_from_config(
@@ -44,10 +63,7 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+        run_migrations_on(connection)
 
 if context.is_offline_mode():
     run_migrations_offline()
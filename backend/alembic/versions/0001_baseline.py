@@ -0,0 +1,94 @@
+"""baseline schema (create_all 시절의 테이블)
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18
+
+create_all 로 이미 테이블이 만들어진 운영 DB에서도 그대로 upgrade 할 수 있도록
+존재하는 테이블은 건너뛴다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_baseline"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+user_role = sa.Enum("user", "admin", "super_admin", name="userroleenum")
+user_status = sa.Enum("pending", "approved", "rejected", name="userstatusenum")
+application_status = sa.Enum("pending", "approved", "rejected", name="applicationstatusenum")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("phone_number", sa.String(length=50), nullable=False),
+            sa.Column("username", sa.String(length=50), nullable=True),
+            sa.Column("hashed_password", sa.String(length=255), nullable=False),
+            sa.Column("role", user_role, nullable=True),
+            sa.Column("status", user_status, nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_phone_number", "users", ["phone_number"], unique=True)
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    if "schedules" not in existing:
+        op.create_table(
+            "schedules",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(length=100), nullable=False),
+            sa.Column("description", sa.String(length=500), nullable=True),
+            sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("end_time", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("start_time_str", sa.String(length=5), nullable=False),
+            sa.Column("end_time_str", sa.String(length=5), nullable=False),
+            sa.Column("work_date", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("capacity", sa.Integer(), nullable=True),
+            sa.Column("current_applicants", sa.Integer(), nullable=True),
+        )
+        op.create_index("ix_schedules_id", "schedules", ["id"])
+
+    if "applications" not in existing:
+        op.create_table(
+            "applications",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+            sa.Column("schedule_id", sa.Integer(), sa.ForeignKey("schedules.id", ondelete="CASCADE"), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column("status", application_status, nullable=True),
+        )
+        op.create_index("ix_applications_id", "applications", ["id"])
+
+    if "notices" not in existing:
+        op.create_table(
+            "notices",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("content", sa.String(length=4000), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column("view_count", sa.Integer(), nullable=True),
+            sa.Column("is_pinned", sa.Boolean(), nullable=True),
+        )
+        op.create_index("ix_notices_id", "notices", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("notices")
+    op.drop_table("applications")
+    op.drop_table("schedules")
+    op.drop_table("users")
+    bind = op.get_bind()
+    for enum_type in (application_status, user_status, user_role):
+        enum_type.drop(bind, checkfirst=True)
@@ -0,0 +1,53 @@
+"""스케줄 신청자 카운터 컬럼
+
+Revision ID: 0002_applicant_counters
+Revises: 0001_baseline
+Create Date: 2026-10-18
+
+schedules.pending_applicants / active_applicants 추가 후 실제 신청서 수로 채운다.
+(신청서 유니크 제약은 0002a_applications_unique)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_applicant_counters"
+down_revision: Union[str, Sequence[str], None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 카운터 백필 (app/counters.py reconcile_statement 와 같은 정의)
+BACKFILL_COUNTERS = """
+    UPDATE schedules SET
+        pending_applicants = (SELECT COUNT(*) FROM applications a
+                              WHERE a.schedule_id = schedules.id AND a.status = 'pending'),
+        active_applicants = (SELECT COUNT(*) FROM applications a
+                             WHERE a.schedule_id = schedules.id AND a.status IN ('pending', 'approved')),
+        current_applicants = (SELECT COUNT(*) FROM applications a
+                              WHERE a.schedule_id = schedules.id AND a.status = 'approved')
+"""
+
+
+def _columns(table: str) -> set:
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    missing = {"pending_applicants", "active_applicants"} - _columns("schedules")
+    if missing:
+        with op.batch_alter_table("schedules") as batch:
+            for name in sorted(missing):
+                batch.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+
+    op.execute(BACKFILL_COUNTERS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("schedules") as batch:
+        batch.drop_column("active_applicants")
+        batch.drop_column("pending_applicants")
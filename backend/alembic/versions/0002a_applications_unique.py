@@ -0,0 +1,83 @@
+"""신청서 (user_id, schedule_id) 유니크 제약
+
+Revision ID: 0002a_applications_unique
+Revises: 0002_applicant_counters
+Create Date: 2026-10-18
+
+(user_id, schedule_id) 가 같은 신청서는 상태 우선순위(approved > pending > rejected), 같으면 id 가
+가장 작은 것 하나만 남기고 지운 뒤 유니크 제약을 건다 - 실제 승인이 지워지지 않도록. 지운 행은
+경고 로그로 남기고(운영자 확인용) 스케줄 카운터를 다시 채운다. uq_applications_user_schedule 이 이미 있으면 건너뛴다.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002a_applications_unique"
+down_revision: Union[str, Sequence[str], None] = "0002_applicant_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNIQUE_NAME = "uq_applications_user_schedule"
+
+# 0002_applicant_counters.BACKFILL_COUNTERS 와 같은 문장 (리비전 모듈끼리는 import 하지 않는다)
+BACKFILL_COUNTERS = """
+    UPDATE schedules SET
+        pending_applicants = (SELECT COUNT(*) FROM applications a
+                              WHERE a.schedule_id = schedules.id AND a.status = 'pending'),
+        active_applicants = (SELECT COUNT(*) FROM applications a
+                             WHERE a.schedule_id = schedules.id AND a.status IN ('pending', 'approved')),
+        current_applicants = (SELECT COUNT(*) FROM applications a
+                              WHERE a.schedule_id = schedules.id AND a.status = 'approved')
+"""
+
+
+# 남길 신청서가 앞에 오도록 - 순위 1 이 아닌 행이 지울 중복
+RANKED_APPLICATIONS = """
+    SELECT id, user_id, schedule_id, status, ROW_NUMBER() OVER (
+        PARTITION BY user_id, schedule_id
+        ORDER BY CASE status WHEN 'approved' THEN 0 WHEN 'pending' THEN 1 ELSE 2 END, id
+    ) AS keep_rank
+    FROM applications
+"""
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _has_unique(table: str, name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    names = {uc["name"] for uc in inspector.get_unique_constraints(table)}
+    names |= {ix["name"] for ix in inspector.get_indexes(table) if ix.get("unique")}
+    return name in names
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_unique("applications", UNIQUE_NAME):
+        return
+    bind = op.get_bind()
+    duplicates = bind.execute(sa.text(
+        f"SELECT id, user_id, schedule_id, status FROM ({RANKED_APPLICATIONS}) ranked WHERE keep_rank > 1 ORDER BY id"
+    )).all()
+    for row in duplicates:
+        logger.warning(
+            f"Deleting duplicate application {row.id} (user {row.user_id}, schedule {row.schedule_id}, {row.status})"
+        )
+    if duplicates:
+        bind.execute(
+            sa.text("DELETE FROM applications WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": [row.id for row in duplicates]},
+        )
+    with op.batch_alter_table("applications") as batch:
+        batch.create_unique_constraint(UNIQUE_NAME, ["user_id", "schedule_id"])
+    if duplicates:
+        op.execute(BACKFILL_COUNTERS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("applications") as batch:
+        batch.drop_constraint(UNIQUE_NAME, type_="unique")
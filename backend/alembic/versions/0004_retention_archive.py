@@ -0,0 +1,64 @@
+"""보존 기간이 지난 스케줄/신청서 보관 테이블
+
+Revision ID: 0004_retention_archive
+Revises: 0003_hot_path_indexes
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_retention_archive"
+down_revision: Union[str, Sequence[str], None] = "0003_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# applications.status 와 같은 타입을 재사용 (0001 에서 이미 생성됨)
+application_status = sa.Enum("pending", "approved", "rejected", name="applicationstatusenum").with_variant(
+    postgresql.ENUM("pending", "approved", "rejected", name="applicationstatusenum", create_type=False), "postgresql"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "schedules_archive" not in existing:
+        op.create_table(
+            "schedules_archive",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("schedule_id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(length=100), nullable=False),
+            sa.Column("work_date", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("start_time_str", sa.String(length=5), nullable=False),
+            sa.Column("end_time_str", sa.String(length=5), nullable=False),
+            sa.Column("capacity", sa.Integer(), nullable=True),
+            sa.Column("current_applicants", sa.Integer(), nullable=True),
+            sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_schedules_archive_schedule_id", "schedules_archive", ["schedule_id"])
+        op.create_index("ix_schedules_archive_work_date", "schedules_archive", ["work_date"])
+
+    if "applications_archive" not in existing:
+        op.create_table(
+            "applications_archive",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("application_id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=True),
+            sa.Column("schedule_id", sa.Integer(), nullable=True),
+            sa.Column("status", application_status, nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        )
+        op.create_index("ix_applications_archive_user_id", "applications_archive", ["user_id"])
+        op.create_index("ix_applications_archive_schedule_id", "applications_archive", ["schedule_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("applications_archive")
+    op.drop_table("schedules_archive")
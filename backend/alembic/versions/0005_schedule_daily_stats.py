@@ -0,0 +1,69 @@
+"""날짜별 자리 현황 집계 테이블 (GET /schedules/calendar)
+
+Revision ID: 0005_schedule_daily_stats
+Revises: 0004_retention_archive
+Create Date: 2026-10-18
+
+기존 스케줄로 집계를 채운다 (app/calendar_rollup.py 와 같은 정의 - work_date 의 UTC 날짜별 합).
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_schedule_daily_stats"
+down_revision: Union[str, Sequence[str], None] = "0004_retention_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STAT_COLUMNS = ("shift_count", "total_capacity", "approved", "pending", "active")
+
+
+def _backfill(daily_stats: sa.Table):
+    schedules = sa.table(
+        "schedules",
+        sa.column("work_date", sa.DateTime(timezone=True)),
+        sa.column("capacity", sa.Integer()),
+        sa.column("current_applicants", sa.Integer()),
+        sa.column("pending_applicants", sa.Integer()),
+        sa.column("active_applicants", sa.Integer()),
+    )
+    totals = defaultdict(lambda: [0, 0, 0, 0, 0])
+    for row in op.get_bind().execute(sa.select(schedules)):
+        work_date = row.work_date
+        if work_date.tzinfo is not None:
+            work_date = work_date.astimezone(timezone.utc)
+        total = totals[work_date.date()]
+        total[0] += 1
+        total[1] += row.capacity or 0
+        total[2] += row.current_applicants or 0
+        total[3] += row.pending_applicants or 0
+        total[4] += row.active_applicants or 0
+    if totals:
+        now = datetime.now(timezone.utc)
+        op.bulk_insert(daily_stats, [
+            {"day": day, **dict(zip(STAT_COLUMNS, total)), "updated_at": now}
+            for day, total in sorted(totals.items())
+        ])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "schedule_daily_stats" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    daily_stats = op.create_table(
+        "schedule_daily_stats",
+        sa.Column("day", sa.Date(), primary_key=True),
+        *(sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in STAT_COLUMNS),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    _backfill(daily_stats)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("schedule_daily_stats")
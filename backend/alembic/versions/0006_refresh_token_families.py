@@ -0,0 +1,40 @@
+"""refresh token 계열 테이블 (POST /auth/refresh)
+
+Revision ID: 0006_refresh_token_families
+Revises: 0005_schedule_daily_stats
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_refresh_token_families"
+down_revision: Union[str, Sequence[str], None] = "0005_schedule_daily_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "refresh_token_families" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "refresh_token_families",
+        sa.Column("id", sa.String(length=32), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("revoked_reason", sa.String(length=20), nullable=True),
+    )
+    op.create_index("ix_refresh_token_families_user_id", "refresh_token_families", ["user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("refresh_token_families")
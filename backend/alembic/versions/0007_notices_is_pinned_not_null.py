@@ -0,0 +1,35 @@
+"""notices.is_pinned NOT NULL DEFAULT false
+
+Revision ID: 0007_notices_is_pinned_not_null
+Revises: 0006_refresh_token_families
+Create Date: 2026-10-18
+
+공지 커서 키 (is_pinned, created_at, id) 의 첫 컬럼. NULL 은 DB 마다 정렬 위치가 달라
+(PostgreSQL DESC 는 맨 앞) 행 값 비교 커서가 그 행을 건너뛰거나 반복하므로 false 로 채우고 NOT NULL 로 바꾼다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_notices_is_pinned_not_null"
+down_revision: Union[str, Sequence[str], None] = "0006_refresh_token_families"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+notices = sa.table("notices", sa.column("is_pinned", sa.Boolean()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(notices.update().where(notices.c.is_pinned.is_(None)).values(is_pinned=False))
+    with op.batch_alter_table("notices") as batch:
+        batch.alter_column("is_pinned", existing_type=sa.Boolean(), nullable=False, server_default=sa.false())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("notices") as batch:
+        batch.alter_column("is_pinned", existing_type=sa.Boolean(), nullable=True, server_default=None)
@@ -0,0 +1,176 @@
+# backend/app/admission.py
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from .database import DB_MAX_OVERFLOW, DB_POOL_SIZE
+from .metrics import (
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTED, ADMISSION_WAIT_SECONDS, DB_POOL_TIMEOUTS,
+)
+
+# 0 이면 AdmissionMiddleware 를 설치하지 않는다 (app/main.py) - 경합 벤치마크처럼 대기열 없이 DB 경합을 재는 경우
+ADMISSION_ENABLED = os.environ.get("ADMISSION_ENABLED", "1") != "0"
+# 워커당 동시에 처리할 DB 사용 요청 수 (기본: 커넥션 풀 크기 + overflow, 0 이면 제한 없음)
+ADMISSION_MAX_CONCURRENT = int(os.environ.get("ADMISSION_MAX_CONCURRENT", DB_POOL_SIZE + DB_MAX_OVERFLOW))
+ADMISSION_QUEUE_SIZE = int(os.environ.get("ADMISSION_QUEUE_SIZE", 100))  # 제한을 넘은 요청을 기다리게 할 수
+ADMISSION_MAX_WAIT = float(os.environ.get("ADMISSION_MAX_WAIT", 5))  # 이 시간(초) 안에 차례가 안 오면 503
+ADMISSION_RETRY_AFTER = int(os.environ.get("ADMISSION_RETRY_AFTER", 2))
+
+# 숫자가 작을수록 먼저 처리 (대기열이 가득 차면 가장 뒤의 낮은 우선순위 요청을 밀어낸다)
+PRIORITY_HIGH = 0  # 관리자, 로그인/회원가입
+PRIORITY_NORMAL = 1  # 신청/취소, 마이페이지 등
+PRIORITY_LOW = 2  # 공개 스케줄/공지 조회 (ETag 캐시가 있어 재시도 비용이 작다)
+PRIORITY_NAMES = ("high", "normal", "low")
+
+HIGH_PRIORITY_PREFIXES = ("/api/admin", "/api/auth")
+LOW_PRIORITY_PREFIXES = ("/api/schedules", "/api/notices")
+# DB 를 오래 붙잡지 않거나 따로 제한되는 경로 (SSE 는 연결 수를 SSE_MAX_CLIENTS 로 제한)
+EXEMPT_PATHS = frozenset({"/api", "/api/schedules/stream"})
+
+OVERLOADED_DETAIL = "요청이 많아 잠시 후 다시 시도해주세요."
+
+logger = logging.getLogger(__name__)
+
+
+def request_priority(method: str, path: str) -> Optional[int]:
+    """요청의 우선순위. DB 를 쓰지 않는 경로(/health, /metrics 등)는 None"""
+    if not path.startswith("/api/") or path in EXEMPT_PATHS:
+        return None
+    if path.startswith(HIGH_PRIORITY_PREFIXES):
+        return PRIORITY_HIGH
+    if method in ("GET", "HEAD") and path.startswith(LOW_PRIORITY_PREFIXES):
+        return PRIORITY_LOW
+    return PRIORITY_NORMAL
+
+
+class AdmissionController:
+    """워커 안에서 동시에 DB 를 쓰는 요청 수를 limit 로 제한하는 우선순위 대기열.
+
+    limit 를 넘은 요청은 (우선순위, 도착 순서) 힙에서 기다리다가 끝난 요청의 슬롯을 그대로 넘겨받는다.
+    max_wait 안에 차례가 오지 않거나 대기열이 가득 차면 거절 사유를 돌려준다 - 커넥션 풀 타임아웃까지
+    보이지 않게 기다렸다가 500 이 나는 대신 바로 503 + Retry-After 로 응답하기 위함.
+    이벤트 루프에서만 사용하므로 카운터에 별도 락이 필요 없다.
+    """
+
+    def __init__(self, limit: int, queue_size: int, max_wait: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, priority: int) -> Optional[str]:
+        """슬롯을 얻으면 None, 거절되면 사유 (queue_full / evicted / timeout)"""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self._update_gauges()
+            return None
+
+        if len(self._waiters) >= self.queue_size:
+            # 대기열에서 가장 뒤(낮은 우선순위, 늦게 온) 요청보다 급하면 그 자리를 빼앗는다
+            last = max(self._waiters, default=None)
+            if last is None or last[0] <= priority:
+                return "queue_full"
+            self._remove(last)
+            last[2].set_result(False)
+
+        entry = (priority, next(self._order), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, entry)
+        self._update_gauges()
+        try:
+            admitted = await asyncio.wait_for(entry[2], self.max_wait)
+        except asyncio.TimeoutError:
+            self._remove(entry)
+            return "timeout"
+        except asyncio.CancelledError:
+            # 클라이언트가 기다리다 끊은 경우 - 이미 넘겨받은 슬롯이 있으면 돌려준다
+            if entry[2].done() and not entry[2].cancelled() and entry[2].result():
+                self.release()
+            else:
+                self._remove(entry)
+            raise
+        return None if admitted else "evicted"
+
+    def release(self):
+        """요청이 끝나면 호출 - 기다리는 요청이 있으면 슬롯을 그대로 넘긴다"""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(True)
+                self._update_gauges()
+                return
+        self.in_flight -= 1
+        self._update_gauges()
+
+    def _remove(self, entry):
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self._update_gauges()
+
+    def _update_gauges(self):
+        ADMISSION_IN_FLIGHT.set(self.in_flight)
+        ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+
+
+def overloaded_response() -> JSONResponse:
+    return JSONResponse(
+        {"detail": OVERLOADED_DETAIL},
+        status_code=503,
+        headers={"Retry-After": str(ADMISSION_RETRY_AFTER)},
+    )
+
+
+class AdmissionMiddleware:
+    """DB 를 쓰는 /api 요청을 AdmissionController 로 제한하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or admission
+
+    async def __call__(self, scope, receive, send):
+        priority = None
+        if scope["type"] == "http" and self.controller.enabled:
+            priority = request_priority(scope["method"], scope["path"])
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        rejected = await self.controller.acquire(priority)
+        ADMISSION_WAIT_SECONDS.labels(PRIORITY_NAMES[priority]).observe(time.perf_counter() - started)
+        if rejected is not None:
+            ADMISSION_REJECTED.labels(PRIORITY_NAMES[priority], rejected).inc()
+            await overloaded_response()(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+
+async def pool_timeout_handler(request: Request, exc: Exception) -> JSONResponse:
+    """DB_POOL_TIMEOUT 안에 커넥션을 못 얻은 경우 (백그라운드 작업과 겹친 순간 등) 500 대신 503"""
+    DB_POOL_TIMEOUTS.inc()
+    logger.warning(f"DB pool checkout timed out: {request.method} {request.url.path}")
+    return overloaded_response()
+
+
+admission = AdmissionController(ADMISSION_MAX_CONCURRENT, ADMISSION_QUEUE_SIZE, ADMISSION_MAX_WAIT)
@@ -0,0 +1,130 @@
+# backend/app/cache.py
+import gzip
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip/원본만 제공
+    brotli = None
+
+# 다른 워커 프로세스의 쓰기는 버전을 올리지 못하므로 TTL로 최대 지연을 제한
+SCHEDULE_CACHE_TTL = float(os.environ.get("SCHEDULE_CACHE_TTL", 5))
+SCHEDULE_CACHE_MAX_ENTRIES = int(os.environ.get("SCHEDULE_CACHE_MAX_ENTRIES", 256))
+# bump() 후 이 시간(초) 동안은 복제본에서 읽은 응답을 저장하지 않는다 - 복제 지연 중인 복제본의 이전 데이터가
+# 새 버전으로 캐시되지 않도록 (기본값은 app/read_routing.py 의 READ_YOUR_WRITES_SECONDS 와 같은 기준)
+SCHEDULE_CACHE_REPLICA_HOLDOFF = float(
+    os.environ.get("SCHEDULE_CACHE_REPLICA_HOLDOFF", os.environ.get("READ_YOUR_WRITES_SECONDS", 5))
+)
+# 이보다 작은 응답은 압축 이득이 없어 원본만 보관
+COMPRESS_MIN_SIZE = 512
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # W/ 접두사는 약한 비교로 허용 (RFC 9110 13.1.2)
+    return any(tag == etag or tag == f"W/{etag}" for tag in candidates)
+
+
+class CachedResponse:
+    """직렬화된 JSON 본문과 미리 압축해 둔 사본"""
+
+    __slots__ = ("version", "created", "body", "headers", "etag", "gzip_body", "br_body")
+
+    def __init__(self, version: int, body: bytes, headers: Optional[dict] = None):
+        self.version = version
+        self.created = time.monotonic()
+        self.body = body
+        self.headers = headers or {}
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.gzip_body = None
+        self.br_body = None
+        if len(body) >= COMPRESS_MIN_SIZE:
+            self.gzip_body = gzip.compress(body, compresslevel=6)
+            if brotli is not None:
+                self.br_body = brotli.compress(body, quality=5)
+
+    def respond(self, request: Request) -> Response:
+        headers = {
+            **self.headers,
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+
+        accept_encoding = request.headers.get("accept-encoding", "")
+        body = self.body
+        if self.br_body is not None and "br" in accept_encoding:
+            body = self.br_body
+            headers["Content-Encoding"] = "br"
+        elif self.gzip_body is not None and "gzip" in accept_encoding:
+            body = self.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+class VersionedResponseCache:
+    """쓰기 시 버전을 올려 한꺼번에 무효화하는 응답 캐시.
+
+    이벤트 루프에서만 접근하므로 락을 두지 않는다.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, replica_holdoff: float = 0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.replica_holdoff = replica_holdoff
+        self.version = 0
+        self.bumped_at = float("-inf")
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        return f"{request.url.path}?{request.url.query}"
+
+    def get(self, request: Request) -> Optional[CachedResponse]:
+        if getattr(request.state, "read_primary", False):
+            # 방금 쓴 클라이언트 - 복제본에서 채워졌을 수 있는 캐시 대신 주 DB 에서 읽는다 (get_read_db)
+            return None
+        key = self.key_for(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.version != self.version or time.monotonic() - entry.created > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, request: Request, version: int, body: bytes, headers: Optional[dict] = None) -> CachedResponse:
+        """조회 시작 시점의 version을 받아, 그 사이 쓰기가 있었다면 저장하지 않는다.
+
+        복제본에서 읽은 응답(get_read_db 가 request.state.read_replica 를 표시)은 마지막 bump() 후
+        replica_holdoff 동안 저장하지 않는다 - 복제본이 아직 그 쓰기를 받지 못했을 수 있다.
+        """
+        entry = CachedResponse(version, body, headers)
+        if getattr(request.state, "read_replica", False) and time.monotonic() - self.bumped_at < self.replica_holdoff:
+            return entry
+        if version == self.version:
+            self._entries[self.key_for(request)] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def bump(self):
+        self.version += 1
+        self.bumped_at = time.monotonic()
+        self._entries.clear()
+
+
+# 스케줄 목록/상세 응답 캐시 - 스케줄 또는 신청서 쓰기 후 bump() 호출
+schedule_cache = VersionedResponseCache(SCHEDULE_CACHE_TTL, SCHEDULE_CACHE_MAX_ENTRIES, SCHEDULE_CACHE_REPLICA_HOLDOFF)
@@ -0,0 +1,203 @@
+# backend/app/calendar_rollup.py
+import asyncio
+import logging
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .cache import schedule_cache
+from .database import AsyncSessionLocal, async_engine
+from .models import Schedule, ScheduleDailyStats
+
+# 쓰기 후 바뀐 날짜를 모아 다시 계산하는 주기
+CALENDAR_ROLLUP_INTERVAL = float(os.environ.get("CALENDAR_ROLLUP_INTERVAL", 1))
+# 동시에 같은 날짜를 갱신한 워커끼리 덮어써 생길 수 있는 어긋남을 주기적으로 바로잡는다
+CALENDAR_ROLLUP_SWEEP_INTERVAL = float(os.environ.get("CALENDAR_ROLLUP_SWEEP_INTERVAL", 600))
+# 첫 보정은 앱 시작 후 이 시간(초)이 지나서 - 콜드 스타트 직후 요청과 DB 를 다투지 않도록
+CALENDAR_ROLLUP_FIRST_SWEEP_DELAY = float(os.environ.get("CALENDAR_ROLLUP_FIRST_SWEEP_DELAY", 60))
+CALENDAR_ROLLUP_SWEEP_DAYS = (-7, 120)  # 오늘 기준 다시 계산할 범위 (달력에서 실제로 보는 기간)
+
+STAT_COLUMNS = ("shift_count", "total_capacity", "approved", "pending", "active")
+
+logger = logging.getLogger(__name__)
+
+
+def utc_day(work_date: datetime) -> date:
+    """work_date 의 UTC 날짜 (SQLite 는 tz 없이 UTC 로 저장된 값을 돌려준다)"""
+    if work_date.tzinfo is not None:
+        work_date = work_date.astimezone(timezone.utc)
+    return work_date.date()
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time(0), tzinfo=timezone.utc)
+
+
+def day_runs(days: Iterable[date]) -> List[Tuple[date, date]]:
+    """날짜 집합을 연속한 구간 [(처음, 끝)] 으로 묶는다"""
+    runs = []
+    for day in sorted(days):
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+class CalendarRollup:
+    """schedule_daily_stats 유지 - 스케줄/신청서 쓰기 후 해당 날짜 행만 다시 계산한다.
+
+    요청 트랜잭션에서는 날짜(또는 스케줄 id)만 기록하고, 백그라운드에서 interval 마다 모아
+    work_date 인덱스 범위 한 번을 읽어 날짜별로 합산해 upsert 한다. 요청 중에 날짜 행을 잠그지
+    않으므로 신청 러시 때 같은 날짜의 신청끼리 줄 서지 않는다 (대신 최대 interval 만큼 늦게 반영).
+    """
+
+    def __init__(self, interval: float, sweep_interval: float, first_sweep_delay: float = 0):
+        self.interval = interval
+        self.sweep_interval = sweep_interval
+        self.first_sweep_delay = first_sweep_delay
+        self._days: Set[date] = set()
+        self._schedule_ids: Set[int] = set()
+
+    def touch(self, *work_dates: datetime):
+        """이 work_date 들의 날짜를 다시 계산 (스케줄 생성/수정/삭제 - 수정은 이전 날짜도 넘길 것)"""
+        self._days.update(utc_day(work_date) for work_date in work_dates)
+
+    def touch_schedules(self, *schedule_ids: int):
+        """이 스케줄들의 날짜를 다시 계산 (신청/취소/상태 변경 - 날짜는 flush 때 조회)"""
+        self._schedule_ids.update(schedule_ids)
+
+    async def flush(self) -> int:
+        """모아 둔 날짜를 다시 계산. 바뀐 날짜 수를 반환"""
+        if not self._days and not self._schedule_ids:
+            return 0
+        days, self._days = self._days, set()
+        schedule_ids, self._schedule_ids = self._schedule_ids, set()
+        try:
+            async with AsyncSessionLocal() as db:
+                if schedule_ids:
+                    work_dates = await db.scalars(select(Schedule.work_date).where(Schedule.id.in_(schedule_ids)))
+                    days.update(utc_day(work_date) for work_date in work_dates)
+                changed = await self._refresh(db, days)
+                await db.commit()
+        except Exception:
+            # 다음 주기에 다시 시도
+            self._days.update(days)
+            self._schedule_ids.update(schedule_ids)
+            raise
+        if changed:
+            schedule_cache.bump()  # 캐시된 달력 응답 무효화 - 집계가 그대로면 캐시도 그대로 둔다
+        return changed
+
+    async def refresh_range(self, first: date, last: date) -> int:
+        """first ~ last 날짜를 모두 다시 계산 (주기적 보정, 재구축). 바뀐 날짜 수를 반환"""
+        days = {first + timedelta(days=n) for n in range((last - first).days + 1)}
+        async with AsyncSessionLocal() as db:
+            changed = await self._refresh(db, days)
+            await db.commit()
+        if changed:
+            schedule_cache.bump()
+        return changed
+
+    async def rebuild(self) -> int:
+        """집계 테이블을 비우고 모든 스케줄 날짜로 다시 만든다 (python -m app.calendar_rollup)"""
+        written = 0
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ScheduleDailyStats))
+            first, last = (await db.execute(select(func.min(Schedule.work_date), func.max(Schedule.work_date)))).one()
+            if first is not None:
+                first, last = utc_day(first), utc_day(last)
+                written = await self._refresh(db, {first + timedelta(days=n) for n in range((last - first).days + 1)})
+            await db.commit()
+        schedule_cache.bump()
+        return written
+
+    async def prune_before(self, cutoff: datetime):
+        """보존 기간 정리 후 - cutoff 이전 날짜 행을 지우고 cutoff 날짜는 다시 계산"""
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ScheduleDailyStats).where(ScheduleDailyStats.day < utc_day(cutoff)))
+            await self._refresh(db, {utc_day(cutoff)})
+            await db.commit()
+
+    @staticmethod
+    async def _refresh(db, days: Iterable[date]) -> int:
+        """날짜별 집계를 다시 계산해 값이 달라진 날짜만 upsert (근무가 없어진 날짜는 삭제). 바뀐 날짜 수를 반환"""
+        days = set(days)
+        if not days:
+            return 0
+        # 해당 날짜들의 work_date 범위만 읽는다 (연속한 날짜는 한 범위로) - 멀리 떨어진 두 날짜 사이를 훑지 않도록
+        rows = (await db.execute(
+            select(
+                Schedule.work_date, Schedule.capacity, Schedule.current_applicants,
+                Schedule.pending_applicants, Schedule.active_applicants,
+            ).where(or_(*(
+                and_(Schedule.work_date >= day_start(first), Schedule.work_date < day_start(last + timedelta(days=1)))
+                for first, last in day_runs(days)
+            )))
+        )).all()
+        totals: Dict[date, tuple] = {}
+        for row in rows:
+            day = utc_day(row.work_date)
+            if day in days:
+                total = totals.get(day, (0, 0, 0, 0, 0))
+                totals[day] = (
+                    total[0] + 1,
+                    total[1] + (row.capacity or 0),
+                    total[2] + (row.current_applicants or 0),
+                    total[3] + (row.pending_applicants or 0),
+                    total[4] + (row.active_applicants or 0),
+                )
+
+        # 지금 저장된 집계와 비교해 달라진 날짜만 쓴다 (주기적 보정이 매번 캐시를 무효화하지 않도록)
+        stored = {
+            row.day: tuple(row[1:])
+            for row in await db.execute(
+                select(ScheduleDailyStats.day, *(getattr(ScheduleDailyStats, name) for name in STAT_COLUMNS))
+                .where(ScheduleDailyStats.day.in_(days))
+            )
+        }
+        empty = stored.keys() - totals.keys()
+        changed = {day: total for day, total in totals.items() if stored.get(day) != total}
+        if empty:
+            await db.execute(delete(ScheduleDailyStats).where(ScheduleDailyStats.day.in_(empty)))
+        if changed:
+            insert = pg_insert if async_engine.dialect.name == "postgresql" else sqlite_insert
+            stmt = insert(ScheduleDailyStats)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ScheduleDailyStats.day],
+                set_={name: stmt.excluded[name] for name in (*STAT_COLUMNS, "updated_at")},
+            )
+            await db.execute(stmt, [
+                {"day": day, **dict(zip(STAT_COLUMNS, total)), "updated_at": datetime.now(timezone.utc)}
+                for day, total in sorted(changed.items())
+            ])
+        return len(empty) + len(changed)
+
+    async def run_periodic(self):
+        loop = asyncio.get_running_loop()
+        next_sweep = loop.time() + self.first_sweep_delay
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+                if loop.time() >= next_sweep:
+                    today = datetime.now(timezone.utc).date()
+                    await self.refresh_range(
+                        today + timedelta(days=CALENDAR_ROLLUP_SWEEP_DAYS[0]),
+                        today + timedelta(days=CALENDAR_ROLLUP_SWEEP_DAYS[1]),
+                    )
+                    next_sweep = loop.time() + self.sweep_interval
+            except Exception as e:
+                logger.error(f"Error refreshing calendar rollup: {e}")
+
+
+calendar_rollup = CalendarRollup(CALENDAR_ROLLUP_INTERVAL, CALENDAR_ROLLUP_SWEEP_INTERVAL, CALENDAR_ROLLUP_FIRST_SWEEP_DELAY)
+
+
+if __name__ == "__main__":
+    rebuilt = asyncio.run(calendar_rollup.rebuild())
+    print(f"Rebuilt calendar rollup for {rebuilt} day(s).")
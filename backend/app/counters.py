@@ -0,0 +1,109 @@
+# backend/app/counters.py
+from collections import defaultdict
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+
+from .models import Application, ApplicationStatusEnum, Schedule
+
+# 상태별로 (pending_applicants, active_applicants, current_applicants) 에 기여하는 값
+STATUS_CONTRIBUTION = {
+    ApplicationStatusEnum.pending: (1, 1, 0),
+    ApplicationStatusEnum.approved: (0, 1, 1),
+    ApplicationStatusEnum.rejected: (0, 0, 0),
+}
+
+
+def counter_deltas(old_status, new_status) -> tuple:
+    """신청서 상태 변경(None = 생성/삭제) 시 스케줄 카운터 증감값"""
+    old = STATUS_CONTRIBUTION[old_status] if old_status is not None else (0, 0, 0)
+    new = STATUS_CONTRIBUTION[new_status] if new_status is not None else (0, 0, 0)
+    return tuple(n - o for n, o in zip(new, old))
+
+
+def counter_update(schedule_id: int, old_status, new_status):
+    """SET x = x + delta 형태의 UPDATE ... RETURNING id (다른 트랜잭션의 증감과 덮어쓰지 않음)
+
+    자리를 새로 차지하는 전이(rejected -> pending/approved)와 승인은 reserve_seat 처럼 정원이 남아 있을
+    때만 적용된다 - 반환 행이 없으면 정원 초과.
+    """
+    return apply_counter_deltas(schedule_id, *counter_deltas(old_status, new_status))
+
+
+def apply_counter_deltas(schedule_id: int, pending: int, active: int, current: int):
+    """스케줄 하나에 합산된 증감값을 조건부 UPDATE 한 번으로 적용 (RETURNING id 가 없으면 정원 초과)"""
+    schedules = Schedule.__table__
+    stmt = update(schedules).where(schedules.c.id == schedule_id)
+    if active > 0:
+        stmt = stmt.where(schedules.c.active_applicants + active <= schedules.c.capacity)
+    if current > 0:  # 정원을 줄여 active 가 정원을 넘은 스케줄에서도 승인 인원은 정원 이하로
+        stmt = stmt.where(func.coalesce(schedules.c.current_applicants, 0) + current <= schedules.c.capacity)
+    return stmt.values(
+        pending_applicants=schedules.c.pending_applicants + pending,
+        active_applicants=schedules.c.active_applicants + active,
+        current_applicants=schedules.c.current_applicants + current,
+    ).returning(schedules.c.id)
+
+
+def reserve_seat(schedule_id: int):
+    """정원이 남아 있을 때만 pending 자리 하나를 잡는 조건부 UPDATE (행 잠금은 커밋까지만)"""
+    schedules = Schedule.__table__
+    return update(schedules).where(
+        schedules.c.id == schedule_id,
+        schedules.c.active_applicants < schedules.c.capacity,
+    ).values(
+        pending_applicants=schedules.c.pending_applicants + 1,
+        active_applicants=schedules.c.active_applicants + 1,
+    ).returning(schedules.c.id)
+
+
+def counter_totals(transitions) -> dict:
+    """(schedule_id, old_status, new_status) 목록을 {schedule_id: (pending, active, current) 증감값} 으로 합산"""
+    totals = defaultdict(lambda: [0, 0, 0])
+    for schedule_id, old_status, new_status in transitions:
+        for i, delta in enumerate(counter_deltas(old_status, new_status)):
+            totals[schedule_id][i] += delta
+    return {schedule_id: tuple(total) for schedule_id, total in sorted(totals.items())}
+
+
+def _count_subquery(*statuses):
+    return select(func.count(Application.id)).where(
+        Application.schedule_id == Schedule.id,
+        Application.status.in_(statuses),
+    ).scalar_subquery()
+
+
+def reconcile_statement():
+    """카운터가 실제 신청서 수와 다른 스케줄만 한 번의 UPDATE로 바로잡는다."""
+    pending = _count_subquery(ApplicationStatusEnum.pending)
+    active = _count_subquery(ApplicationStatusEnum.pending, ApplicationStatusEnum.approved)
+    approved = _count_subquery(ApplicationStatusEnum.approved)
+    return update(Schedule).where(
+        or_(
+            Schedule.pending_applicants != pending,
+            Schedule.active_applicants != active,
+            func.coalesce(Schedule.current_applicants, 0) != approved,
+        )
+    ).values(
+        pending_applicants=pending,
+        active_applicants=active,
+        current_applicants=approved,
+    ).execution_options(synchronize_session=False)
+
+
+def reconcile_schedule_counters(db: Session) -> int:
+    """드리프트가 있던 스케줄 수를 반환"""
+    result = db.execute(reconcile_statement())
+    db.commit()
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        fixed = reconcile_schedule_counters(db)
+        print(f"Reconciled applicant counters on {fixed} schedule(s).")
+    finally:
+        db.close()
@@ -2,9 +2,11 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from . import models, security
 from .database import get_db
+from .user_cache import AuthenticatedUser, user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
@@ -14,29 +16,38 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     try:
         user_id = security.verify_token(token, credentials_exception)
     except JWTError:
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if user is None:
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    result = await db.execute(
+        select(models.User.id, models.User.status, models.User.role).where(models.User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
         raise credentials_exception
+    user = AuthenticatedUser(id=row.id, status=row.status, role=row.role)
+    user_cache.set(user)
     return user
 
-def get_current_active_user(current_user: models.User = Depends(get_current_user)):
+async def get_current_active_user(current_user: AuthenticatedUser = Depends(get_current_user)):
     if current_user.status != models.UserStatusEnum.approved:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User not approved")
     return current_user
 
-def get_current_admin_user(current_user: models.User = Depends(get_current_active_user)):
+async def get_current_admin_user(current_user: AuthenticatedUser = Depends(get_current_active_user)):
     allowed = [models.UserRoleEnum.admin, models.UserRoleEnum.super_admin]
     if current_user.role not in allowed:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requires admin privileges")
     return current_user
 
-def get_current_super_admin_user(current_user: models.User = Depends(get_current_active_user)):
+async def get_current_super_admin_user(current_user: AuthenticatedUser = Depends(get_current_active_user)):
     if current_user.role != models.UserRoleEnum.super_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requires super_admin privileges")
     return current_user
@@ -0,0 +1,86 @@
+# backend/app/hashing.py
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from . import metrics
+
+# 0 이면 프로세스 풀 대신 스레드풀에서 실행 (테스트/로컬 개발용)
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 2))
+# 실행 중인 작업 외에 추가로 대기시킬 수 있는 작업 수
+PASSWORD_HASH_QUEUE_SIZE = int(os.environ.get("PASSWORD_HASH_QUEUE_SIZE", 16))
+PASSWORD_HASH_RETRY_AFTER = int(os.environ.get("PASSWORD_HASH_RETRY_AFTER", 2))
+
+
+def _timed_call(func, *args):
+    """워커 프로세스에서 실행: (결과, 연산 시간) 반환"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHashPool:
+    """bcrypt 연산을 전용 프로세스 풀로 보내는 제한된 큐.
+
+    이벤트 루프에서만 사용하므로 카운터에 별도 락이 필요 없다.
+    """
+
+    def __init__(self, workers: int, queue_size: int, retry_after: int):
+        self.workers = workers
+        self.capacity = max(workers, 1) + queue_size
+        self.retry_after = retry_after
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+
+    @property
+    def depth(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 이벤트 루프/DB 커넥션을 가진 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def run(self, operation: str, func, *args):
+        if self._in_flight >= self.capacity:
+            metrics.PASSWORD_HASH_REJECTED.labels(operation).inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        self._in_flight += 1
+        metrics.PASSWORD_HASH_QUEUE_DEPTH.set(self._in_flight)
+        started = time.perf_counter()
+        try:
+            if self.workers > 0:
+                loop = asyncio.get_running_loop()
+                result, elapsed = await loop.run_in_executor(self._get_executor(), _timed_call, func, *args)
+            else:
+                result, elapsed = await run_in_threadpool(_timed_call, func, *args)
+        finally:
+            self._in_flight -= 1
+            metrics.PASSWORD_HASH_QUEUE_DEPTH.set(self._in_flight)
+
+        metrics.PASSWORD_HASH_SECONDS.labels(operation).observe(elapsed)
+        metrics.PASSWORD_HASH_WAIT_SECONDS.labels(operation).observe(time.perf_counter() - started)
+        return result
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hash_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_SIZE, PASSWORD_HASH_RETRY_AFTER)
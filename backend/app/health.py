@@ -0,0 +1,54 @@
+# backend/app/health.py
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from .database import async_engine
+
+READY_CACHE_TTL = float(os.environ.get("READY_CACHE_TTL", 5))
+READY_DB_TIMEOUT = float(os.environ.get("READY_DB_TIMEOUT", 2))
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessCheck:
+    """/ready 용 DB 연결 확인 - 결과를 ttl 초 동안 재사용한다.
+
+    프로브가 자주 호출되어도 DB에는 ttl 당 한 번만 SELECT 1 을 보내고,
+    동시에 들어온 요청은 진행 중인 확인 하나를 함께 기다린다.
+    """
+
+    def __init__(self, ttl: float, timeout: float):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def check(self) -> dict:
+        if self._result is not None and time.monotonic() - self._checked_at < self.ttl:
+            return self._result
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 갱신했을 수 있음
+            if self._result is not None and time.monotonic() - self._checked_at < self.ttl:
+                return self._result
+            self._result = await self._probe()
+            self._checked_at = time.monotonic()
+            return self._result
+
+    async def _probe(self) -> dict:
+        started = time.perf_counter()
+        try:
+            async with async_engine.connect() as conn:
+                await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Readiness check failed: {e!r}")
+            return {"status": "unavailable", "database": "error"}
+        return {"status": "ready", "database": "ok", "latency_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+readiness = ReadinessCheck(READY_CACHE_TTL, READY_DB_TIMEOUT)
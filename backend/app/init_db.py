@@ -3,8 +3,10 @@ from .database import SessionLocal, engine
 from .models import User, Base, UserRoleEnum, UserStatusEnum
 from .security import get_password_hash
 
-def init_database():
-    Base.metadata.create_all(bind=engine)
+def init_database(create_schema: bool = False):
+    """초기 관리자 계정 생성 (배포 시 1회 실행). create_schema 는 alembic 없이 쓰는 로컬 개발용."""
+    if create_schema:
+        Base.metadata.create_all(bind=engine)
     db = SessionLocal()
     try:
         # super_admin (supernova / kspo88!)
@@ -41,5 +43,14 @@ def init_database():
         db.close()
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="초기 관리자/최고관리자 계정 생성")
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="alembic 대신 metadata.create_all 로 테이블 생성 (로컬 개발/테스트 DB 전용)",
+    )
+    args = parser.parse_args()
     print("Initializing database and creating initial admin/superadmin...")
-    init_database()
+    init_database(create_schema=args.create_schema)
@@ -0,0 +1,108 @@
+# backend/app/instrumentation.py
+import time
+
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+
+from .database import async_engine
+from .metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """요청 처리 시간(라우트 템플릿/상태 코드별)과 처리 중 요청 수를 기록하는 순수 ASGI 미들웨어.
+
+    라벨 카디널리티를 막기 위해 실제 경로 대신 라우터가 scope 에 남긴 경로 템플릿을 쓴다.
+    """
+
+    def __init__(self, app, skip_paths=("/metrics",)):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # 응답 시작 전에 예외가 나면 500 으로 기록
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], route_label(scope), str(status_code)
+            ).observe(time.perf_counter() - started)
+
+
+def route_label(scope) -> str:
+    """요청이 매칭된 경로 템플릿 (예: /api/schedules/{schedule_id})
+
+    include_router(prefix=...) 로 붙은 라우트는 scope["route"].path 에 prefix 가 빠져 있을 수 있어,
+    실제 경로에서 템플릿이 매칭되는 지점 앞부분을 prefix 로 붙인다.
+    """
+    route = scope.get("route")
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is None:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    start = 0
+    while start != -1:
+        if path_regex.match(path[start:]):
+            return path[:start] + route.path
+        start = path.find("/", start + 1)
+    return route.path
+
+
+class RuntimeCollector:
+    """스크레이프 시점에 읽는 값 - 스레드풀 점유율, DB 커넥션 풀 상태"""
+
+    def collect(self):
+        yield from self._threadpool()
+        yield from self._db_pool()
+
+    @staticmethod
+    def _threadpool():
+        try:
+            from anyio.to_thread import current_default_thread_limiter
+            limiter = current_default_thread_limiter()  # 이벤트 루프 밖에서 호출되면 실패
+        except Exception:
+            return
+        in_use = GaugeMetricFamily("threadpool_in_use", "def 엔드포인트/run_in_threadpool 가 점유 중인 스레드 수")
+        in_use.add_metric([], limiter.borrowed_tokens)
+        limit = GaugeMetricFamily("threadpool_limit", "기본 스레드풀 최대 스레드 수")
+        limit.add_metric([], limiter.total_tokens)
+        yield in_use
+        yield limit
+
+    @staticmethod
+    def _db_pool():
+        pool = async_engine.pool
+        if not hasattr(pool, "checkedout"):  # 큐 풀이 아닌 경우 (메모리 SQLite 등)
+            return
+        for name, documentation, value in (
+            ("db_pool_size", "커넥션 풀 기본 크기 (pool_size)", pool.size()),
+            ("db_pool_checked_out", "사용 중(체크아웃)인 커넥션 수", pool.checkedout()),
+            ("db_pool_checked_in", "풀에서 쉬고 있는 커넥션 수", pool.checkedin()),
+            ("db_pool_overflow", "pool_size 를 넘어 추가로 연 커넥션 수 (음수면 아직 덜 채워진 것)", pool.overflow()),
+        ):
+            family = GaugeMetricFamily(name, documentation)
+            family.add_metric([], value)
+            yield family
+
+
+REGISTRY.register(RuntimeCollector())
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
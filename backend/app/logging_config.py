@@ -1,12 +1,138 @@
 # backend/app/renew-logging_config.py
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional
 
-def configure_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s"
-    )
+import orjson
+
+from .metrics import LOG_QUEUE_DEPTH, LOG_RECORDS_DROPPED
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")  # json | text
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))  # 넘치면 버리고 log_records_dropped_total 증가
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", "100"))  # 표준 출력에 한 번에 쓰는 최대 줄 수
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+# 요청 로그를 루트 로거와 같은 큐로 보낼 uvicorn 로거 (uvicorn 은 자체 핸들러를 달고 propagate=False)
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# LogRecord 기본 속성 - 이 밖의 속성(logger.info(..., extra={...}))만 JSON 필드로 출력
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName", "color_message"}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄짜리 JSON 로그 (CloudWatch Logs Insights 에서 필드로 바로 조회)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        return orjson.dumps(payload, default=str).decode()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """요청 경로에서는 레코드를 큐에 넣기만 한다. 큐가 가득 차면 기다리지 않고 버린다."""
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 prepare 는 여기서 format(트레이스백 포함)까지 하므로, 메시지 인자만 확정하고
+        # 포매팅은 리스너 스레드에 맡긴다.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """포매팅한 줄을 모아 두었다가 LOG_BATCH_SIZE 개마다(또는 큐가 비었을 때) 한 번에 쓴다."""
+
+    def __init__(self, stream=None, batch_size: int = LOG_BATCH_SIZE):
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self.buffer = []
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.buffer.append(self.format(record))
+            if len(self.buffer) >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                self.stream.write("\n".join(self.buffer) + "\n")
+                self.buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """큐를 비울 때마다 핸들러를 flush 해서, 바쁠 때는 묶어서 쓰고 한가할 때는 바로 내보낸다."""
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.dropped = 0  # 종료 신호 자리를 만들려고 버린 레코드 수
+
+    def dequeue(self, block: bool):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있으면 기다리지 않고 가장 오래된 레코드를 버려 종료 신호 자리를 만든다
+        while True:
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    continue  # 그 사이 리스너가 비웠으면 다시 넣어 본다
+                self.queue.task_done()
+                self.dropped += 1
+                LOG_RECORDS_DROPPED.inc()
+
+
+_listener: Optional[BatchingQueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def _output_handlers() -> list:
+    formatter = JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+    stream_handler = BatchStreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+    handlers = [stream_handler]
     try:
         import watchtower
         if os.environ.get("CLOUDWATCH_LOG_GROUP"):
@@ -17,7 +143,54 @@ def configure_logging():
                 create_log_group=True
             )
             cw_handler.setLevel(logging.INFO)
-            logging.getLogger().addHandler(cw_handler)
-            logging.getLogger(__name__).info("CloudWatch logging configured.")
+            cw_handler.setFormatter(formatter)
+            handlers.append(cw_handler)
     except Exception as e:
-        logging.getLogger(__name__).warning(f"CloudWatch logging not configured: {e}")
+        print(f"CloudWatch logging not configured: {e}", file=sys.stderr)
+    return handlers
+
+
+def _route_to(handlers: list):
+    root = logging.getLogger()
+    root.handlers = list(handlers)
+    root.setLevel(LOG_LEVEL)
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+
+def configure_logging():
+    """모든 로그를 제한된 큐 -> 백그라운드 리스너(JSON 포매팅, 묶음 출력, CloudWatch)로 보낸다. 여러 번 불러도 한 번만 설정."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    LOG_QUEUE_DEPTH.set_function(log_queue.qsize)
+    _listener = BatchingQueueListener(log_queue, *_output_handlers(), respect_handler_level=True)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _route_to([_queue_handler])
+    _listener.start()
+    logging.getLogger(__name__).info(
+        f"Logging configured (format={LOG_FORMAT}, queue={LOG_QUEUE_SIZE}, handlers={len(_listener.handlers)})"
+    )
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 출력하고 리스너를 멈춘다. 이후 로그는 핸들러로 직접 출력."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    started = time.perf_counter()
+    listener.stop()  # 종료 신호 전까지 큐에 쌓인 레코드를 모두 처리
+    for handler in listener.handlers:
+        handler.flush()
+        if isinstance(handler, BatchStreamHandler):
+            handler.batch_size = 1  # 이후에는 바로 쓴다 (uvicorn 은 종료 직후 시그널로 프로세스를 끝냄)
+    _route_to(listener.handlers)
+    logging.getLogger(__name__).info(
+        f"Log queue drained in {(time.perf_counter() - started) * 1000:.0f}ms "
+        f"({_queue_handler.dropped + listener.dropped} records dropped since start, "
+        f"{listener.dropped} to make room for shutdown)"
+    )
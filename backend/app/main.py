@@ -1,19 +1,41 @@
 # backend/app/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .database import engine, Base, SessionLocal
-from . import models
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from .admission import ADMISSION_ENABLED, AdmissionMiddleware, pool_timeout_handler
+from .health import readiness
+from .instrumentation import MetricsMiddleware, metrics_response
+from .logging_config import configure_logging, shutdown_logging
+from .query_stats import QueryStatsMiddleware
+from .read_routing import PRIMARY_HEADER, ReadYourWritesMiddleware
+from .hashing import hash_pool
+from . import security
+from .calendar_rollup import calendar_rollup
+from .retention import schedule_retention
+from .schedule_events import schedule_events
+from .view_counter import notice_views
 from .routers import auth, admin, schedules, applications, mypage, notices
 import asyncio
-from datetime import datetime, timedelta
 import logging
 import os
 
-# DB 테이블 생성
-models.Base.metadata.create_all(bind=engine)
+# 스키마는 alembic upgrade head, 초기 관리자 계정은 python -m app.init_db 로 배포 단계에서 만든다.
+# (import/startup 에서 DB 작업을 하지 않아 콜드 스타트 후 첫 응답이 빨라짐)
 
 app = FastAPI(title="서울올림픽파크텔 인력 관리 시스템 API")
 
+# 워커당 동시에 DB 를 쓰는 요청 수 제한 - 넘치면 우선순위 대기열, 대기 시간 초과 시 503 (가장 안쪽)
+if ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+# 요청 지연/처리 중 요청 수 (Prometheus, /metrics)
+app.add_middleware(MetricsMiddleware)
+# 요청별 SQL 문 수/DB 시간 (X-DB-Query-Count, X-DB-Time-Ms) 및 슬로 쿼리 로그
+app.add_middleware(QueryStatsMiddleware)
+# 복제본 사용 시 쓰기 직후 클라이언트의 조회를 주 DB 로 고정 (REPLICA_DATABASE_URL)
+app.add_middleware(ReadYourWritesMiddleware)
+
 # CORS 설정
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 
@@ -23,6 +45,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After", "X-Next-Cursor", "X-DB-Query-Count", "X-DB-Time-Ms", PRIMARY_HEADER],
 )
 
 # 🔧 [수정 핵심] prefix 중복 제거
@@ -46,40 +69,40 @@ def api_root():
     return {"message": "Parktel Schedule API", "status": "running"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
+    """liveness - 프로세스가 응답하는지만 확인 (DB 접근 없음)"""
     return {"status": "healthy"}
 
-# 백그라운드: 45일 지난 스케줄 삭제
-async def cleanup_old_schedules_periodic():
-    while True:
-        db = SessionLocal()
-        try:
-            cutoff = datetime.utcnow() - timedelta(days=45)
-            old_schedules = db.query(models.Schedule).filter(models.Schedule.work_date < cutoff).all()
-            if old_schedules:
-                logging.info(f"Cleaning up {len(old_schedules)} old schedules (older than 45 days)")
-                for s in old_schedules:
-                    db.delete(s)
-                db.commit()
-        except Exception as e:
-            logging.error(f"Error during cleanup_old_schedules: {e}")
-            db.rollback()
-        finally:
-            db.close()
-        await asyncio.sleep(24 * 3600)
+@app.get("/ready")
+async def readiness_check():
+    """readiness - DB 연결 확인 (READY_CACHE_TTL 초 동안 결과 재사용)"""
+    result = await readiness.check()
+    return JSONResponse(result, status_code=200 if result["status"] == "ready" else 503)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭 (요청 지연, 스레드풀, DB 커넥션 풀, bcrypt 큐 등)"""
+    return metrics_response()
 
 @app.on_event("startup")
 async def startup_event():
     """앱 시작 시 초기화"""
+    configure_logging()  # 로그는 큐로만 넣고 출력은 백그라운드 스레드에서
     logging.info("Starting Parktel Schedule API...")
-    
-    # 초기 관리자 계정 생성
+
+    # 백그라운드 작업 시작
+    asyncio.create_task(schedule_retention.run_periodic())  # 보존 기간 지난 스케줄 정리 (RETENTION_DAYS)
+    asyncio.create_task(notice_views.run_periodic())
+    asyncio.create_task(schedule_events.run())  # /api/schedules/stream 자리 현황 이벤트 발행
+    asyncio.create_task(calendar_rollup.run_periodic())  # /api/schedules/calendar 날짜별 집계 갱신
+    asyncio.create_task(security.publish_hash_time())  # 이 호스트의 bcrypt 해시 시간 게이지 (PASSWORD_HASH_PROBE_DELAY 후)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 아직 반영되지 않은 공지 조회수 저장
     try:
-        from .init_db import init_database
-        init_database()
-        logging.info("Database initialized successfully")
+        await notice_views.flush()
     except Exception as e:
-        logging.error(f"Database initialization failed: {e}")
-    
-    # 백그라운드 작업 시작
-    asyncio.create_task(cleanup_old_schedules_periodic())
+        logging.error(f"Failed to flush notice view counts on shutdown: {e}")
+    hash_pool.shutdown()
+    shutdown_logging()  # 마지막 - 위 종료 작업의 로그까지 내보낸다
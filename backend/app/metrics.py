@@ -0,0 +1,162 @@
+# backend/app/metrics.py
+from prometheus_client import Counter, Gauge, Histogram
+
+# --- 비밀번호 해시 (bcrypt 워커 풀) ---
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "bcrypt 작업 중 워커 풀에서 실행 중이거나 대기 중인 작업 수",
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "워커 프로세스 안에서 측정한 bcrypt 연산 시간",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "대기열 대기를 포함한 bcrypt 요청 전체 소요 시간",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "대기열이 가득 차서 503으로 거절된 bcrypt 요청 수",
+    ["operation"],
+)
+PASSWORD_HASH_ROUNDS = Gauge(
+    "password_hash_rounds",
+    "새 해시에 쓰는 bcrypt cost (BCRYPT_ROUNDS, BCRYPT_MIN_ROUNDS 이상)",
+)
+PASSWORD_HASH_MEASURED_SECONDS = Gauge(
+    "password_hash_measured_seconds",
+    "앱 시작 시 워커 프로세스에서 현재 cost 로 잰 해시 한 번의 시간",
+)
+PASSWORD_HASH_REHASHED = Counter(
+    "password_hash_rehashed_total",
+    "로그인 성공 시 현재 cost 로 다시 해시한 비밀번호 수",
+)
+
+# --- 로그인/가입/비밀번호 변경 한도 (app/rate_limit.py) ---
+RATE_LIMIT_REJECTED = Counter(
+    "rate_limit_rejected_total",
+    "한도를 넘어 429 로 거절된 요청 수 (limit: login_ip, login_account, register_ip, password_change_user)",
+    ["limit"],
+)
+RATE_LIMIT_BACKEND_ERRORS = Counter(
+    "rate_limit_backend_errors_total",
+    "공유 한도 저장소(Redis) 오류로 워커 메모리 버킷으로 대신 센 횟수",
+)
+
+# --- refresh token (app/refresh_tokens.py) ---
+AUTH_REFRESH = Counter(
+    "auth_refresh_total",
+    "POST /auth/refresh 결과 (rotated, grace: 동시 갱신 허용, reuse: 재사용 탐지로 폐기, revoked, expired, invalid)",
+    ["result"],
+)
+
+# --- 인증 사용자 캐시 ---
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total",
+    "get_current_user 캐시 조회 결과",
+    ["result"],
+)
+
+# --- 스케줄 보존 기간 정리 (app/retention.py) ---
+RETENTION_ROWS = Counter(
+    "retention_rows_total",
+    "보존 기간 정리로 삭제/보관된 행 수",
+    ["table", "action"],
+)
+RETENTION_BATCH_SECONDS = Histogram(
+    "retention_batch_seconds",
+    "보존 기간 정리 배치(한 트랜잭션) 소요 시간",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+RETENTION_PENDING_SCHEDULES = Gauge(
+    "retention_pending_schedules",
+    "이번 정리 실행에서 아직 삭제되지 않은 만료 스케줄 수",
+)
+RETENTION_LAST_RUN_TIMESTAMP = Gauge(
+    "retention_last_run_timestamp_seconds",
+    "마지막으로 정리를 끝까지 마친 시각 (unix time)",
+)
+
+# --- HTTP 요청 (app/instrumentation.py MetricsMiddleware) ---
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 요청 처리 시간 (route 는 경로 템플릿, 매칭 실패 시 unmatched)",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "현재 처리 중인 HTTP 요청 수",
+)
+
+# --- DB 커넥션 풀 (app/database.py InstrumentedAsyncPool) ---
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 기다린 시간 (새 연결 생성 포함)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "get_read_db 세션이 향한 DB (replica, 최근 쓰기로 고정된 primary) - 복제본 설정 시에만 기록",
+    ["target"],
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "DB_POOL_TIMEOUT 안에 커넥션을 얻지 못해 503 으로 응답한 요청 수",
+)
+
+# --- 동시 요청 제한 (app/admission.py) ---
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "슬롯을 얻어 처리 중인 DB 사용 요청 수 (ADMISSION_MAX_CONCURRENT 이하)",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "슬롯을 기다리는 요청 수",
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "슬롯을 얻거나 거절되기까지 기다린 시간",
+    ["priority"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "503 으로 거절된 요청 수 (queue_full: 대기열 가득, evicted: 더 급한 요청에 밀림, timeout: 대기 시간 초과)",
+    ["priority", "reason"],
+)
+
+# --- SQL (app/query_stats.py) ---
+SQL_SLOW_QUERIES = Counter(
+    "sql_slow_queries_total",
+    "SLOW_QUERY_MS 이상 걸린 SQL 문 수",
+    ["route"],
+)
+
+# --- 로깅 (app/logging_config.py) ---
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "로그 큐가 가득 차서 버려진 로그 레코드 수",
+)
+LOG_QUEUE_DEPTH = Gauge(
+    "log_queue_depth",
+    "백그라운드 리스너가 아직 출력하지 않은 로그 레코드 수",
+)
+
+# --- 스케줄 자리 현황 SSE (app/schedule_events.py) ---
+SSE_CLIENTS = Gauge(
+    "sse_clients",
+    "이 워커에 연결된 /schedules/stream 구독자 수",
+)
+SSE_CLIENTS_DROPPED = Counter(
+    "sse_clients_dropped_total",
+    "이벤트 큐가 가득 차서(느린 소비자) 끊은 구독자 수",
+)
+SSE_EVENTS_PUBLISHED = Counter(
+    "sse_events_published_total",
+    "구독자에게 나눠 준 자리 현황 이벤트(델타 묶음) 수",
+)
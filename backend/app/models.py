@@ -1,10 +1,16 @@
 # backend/app/models.py
 import enum
 import re
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, Boolean, func
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Date, DateTime, Boolean, Index, UniqueConstraint, false, func
 from sqlalchemy.orm import relationship, validates
 from .database import Base
 
+def utcnow():
+    # created_at 은 커서 키로 쓰이므로 DB 종류와 무관하게 같은 정밀도로 저장되도록 앱에서 채운다
+    # (SQLite CURRENT_TIMESTAMP 는 마이크로초가 없어 커서 비교가 어긋남)
+    return datetime.now(timezone.utc)
+
 # --- UserRole / UserStatus ---
 class UserRoleEnum(str, enum.Enum):
     user = "user"
@@ -27,10 +33,16 @@ class User(Base):
     role = Column(Enum(UserRoleEnum), default=UserRoleEnum.user)
     status = Column(Enum(UserStatusEnum), default=UserStatusEnum.pending)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
 
     applications = relationship("Application", back_populates="user", cascade="all, delete-orphan")
 
+    # 커서 페이지네이션 키 (created_at, id) / 승인 대기 목록 (status)
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_status", "status"),
+    )
+
     @validates('phone_number')
     def validate_phone_number(self, key, phone_number):
         if not re.match(r'^\d{10,11}$', phone_number):
@@ -53,10 +65,18 @@ class Schedule(Base):
     work_date = Column(DateTime(timezone=True), nullable=False)
 
     capacity = Column(Integer, default=1)
-    current_applicants = Column(Integer, default=0)
+    # 신청서 상태별 카운터 - 신청/취소/상태변경 트랜잭션 안에서 함께 갱신 (app/counters.py)
+    current_applicants = Column(Integer, default=0)  # approved
+    pending_applicants = Column(Integer, nullable=False, default=0, server_default="0")  # pending
+    active_applicants = Column(Integer, nullable=False, default=0, server_default="0")  # pending + approved
 
     applications = relationship("Application", back_populates="schedule", cascade="all, delete-orphan")
 
+    # 커서 페이지네이션 키 (work_date, id)
+    __table_args__ = (
+        Index("ix_schedules_work_date_id", "work_date", "id"),
+    )
+
     @validates('start_time_str', 'end_time_str')
     def validate_time_format(self, key, time_str):
         if not re.match(r'^\d{2}:\d{2}$', time_str):
@@ -77,13 +97,21 @@ class Application(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     schedule_id = Column(Integer, ForeignKey("schedules.id", ondelete="CASCADE"))
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
 
     status = Column(Enum(ApplicationStatusEnum), default=ApplicationStatusEnum.pending)
 
     user = relationship("User", back_populates="applications")
     schedule = relationship("Schedule", back_populates="applications")
 
+    # 한 사용자는 스케줄당 한 번만 신청 (신청 시 ON CONFLICT DO NOTHING 으로 중복 판정)
+    # 스케줄별 신청자/승인자 목록 (schedule_id, status, created_at), 내 신청 목록 (user_id, created_at)
+    __table_args__ = (
+        UniqueConstraint("user_id", "schedule_id", name="uq_applications_user_schedule"),
+        Index("ix_applications_schedule_id_status_created_at", "schedule_id", "status", "created_at"),
+        Index("ix_applications_user_id_created_at", "user_id", "created_at"),
+    )
+
 # --- Notice ---
 class Notice(Base):
     __tablename__ = "notices"
@@ -91,6 +119,65 @@ class Notice(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     content = Column(String(4000), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     view_count = Column(Integer, default=0)
-    is_pinned = Column(Boolean, default=False)
+    is_pinned = Column(Boolean, nullable=False, default=False, server_default=false())
+
+    # 커서 페이지네이션 키 (is_pinned, created_at, id) - 모두 내림차순으로 사용
+    __table_args__ = (
+        Index("ix_notices_pinned_created_at_id", "is_pinned", "created_at", "id"),
+    )
+
+# --- 날짜별 자리 현황 집계 (app/calendar_rollup.py) ---
+# /schedules/calendar 가 스케줄/신청서를 훑지 않고 기본 키(day) 범위만 읽도록 쓰기 후 해당 날짜 행을 다시 계산해 둔다.
+class ScheduleDailyStats(Base):
+    __tablename__ = "schedule_daily_stats"
+
+    day = Column(Date, primary_key=True)  # work_date 의 UTC 날짜
+    shift_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_capacity = Column(Integer, nullable=False, default=0, server_default="0")
+    approved = Column(Integer, nullable=False, default=0, server_default="0")  # current_applicants 합
+    pending = Column(Integer, nullable=False, default=0, server_default="0")  # pending_applicants 합
+    active = Column(Integer, nullable=False, default=0, server_default="0")  # active_applicants 합 (남은 자리 = total_capacity - active)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+
+# --- 로그인 세션(refresh token 계열) - app/refresh_tokens.py ---
+# 로그인 한 번이 계열 하나. 토큰은 (id, generation) 의 HMAC 서명이라 저장하지 않고,
+# 갱신할 때마다 generation 을 올려 이전 토큰을 무효화한다 (이전 토큰이 다시 오면 재사용으로 보고 계열 폐기).
+class RefreshTokenFamily(Base):
+    __tablename__ = "refresh_token_families"
+
+    id = Column(String(32), primary_key=True)  # 무작위 hex
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    generation = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), default=utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_reason = Column(String(20), nullable=True)  # logout / reuse / password_change
+
+# --- 보존 기간이 지난 스케줄/신청서 보관용 (app/retention.py) ---
+# 급여 정산 이력 확인용으로 필요한 컬럼만 남긴 축약 사본. 원본 id 는 일반 컬럼으로 보관한다.
+class ScheduleArchive(Base):
+    __tablename__ = "schedules_archive"
+
+    id = Column(Integer, primary_key=True)
+    schedule_id = Column(Integer, nullable=False, index=True)
+    title = Column(String(100), nullable=False)
+    work_date = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_time_str = Column(String(5), nullable=False)
+    end_time_str = Column(String(5), nullable=False)
+    capacity = Column(Integer)
+    current_applicants = Column(Integer)
+    archived_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+
+class ApplicationArchive(Base):
+    __tablename__ = "applications_archive"
+
+    id = Column(Integer, primary_key=True)
+    application_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, index=True)
+    schedule_id = Column(Integer, index=True)
+    status = Column(Enum(ApplicationStatusEnum))
+    created_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
@@ -0,0 +1,69 @@
+# backend/app/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Boolean, DateTime, Integer, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Keyset:
+    """(정렬 컬럼..., id) 기준 커서 페이지네이션.
+
+    커서는 마지막 행의 정렬 키 값을 JSON -> base64url 로 인코딩한 불투명 문자열이다.
+    모든 컬럼은 같은 방향으로 정렬되어야 행 값 비교(tuple > tuple)가 인덱스를 탈 수 있다.
+    """
+
+    def __init__(self, *columns, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self):
+        return [col.desc() if self.descending else col.asc() for col in self.columns]
+
+    def apply(self, stmt, cursor: Optional[str]):
+        stmt = stmt.order_by(*self.order_by())
+        if cursor:
+            values = self.decode(cursor)
+            if self.descending:
+                stmt = stmt.where(tuple_(*self.columns) < tuple_(*values))
+            else:
+                stmt = stmt.where(tuple_(*self.columns) > tuple_(*values))
+        return stmt
+
+    def encode(self, row) -> str:
+        values = []
+        for col in self.columns:
+            value = getattr(row, col.key)
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("cursor length mismatch")
+            return [self._coerce(col, value) for col, value in zip(self.columns, values)]
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @staticmethod
+    def _coerce(col, value):
+        if isinstance(col.type, DateTime):
+            return datetime.fromisoformat(value)
+        if isinstance(col.type, Boolean):
+            return bool(value)
+        if isinstance(col.type, Integer):
+            return int(value)
+        return value
+
+    def next_cursor(self, rows: Sequence, limit: int) -> Optional[str]:
+        """페이지가 가득 찼을 때만 다음 커서를 돌려준다."""
+        if limit <= 0 or len(rows) < limit:
+            return None
+        return self.encode(rows[-1])
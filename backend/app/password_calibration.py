@@ -0,0 +1,84 @@
+# backend/app/password_calibration.py
+"""bcrypt cost 보정 - 이 호스트에서 해시 한 번이 목표 시간 안에 끝나는 가장 큰 rounds 를 고른다
+
+    cd backend && python -m app.password_calibration                      # 결과만 출력
+    cd backend && python -m app.password_calibration --write-env .env     # 로컬 .env 에 기록
+
+앱 시작 때마다 돌리지 않는다 (콜드 스타트가 수 초 늘어난다). 인스턴스 종류를 바꿀 때 배포 대상과 같은
+인스턴스(Render Shell 등)에서 한 번 실행하고, 출력된 BCRYPT_ROUNDS 를 render.yaml 환경 변수에 적는다.
+
+BCRYPT_MIN_ROUNDS 부터 한 단계씩 올리며 (rounds 가 1 늘면 시간은 두 배) 잰 시간의 중앙값이
+--target-ms 를 넘기 직전 값을 고른다. 가장 낮은 cost 도 목표를 넘으면 BCRYPT_MIN_ROUNDS 를 쓴다
+(보안 하한). --write-env 는 그 파일의 BCRYPT_ROUNDS 줄을 바꾸거나 추가한다 - app/database.py 의
+load_dotenv() 가 읽으며, 이미 설정된 환경 변수 BCRYPT_ROUNDS 가 있으면 그쪽이 우선이다.
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import List, Tuple
+
+from passlib.hash import bcrypt
+
+from .security import BCRYPT_MIN_ROUNDS
+
+BCRYPT_TARGET_MS = float(os.environ.get("BCRYPT_TARGET_MS", 100))
+BCRYPT_MAX_ROUNDS = 16  # 이 이상은 로그인 한 번에 수 초 - 보정 결과로 고르지 않는다
+
+
+def measure(rounds: int, samples: int) -> float:
+    """해당 cost 로 해시 한 번에 드는 시간 (초, 중앙값)"""
+    handler = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash("calibration")
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def calibrate(target: float, samples: int = 3) -> Tuple[int, List[Tuple[int, float]]]:
+    """(고른 rounds, [(rounds, 잰 시간)])"""
+    rounds = BCRYPT_MIN_ROUNDS
+    measured = [(rounds, measure(rounds, samples))]
+    # 다음 단계의 예상 시간(두 배)이 목표 안일 때만 재 본다
+    while rounds < BCRYPT_MAX_ROUNDS and measured[-1][1] * 2 <= target:
+        seconds = measure(rounds + 1, samples)
+        measured.append((rounds + 1, seconds))
+        if seconds > target:
+            break
+        rounds += 1
+    return rounds, measured
+
+
+def write_env(path: str, key: str, value: str):
+    """KEY=value 줄을 바꾸거나 파일 끝에 추가"""
+    lines = []
+    if os.path.exists(path):
+        with open(path) as f:
+            lines = [line for line in f.read().splitlines() if not line.startswith(f"{key}=")]
+    lines.append(f"{key}={value}")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main(target_ms: float, samples: int, env_path: str = None):
+    rounds, measured = calibrate(target_ms / 1000, samples)
+    print(f"target={target_ms:.0f}ms min_rounds={BCRYPT_MIN_ROUNDS} samples={samples}")
+    for cost, seconds in measured:
+        print(f"  rounds={cost:<3} {seconds * 1000:>8.1f}ms{'  <- selected' if cost == rounds else ''}")
+    if measured[0][1] > target_ms / 1000:
+        print(f"  (rounds={BCRYPT_MIN_ROUNDS} 도 목표를 넘지만 하한이므로 그대로 사용)")
+    print(f"BCRYPT_ROUNDS={rounds}")
+    if env_path:
+        write_env(env_path, "BCRYPT_ROUNDS", str(rounds))
+        print(f"written to {env_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=BCRYPT_TARGET_MS, help="해시 한 번의 목표 시간 (기본 BCRYPT_TARGET_MS)")
+    parser.add_argument("--samples", type=int, default=3, help="rounds 마다 잴 횟수")
+    parser.add_argument("--write-env", metavar="PATH", help="BCRYPT_ROUNDS 를 기록할 .env 파일")
+    args = parser.parse_args()
+    main(args.target_ms, args.samples, args.write_env)
@@ -0,0 +1,108 @@
+# backend/app/projection.py
+from typing import Dict, List, Optional, get_args
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, literal, select
+
+from . import models, schemas
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 TypeAdapter 검증 + 직렬화로 대체
+    orjson = None
+
+
+class Projection:
+    """응답 스키마 필드에 해당하는 컬럼만 SELECT 하고, 결과 행을 바로 JSON 으로 직렬화한다.
+
+    ORM 엔티티와 Pydantic 모델 인스턴스를 만들지 않는다. 중첩 스키마는 같은 이름의 relationship 을
+    LEFT OUTER JOIN 해서 "<관계>__<필드>" 라벨로 가져온다 (예: Projection(Application, models.Application,
+    schedule=(Schedule, models.Schedule))).
+
+    orjson 경로는 스키마 검증을 거치지 않으므로, 스키마에서 None 을 허용하지 않는 필드가 nullable 컬럼이면
+    SELECT 에서 컬럼 기본값으로 COALESCE 한다 (예: schedules.current_applicants).
+    omit 에 준 필드는 조회하지 않고 스키마 기본값으로 채운다.
+    """
+
+    def __init__(self, schema, model, omit=(), **nested):
+        self.model = model
+        self.fields = list(schema.model_fields)
+        self.nested = {}
+        self.defaults = {name: schema.model_fields[name].get_default() for name in omit}
+        self.columns = [
+            column(schema, model, name).label(name)
+            for name in self.fields if name not in nested and name not in self.defaults
+        ]
+        for key, (nested_schema, nested_model) in nested.items():
+            pairs = [(name, f"{key}__{name}") for name in nested_schema.model_fields]
+            self.columns += [column(nested_schema, nested_model, name).label(label) for name, label in pairs]
+            self.nested[key] = pairs
+        self.list_adapter = TypeAdapter(List[schema])
+        self.item_adapter = TypeAdapter(schema)
+
+    def select(self):
+        stmt = select(*self.columns).select_from(self.model)
+        for key in self.nested:
+            stmt = stmt.outerjoin(getattr(self.model, key))
+        return stmt
+
+    def to_dict(self, row) -> dict:
+        mapping = row._mapping
+        data = {}
+        for name in self.fields:
+            pairs = self.nested.get(name)
+            if name in self.defaults:
+                data[name] = self.defaults[name]
+            elif pairs is None:
+                data[name] = mapping[name]
+            elif mapping[f"{name}__id"] is None:  # 조인 대상 없음
+                data[name] = None
+            else:
+                data[name] = {field: mapping[label] for field, label in pairs}
+        return data
+
+    def dump_list(self, items: List[dict]) -> bytes:
+        return dump_json(items, self.list_adapter)
+
+    def dump_item(self, item: dict) -> bytes:
+        return dump_json(item, self.item_adapter)
+
+
+def column(schema, model, name):
+    """name 컬럼. None 을 허용하지 않는 필드인데 컬럼이 nullable 이면 COALESCE(컬럼, 기본값)"""
+    attr = getattr(model, name)
+    col = attr.property.columns[0]
+    default = col.default.arg if col.default is not None and col.default.is_scalar else None
+    if not col.nullable or default is None or type(None) in get_args(schema.model_fields[name].annotation):
+        return attr
+    return func.coalesce(attr, literal(default, col.type))
+
+
+def dump_json(data, adapter: TypeAdapter) -> bytes:
+    """dict/list 를 JSON 바이트로. orjson 이 없으면 adapter 로 검증 후 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z)
+    return adapter.dump_json(adapter.validate_python(data))
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """이미 직렬화된 본문을 그대로 반환 (response_model 재검증을 건너뜀)"""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# 스케줄별 신청자 목록 - 신청서(+스케줄, 사용자)
+application_projection = Projection(
+    schemas.Application,
+    models.Application,
+    schedule=(schemas.Schedule, models.Schedule),
+    user=(schemas.User, models.User),
+)
+
+# 내 신청 목록 - 신청서(+스케줄). 본인 신청만 보므로 사용자는 조인하지 않는다 (user 는 null)
+my_application_projection = Projection(
+    schemas.Application,
+    models.Application,
+    omit=("user",),
+    schedule=(schemas.Schedule, models.Schedule),
+)
@@ -0,0 +1,159 @@
+# backend/app/query_stats.py
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from .database import async_engine, replica_engine
+from .instrumentation import route_label
+from .metrics import SQL_SLOW_QUERIES
+
+# 이 시간(ms) 이상 걸린 문장은 파라미터를 가린 채 WARNING 으로 남긴다
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "200"))
+# 문장 끝에 /* route=... */ 주석을 붙여 pg_stat_activity / 슬로 쿼리 로그에서 호출한 라우트를 보이게 한다
+SQL_ROUTE_COMMENT = os.environ.get("SQL_ROUTE_COMMENT", "true").lower() == "true"
+# 응답에 X-DB-Query-Count / X-DB-Time-Ms 헤더 추가
+QUERY_STATS_HEADERS = os.environ.get("QUERY_STATS_HEADERS", "true").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+NO_ROUTE = "-"
+
+
+class QueryStats:
+    """한 요청(또는 count_queries 블록)에서 실행된 SQL 문 수와 DB 시간"""
+
+    __slots__ = ("scope", "parent", "count", "seconds", "statements", "_route")
+
+    def __init__(self, scope=None, parent: Optional["QueryStats"] = None, record: bool = False):
+        self.scope = scope
+        self.parent = parent  # 바깥 블록(count_queries 안에서 요청을 보낸 경우)에도 합산
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = [] if record else None
+        self._route = None
+
+    @property
+    def route(self) -> str:
+        # 라우팅이 끝나야 scope["route"] 가 생기므로, 찾은 뒤에만 캐시
+        if self._route is None:
+            if self.scope is None or "route" not in self.scope:
+                return self.parent.route if self.parent else NO_ROUTE
+            self._route = f"{self.scope['method']} {route_label(self.scope)}"
+        return self._route
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def redact(parameters, executemany: bool):
+    """로그용 파라미터 - 값은 숨기고 타입만 남긴다 (전화번호, 해시 등 노출 방지)"""
+    if executemany:
+        return f"<{len(parameters)} rows>"
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _route_comment(route: str) -> str:
+    # 주석 탈출과 paramstyle 충돌(%, ?) 방지
+    return " /* route=" + route.replace("*/", "").replace("%", "").replace("?", "") + " */"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+    if SQL_ROUTE_COMMENT:
+        stats = _current_stats.get()
+        if stats is not None and stats.route != NO_ROUTE:
+            statement += _route_comment(stats.route)
+    return statement, parameters
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats = _current_stats.get()
+    node = stats
+    while node is not None:
+        node.count += 1
+        node.seconds += elapsed
+        if node.statements is not None:
+            node.statements.append(statement)
+        node = node.parent
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        route = stats.route if stats is not None else NO_ROUTE
+        SQL_SLOW_QUERIES.labels(route).inc()
+        logger.warning(
+            "Slow query %.1fms route=%s: %s params=%s",
+            elapsed * 1000, route, " ".join(statement.split())[:1000], redact(parameters, executemany),
+        )
+
+
+# 주 DB 와 복제본(설정 시) 쿼리를 함께 센다
+for _engine in (async_engine, replica_engine):
+    if _engine is not None:
+        event.listen(_engine.sync_engine, "before_cursor_execute", _before_cursor_execute, retval=True)
+        event.listen(_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """요청마다 QueryStats 를 열고, 응답 헤더에 쿼리 수와 DB 시간을 싣는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope, parent=_current_stats.get())
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and QUERY_STATS_HEADERS:
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Query-Count", str(stats.count))
+                headers.append("X-DB-Time-Ms", f"{stats.seconds * 1000:.1f}")
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 문을 센다 (httpx.ASGITransport 로 앱을 직접 호출하는 경우 포함)
+
+        with count_queries() as stats:
+            await client.get("/api/mypage/my-applications")
+        print(stats.count, stats.statements)
+    """
+    stats = QueryStats(parent=_current_stats.get(), record=True)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int, label: str = "block"):
+    """블록 안 SQL 문이 limit 개를 넘으면 AssertionError (N+1 회귀를 CI 에서 잡기 위한 헬퍼)"""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        statements = "\n".join(f"  {i}. {' '.join(s.split())[:300]}" for i, s in enumerate(stats.statements, 1))
+        raise AssertionError(f"{label}: {stats.count} queries (max {limit})\n{statements}")
@@ -0,0 +1,188 @@
+# backend/app/rate_limit.py
+import ipaddress
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from .metrics import RATE_LIMIT_BACKEND_ERRORS, RATE_LIMIT_REJECTED
+
+# memory: 워커 프로세스마다 따로 센다 (워커 N 개면 실제 한도는 최대 N 배)
+# redis : RATE_LIMIT_REDIS_URL 의 Redis 에서 모든 워커가 함께 센다 (redis 패키지 필요)
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_REDIS_URL = os.environ.get("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "1") != "0"
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS", 100_000))  # memory 백엔드가 기억할 키 수 (LRU)
+
+# 요청을 넘겨주는 리버스 프록시 주소 (쉼표로 구분한 IP/CIDR, 예: Render "10.0.0.0/8").
+# 직접 연결한 상대가 여기에 속할 때만 X-Forwarded-For 를 읽는다 - 비워 두면 연결 주소를 그대로 쓴다.
+RATE_LIMIT_TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(cidr.strip(), strict=False)
+    for cidr in os.environ.get("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")
+    if cidr.strip()
+)
+
+RATE_LIMITED_DETAIL = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit(NamedTuple):
+    """토큰 버킷 한도 - 최대 burst 번까지 연속 허용, period 초마다 burst 개가 다시 찬다"""
+
+    name: str
+    burst: int
+    period: float
+
+    @classmethod
+    def from_env(cls, name: str, default: str) -> "RateLimit":
+        """환경 변수 RATE_LIMIT_<NAME> = "횟수/초" (예: "10/300")"""
+        burst, period = os.environ.get(f"RATE_LIMIT_{name.upper()}", default).split("/")
+        return cls(name, int(burst), float(period))
+
+
+# 같은 IP(사무실 NAT 뒤의 여러 직원 포함)에서 오는 로그인, 계정 하나에 대한 비밀번호 추측, 가입/비밀번호 변경 남용
+LOGIN_IP = RateLimit.from_env("login_ip", "60/60")
+LOGIN_ACCOUNT = RateLimit.from_env("login_account", "10/300")
+REGISTER_IP = RateLimit.from_env("register_ip", "20/3600")
+PASSWORD_CHANGE_USER = RateLimit.from_env("password_change_user", "5/300")
+
+
+class MemoryBackend:
+    """프로세스 안의 토큰 버킷 저장소 - 키마다 (남은 토큰, 마지막 갱신 시각) 만 둔다.
+
+    시간이 지난 만큼 토큰을 채워 계산하므로 고정 구간 경계에서 두 배가 허용되는 문제 없이
+    슬라이딩 윈도와 같은 효과를 낸다. 이벤트 루프에서만 사용하므로 락이 필요 없다.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        return self.hit_now(key, limit)
+
+    def hit_now(self, key: str, limit: RateLimit) -> float:
+        """토큰 하나를 쓴다. 허용이면 0, 거절이면 다음 토큰까지 남은 초"""
+        now = time.monotonic()
+        rate = limit.burst / limit.period
+        bucket = self._buckets.pop(key, None)
+        tokens = limit.burst if bucket is None else min(limit.burst, bucket[0] + (now - bucket[1]) * rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)  # 가장 최근 사용으로 이동
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+# KEYS[1] 버킷, ARGV = burst, period, now(unix time). 반환값은 소수라 문자열로 (Redis 가 정수로 자름)
+TOKEN_BUCKET_SCRIPT = """
+local burst = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local rate = burst / period
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(period))
+return tostring(retry_after)
+"""
+
+
+class RedisBackend:
+    """여러 워커/인스턴스가 함께 쓰는 토큰 버킷 - 스크립트 한 번(왕복 한 번)으로 읽고 갱신한다"""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis.asyncio  # redis 백엔드에서만 필요
+
+        self.prefix = prefix
+        self._client = redis.asyncio.from_url(url)
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        result = await self._script(keys=[self.prefix + key], args=[limit.burst, limit.period, time.time()])
+        return float(result)
+
+
+class RateLimiter:
+    """로그인/가입/비밀번호 변경 라우트 앞에서 호출하는 한도 검사.
+
+    DB 조회나 bcrypt 전에 호출해 거절되는 요청이 비싼 작업을 하지 않게 한다. 공유 백엔드가
+    응답하지 않으면 이 워커의 메모리 버킷으로 대신 센다 (한도 검사 때문에 로그인이 막히지 않도록).
+    """
+
+    def __init__(self, backend, enabled: bool = True, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.backend = backend
+        self.enabled = enabled
+        self._fallback = backend if isinstance(backend, MemoryBackend) else MemoryBackend(max_keys)
+
+    async def check(self, *limits: Tuple[RateLimit, Optional[str]]):
+        """(한도, 키) 를 순서대로 검사해 하나라도 넘으면 429. 키가 비어 있으면 건너뛴다."""
+        if not self.enabled:
+            return
+        for limit, key in limits:
+            if not key:
+                continue
+            bucket = f"{limit.name}:{key}"
+            try:
+                retry_after = await self.backend.hit(bucket, limit)
+            except Exception as e:
+                RATE_LIMIT_BACKEND_ERRORS.inc()
+                logger.warning(f"Rate limit backend failed, using in-process buckets: {e!r}")
+                retry_after = self._fallback.hit_now(bucket, limit)
+            if retry_after > 0:
+                RATE_LIMIT_REJECTED.labels(limit.name).inc()
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=RATE_LIMITED_DETAIL,
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in RATE_LIMIT_TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """IP별 한도의 키로 쓸 요청 IP.
+
+    X-Forwarded-For 는 왼쪽 값을 클라이언트가 마음대로 채울 수 있으므로, 신뢰하는 프록시를 거쳐 온
+    요청에서만 오른쪽부터 읽어 신뢰하는 프록시가 아닌 첫 주소(프록시가 직접 본 상대)를 쓴다.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+    hops = [hop.strip() for hop in ",".join(request.headers.getlist("x-forwarded-for")).split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+def _create_backend():
+    if RATE_LIMIT_BACKEND == "redis":
+        return RedisBackend(RATE_LIMIT_REDIS_URL)
+    return MemoryBackend(RATE_LIMIT_MAX_KEYS)
+
+
+rate_limiter = RateLimiter(_create_backend(), RATE_LIMIT_ENABLED)
@@ -0,0 +1,81 @@
+# backend/app/read_routing.py
+import hashlib
+import hmac
+import math
+import os
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+
+from .database import replica_engine
+from .security import SECRET_KEY
+
+# 쓰기 후 이 시간(초) 동안은 같은 클라이언트의 조회를 주 DB 로 보낸다 (복제 지연보다 넉넉하게)
+READ_YOUR_WRITES_SECONDS = int(os.environ.get("READ_YOUR_WRITES_SECONDS", 5))
+PRIMARY_COOKIE = "primary_until"
+PRIMARY_HEADER = "X-Primary-Until"  # 쿠키를 못 쓰는 교차 출처 SPA 는 응답 헤더 값을 그대로 다시 보낸다
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def sign_primary_until(expires: int) -> str:
+    """'만료 unix time.서명' - 클라이언트가 기간을 늘려 주 DB 를 계속 쓰지 못하도록 서명한다"""
+    mac = hmac.new(SECRET_KEY.encode(), f"{PRIMARY_COOKIE}:{expires}".encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{mac[:32]}"
+
+
+def is_pinned(token: Optional[str], now: Optional[float] = None) -> bool:
+    """서명이 맞고 아직 만료되지 않은 토큰인지"""
+    if not token:
+        return False
+    expires = token.partition(".")[0]
+    if not expires.isdigit():
+        return False
+    if not hmac.compare_digest(token, sign_primary_until(int(expires))):
+        return False
+    return int(expires) > (time.time() if now is None else now)
+
+
+class ReadYourWritesMiddleware:
+    """복제본 사용 시 자기 쓰기를 바로 읽을 수 있게 하는 순수 ASGI 미들웨어.
+
+    성공한 쓰기(POST/PUT/PATCH/DELETE, 4xx/5xx 제외) 응답에 서명된 primary_until 쿠키와
+    X-Primary-Until 헤더를 싣고, 둘 중 하나가 유효한 요청은 request.state.read_primary 를 켜서
+    get_read_db 와 응답 캐시가 주 DB 를 쓰게 한다. 복제본이 없으면 아무 일도 하지 않는다.
+    """
+
+    def __init__(self, app, window: int = READ_YOUR_WRITES_SECONDS):
+        self.app = app
+        self.window = window
+        self.enabled = replica_engine is not None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        token = headers.get(PRIMARY_HEADER)
+        if token is None and "cookie" in headers:
+            token = cookie_parser(headers["cookie"]).get(PRIMARY_COOKIE)
+        if is_pinned(token):
+            scope.setdefault("state", {})["read_primary"] = True
+
+        if scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                token = sign_primary_until(math.ceil(time.time()) + self.window)
+                response_headers = MutableHeaders(scope=message)
+                response_headers.append(PRIMARY_HEADER, token)
+                response_headers.append(
+                    "Set-Cookie",
+                    f"{PRIMARY_COOKIE}={token}; Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
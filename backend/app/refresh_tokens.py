@@ -0,0 +1,127 @@
+# backend/app/refresh_tokens.py
+import logging
+import os
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import security
+from .metrics import AUTH_REFRESH
+from .models import RefreshTokenFamily
+
+# 여러 탭이 같은 refresh token 으로 동시에 갱신한 경우 - 이 시간(초) 안에 바로 이전 세대가 오면
+# 재사용으로 보지 않고 현재 세대 토큰을 다시 준다
+REFRESH_REUSE_GRACE = float(os.environ.get("REFRESH_REUSE_GRACE", 10))
+
+refresh_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="다시 로그인해 주세요.",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite 는 tz 없이 UTC 로 저장된 값을 돌려준다
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+async def issue(db: AsyncSession, user_id: int) -> str:
+    """로그인 성공 시 새 계열을 만들고 첫 refresh token 을 반환 (커밋 포함)"""
+    now = datetime.now(timezone.utc)
+    # 만료된 이 사용자의 계열 정리 (user_id 인덱스, 로그인 때만)
+    await db.execute(delete(RefreshTokenFamily).where(
+        RefreshTokenFamily.user_id == user_id, RefreshTokenFamily.expires_at < now,
+    ))
+    family = RefreshTokenFamily(
+        id=secrets.token_hex(16),
+        user_id=user_id,
+        generation=0,
+        created_at=now,
+        last_used_at=now,
+        expires_at=now + timedelta(days=security.REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    db.add(family)
+    await db.commit()
+    return security.create_refresh_token(family.id, 0)
+
+
+async def rotate(db: AsyncSession, token: str) -> Tuple[int, str]:
+    """refresh token 을 한 번 쓰고 다음 세대 토큰으로 교체 - (user_id, 새 refresh token).
+
+    정상 경로는 HMAC 확인 + 기본 키 조건 UPDATE ... RETURNING 한 번. 세대가 맞지 않으면
+    (이미 쓴 토큰이 다시 옴 = 탈취 가능성) 계열 전체를 폐기하고 401.
+    """
+    parsed = security.parse_refresh_token(token)
+    if parsed is None:
+        AUTH_REFRESH.labels("invalid").inc()
+        raise refresh_exception
+    family_id, generation = parsed
+    now = datetime.now(timezone.utc)
+
+    row = (await db.execute(
+        update(RefreshTokenFamily)
+        .where(
+            RefreshTokenFamily.id == family_id,
+            RefreshTokenFamily.generation == generation,
+            RefreshTokenFamily.revoked_at.is_(None),
+            RefreshTokenFamily.expires_at > now,
+        )
+        .values(generation=generation + 1, last_used_at=now)
+        .returning(RefreshTokenFamily.user_id)
+    )).first()
+    if row is not None:
+        await db.commit()
+        AUTH_REFRESH.labels("rotated").inc()
+        return row.user_id, security.create_refresh_token(family_id, generation + 1)
+
+    family = await db.get(RefreshTokenFamily, family_id)
+    if family is None:
+        AUTH_REFRESH.labels("invalid").inc()
+        raise refresh_exception
+    if family.revoked_at is not None:
+        AUTH_REFRESH.labels("revoked").inc()
+        raise refresh_exception
+    if _utc(family.expires_at) <= now:
+        AUTH_REFRESH.labels("expired").inc()
+        raise refresh_exception
+    if (
+        generation == family.generation - 1
+        and (now - _utc(family.last_used_at)).total_seconds() <= REFRESH_REUSE_GRACE
+    ):
+        AUTH_REFRESH.labels("grace").inc()
+        return family.user_id, security.create_refresh_token(family_id, family.generation)
+
+    family.revoked_at = now
+    family.revoked_reason = "reuse"
+    await db.commit()
+    AUTH_REFRESH.labels("reuse").inc()
+    logger.warning(f"Refresh token reuse detected, revoked family of user {family.user_id}")
+    raise refresh_exception
+
+
+async def revoke(db: AsyncSession, token: str):
+    """로그아웃 - 이 refresh token 의 계열만 폐기 (서명이 틀리면 무시, 커밋 포함)"""
+    parsed = security.parse_refresh_token(token)
+    if parsed is None:
+        return
+    await db.execute(
+        update(RefreshTokenFamily)
+        .where(RefreshTokenFamily.id == parsed[0], RefreshTokenFamily.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc), revoked_reason="logout")
+    )
+    await db.commit()
+
+
+async def revoke_user(db: AsyncSession, user_id: int, reason: str):
+    """사용자의 모든 계열 폐기 (비밀번호 변경 등). 커밋은 호출한 쪽에서"""
+    await db.execute(
+        update(RefreshTokenFamily)
+        .where(RefreshTokenFamily.user_id == user_id, RefreshTokenFamily.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc), revoked_reason=reason)
+    )
@@ -0,0 +1,135 @@
+# backend/app/retention.py
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select
+
+from .cache import schedule_cache
+from .calendar_rollup import calendar_rollup
+from .database import AsyncSessionLocal
+from .metrics import (
+    RETENTION_BATCH_SECONDS,
+    RETENTION_LAST_RUN_TIMESTAMP,
+    RETENTION_PENDING_SCHEDULES,
+    RETENTION_ROWS,
+)
+from .models import Application, ApplicationArchive, Schedule, ScheduleArchive
+
+RETENTION_DAYS = int(os.environ.get("RETENTION_DAYS", 45))
+RETENTION_BATCH_SIZE = int(os.environ.get("RETENTION_BATCH_SIZE", 500))
+RETENTION_ARCHIVE = os.environ.get("RETENTION_ARCHIVE", "true").lower() in ("1", "true", "yes")
+RETENTION_INTERVAL = float(os.environ.get("RETENTION_INTERVAL", 24 * 3600))
+# 배치 사이 휴식 - 큰 백로그를 지울 때도 다른 요청이 DB 커넥션을 쓸 수 있도록
+RETENTION_BATCH_PAUSE = float(os.environ.get("RETENTION_BATCH_PAUSE", 0.05))
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleRetention:
+    """work_date 가 보존 기간을 지난 스케줄(과 신청서)을 배치 단위로 정리한다.
+
+    배치마다 id 를 batch_size 개만 잠그고, 보관 테이블 복사 -> 신청서 삭제 -> 스케줄 삭제를
+    짧은 트랜잭션 하나로 처리한다. 비동기 세션을 쓰므로 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, days: int, batch_size: int, archive: bool, interval: float, pause: float):
+        self.days = days
+        self.batch_size = batch_size
+        self.archive = archive
+        self.interval = interval
+        self.pause = pause
+
+    def cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=self.days)
+
+    async def run_once(self) -> int:
+        """만료 스케줄을 모두 지울 때까지 배치를 반복하고, 삭제한 스케줄 수를 반환"""
+        cutoff = self.cutoff()
+        async with AsyncSessionLocal() as db:
+            remaining = await db.scalar(select(func.count(Schedule.id)).where(Schedule.work_date < cutoff))
+        RETENTION_PENDING_SCHEDULES.set(remaining)
+        if remaining:
+            logger.info(f"Cleaning up {remaining} schedules older than {self.days} days (archive={self.archive})")
+
+        total = 0
+        while True:
+            deleted = await self._delete_batch(cutoff)
+            if not deleted:
+                break
+            total += deleted
+            RETENTION_PENDING_SCHEDULES.dec(deleted)
+            schedule_cache.bump()
+            await asyncio.sleep(self.pause)
+
+        RETENTION_PENDING_SCHEDULES.set(0)
+        RETENTION_LAST_RUN_TIMESTAMP.set(time.time())
+        if total:
+            await calendar_rollup.prune_before(cutoff)  # 지운 날짜의 달력 집계도 정리
+            logger.info(f"Removed {total} old schedules")
+        return total
+
+    async def _delete_batch(self, cutoff: datetime) -> int:
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            # 여러 워커가 동시에 돌아도 서로 다른 배치를 가져가도록 SKIP LOCKED (SQLite 는 무시)
+            ids = (await db.execute(
+                select(Schedule.id).where(Schedule.work_date < cutoff)
+                .order_by(Schedule.id).limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )).scalars().all()
+            if not ids:
+                return 0
+
+            if self.archive:
+                archived = await db.execute(insert(ScheduleArchive).from_select(
+                    ["schedule_id", "title", "work_date", "start_time_str", "end_time_str", "capacity", "current_applicants"],
+                    select(
+                        Schedule.id, Schedule.title, Schedule.work_date, Schedule.start_time_str,
+                        Schedule.end_time_str, Schedule.capacity, Schedule.current_applicants,
+                    ).where(Schedule.id.in_(ids)),
+                ))
+                RETENTION_ROWS.labels("schedules", "archived").inc(archived.rowcount)
+                archived = await db.execute(insert(ApplicationArchive).from_select(
+                    ["application_id", "user_id", "schedule_id", "status", "created_at"],
+                    select(
+                        Application.id, Application.user_id, Application.schedule_id,
+                        Application.status, Application.created_at,
+                    ).where(Application.schedule_id.in_(ids)),
+                ))
+                RETENTION_ROWS.labels("applications", "archived").inc(archived.rowcount)
+
+            # 신청서를 먼저 명시적으로 지운다 (FK CASCADE 를 강제하지 않는 SQLite 대비)
+            removed = await db.execute(
+                delete(Application).where(Application.schedule_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            RETENTION_ROWS.labels("applications", "deleted").inc(removed.rowcount)
+            removed = await db.execute(
+                delete(Schedule).where(Schedule.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            RETENTION_ROWS.labels("schedules", "deleted").inc(removed.rowcount)
+            await db.commit()
+        RETENTION_BATCH_SECONDS.observe(time.perf_counter() - started)
+        return removed.rowcount
+
+    async def run_periodic(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Error during schedule retention: {e}")
+            await asyncio.sleep(self.interval)
+
+
+schedule_retention = ScheduleRetention(
+    RETENTION_DAYS, RETENTION_BATCH_SIZE, RETENTION_ARCHIVE, RETENTION_INTERVAL, RETENTION_BATCH_PAUSE
+)
+
+
+if __name__ == "__main__":
+    removed = asyncio.run(schedule_retention.run_once())
+    print(f"Removed {removed} schedule(s) older than {RETENTION_DAYS} days.")
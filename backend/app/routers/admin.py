@@ -1,93 +1,151 @@
 # backend/app/routers/renew-admin.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional
 
 from .. import models, schemas, security
+from ..cache import schedule_cache
+from ..calendar_rollup import calendar_rollup
+from ..counters import apply_counter_deltas, counter_deltas, counter_totals, counter_update
 from ..database import get_db
 from ..dependencies import get_current_admin_user, get_current_super_admin_user
+from ..user_cache import AuthenticatedUser, user_cache
+from ..pagination import NEXT_CURSOR_HEADER, Keyset
+from ..projection import Projection, json_response
+from ..schedule_events import schedule_events
 
 router = APIRouter(
     prefix="/admin",
     tags=["admin"],
 )
 
+user_keyset = Keyset(models.User.created_at, models.User.id)
+user_projection = Projection(schemas.User, models.User)  # hashed_password 는 조회하지 않음
+
 @router.get("/users", response_model=List[schemas.User])
-def get_all_users(
-    skip: int = 0, 
-    limit: int = 100, 
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+async def get_all_users(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    users = db.query(models.User).offset(skip).limit(limit).all()
-    return users
+    """(Admin+) 전체 사용자 (created_at, id) 순. cursor 미지정 시 skip/limit 호환"""
+    stmt = user_keyset.apply(user_projection.select(), cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    rows = (await db.execute(stmt.limit(limit))).all()
+
+    headers = {}
+    next_cursor = user_keyset.next_cursor(rows, limit)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return json_response(user_projection.dump_list([user_projection.to_dict(row) for row in rows]), headers)
 
 @router.get("/pending-users", response_model=List[schemas.User])
-def get_pending_users(
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+async def get_pending_users(
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    users = db.query(models.User).filter(models.User.status == models.UserStatusEnum.pending).all()
-    return users
+    result = await db.execute(select(models.User).where(models.User.status == models.UserStatusEnum.pending))
+    return result.scalars().all()
 
 @router.post("/approve-user", response_model=schemas.User)
-def approve_user(
+async def approve_user(
     approval: schemas.UserApproval,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    user = db.query(models.User).filter(models.User.id == approval.user_id).first()
+    user = await db.get(models.User, approval.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     user.status = approval.status
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    user_cache.invalidate(user.id)
+    await db.refresh(user)
     return user
 
+@router.post("/approve-users", response_model=schemas.BulkResult)
+async def approve_users_bulk(
+    approval: schemas.UserBulkApproval,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
+):
+    """(Admin+) 여러 사용자 상태 일괄 변경 - 단일 UPDATE, 항목별 결과 반환"""
+    user_ids = list(dict.fromkeys(approval.user_ids))
+    result = await db.execute(
+        update(models.User).where(
+            models.User.id.in_(user_ids)
+        ).values(
+            status=approval.status
+        ).returning(models.User.id).execution_options(synchronize_session=False)
+    )
+    updated = set(result.scalars().all())
+    await db.commit()
+
+    for user_id in updated:
+        user_cache.invalidate(user_id)
+
+    return schemas.BulkResult(
+        updated=len(updated),
+        results=[
+            schemas.BulkItemResult(id=user_id, ok=True) if user_id in updated
+            else schemas.BulkItemResult(id=user_id, ok=False, detail="User not found")
+            for user_id in user_ids
+        ],
+    )
+
 @router.post("/grant-admin", response_model=schemas.User)
-def grant_admin_privilege(
+async def grant_admin_privilege(
     grant_data: schemas.GrantAdmin,
-    db: Session = Depends(get_db),
-    current_super_admin: models.User = Depends(get_current_super_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_super_admin: AuthenticatedUser = Depends(get_current_super_admin_user)
 ):
-    user = db.query(models.User).filter(models.User.id == grant_data.user_id).first()
+    user = await db.get(models.User, grant_data.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    existing_admin = db.query(models.User).filter(models.User.username == grant_data.username).first()
+    existing_admin = (await db.execute(
+        select(models.User).where(models.User.username == grant_data.username)
+    )).scalar_one_or_none()
     if existing_admin and existing_admin.id != user.id:
         raise HTTPException(status_code=400, detail="Username already taken")
 
     user.role = models.UserRoleEnum.admin
     user.username = grant_data.username
-    user.hashed_password = security.get_password_hash("banquet88!")
+    user.hashed_password = await security.get_password_hash_async("banquet88!")
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    user_cache.invalidate(user.id)
+    await db.refresh(user)
     return user
 
 @router.post("/applications/update-status", response_model=schemas.Application)
-def update_application_status(
+async def update_application_status(
     approval: schemas.ApplicationApproval,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
     try:
-        application = db.query(models.Application).filter(
-            models.Application.id == approval.application_id
-        ).options(
-            joinedload(models.Application.schedule)
-        ).first()
+        application = (await db.execute(
+            select(models.Application).where(
+                models.Application.id == approval.application_id
+            ).options(
+                joinedload(models.Application.schedule),
+                joinedload(models.Application.user)
+            )
+        )).scalar_one_or_none()
 
         if not application:
             raise HTTPException(status_code=404, detail="Application not found")
 
-        schedule = application.schedule 
-        db.refresh(schedule)
-
+        schedule = application.schedule
         if not schedule:
              raise HTTPException(status_code=404, detail="Schedule not found")
 
@@ -97,29 +155,147 @@ def update_application_status(
         if original_status == new_status:
             return application
 
-        if new_status == models.ApplicationStatusEnum.approved:
-            if schedule.current_applicants >= schedule.capacity:
-                raise HTTPException(status_code=400, detail="정원이 초과되었습니다.")
-            schedule.current_applicants += 1
-            application.status = new_status
-
-        elif original_status == models.ApplicationStatusEnum.approved and new_status != models.ApplicationStatusEnum.approved:
-            if schedule.current_applicants > 0:
-                schedule.current_applicants -= 1
-            application.status = new_status
+        # 읽은 뒤 다른 요청이 상태를 바꿨다면 0 행 - 잘못된 전이로 카운터를 고치지 않는다
+        changed = (await db.execute(
+            update(models.Application).where(
+                models.Application.id == application.id,
+                models.Application.status == original_status,
+            ).values(status=new_status).returning(models.Application.id).execution_options(synchronize_session=False)
+        )).first()
+        if changed is None:
+            raise HTTPException(status_code=409, detail="다른 요청이 먼저 상태를 변경했습니다. 다시 시도해주세요.")
 
-        else:
-            application.status = new_status
+        # pending/active/current 카운터를 상태 전이에 맞춰 함께 갱신 - 자리를 새로 차지하는 전이
+        # (rejected -> approved 등)는 신청과 같은 조건부 UPDATE 라 정원이 없으면 반환 행이 없다
+        if (await db.execute(counter_update(schedule.id, original_status, new_status))).first() is None:
+            raise HTTPException(status_code=400, detail="정원이 초과되었습니다.")
 
-        db.add(application)
-        db.add(schedule)
-        db.commit()
-        db.refresh(application)
+        await db.commit()
+        application.status = new_status
+        schedule_cache.bump()
+        schedule_events.changed(schedule.id)
+        calendar_rollup.touch_schedules(schedule.id)
+        await db.refresh(schedule)
         return application
 
-    except HTTPException:
-        db.rollback()
+    except (HTTPException, PoolTimeoutError):  # 풀 대기 시간 초과는 503 (app/admission.py pool_timeout_handler)
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+
+
+@router.post("/applications/update-status-bulk", response_model=schemas.BulkResult)
+async def update_application_status_bulk(
+    approval: schemas.ApplicationBulkApproval,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
+):
+    """(Admin+) 여러 신청서 상태 일괄 변경
+
+    관련 신청서 -> 스케줄 순으로, 각각 id 순서로 잠가 교착을 피한다 (단건 변경/취소와 같은 순서).
+    정원은 스케줄별로 신청 시간순으로 남은 자리(capacity - active_applicants, 승인은
+    capacity - current_applicants 도)를 차감하며 판정한다 - pending 신청서는 이미 active 에 자리가
+    잡혀 있으므로 자리를 새로 차지하는 것은 rejected 에서 바뀌는 신청서뿐이다. 판정 결과는 스케줄마다
+    조건부 UPDATE 한 번으로 적용하고, 정원을 넘는 신청서는 실패로 표시되며 나머지는 반영된다.
+    """
+    application_ids = list(dict.fromkeys(approval.application_ids))
+    new_status = approval.new_status
+    try:
+        await db.execute(
+            select(models.Application.id).where(
+                models.Application.id.in_(application_ids)
+            ).order_by(models.Application.id).with_for_update()
+        )
+        schedule_ids = (await db.scalars(
+            select(models.Application.schedule_id).where(
+                models.Application.id.in_(application_ids)
+            ).distinct()
+        )).all()
+        await db.execute(
+            select(models.Schedule.id).where(
+                models.Schedule.id.in_(schedule_ids)
+            ).order_by(models.Schedule.id).with_for_update()
+        )
+
+        rows = (await db.execute(
+            select(
+                models.Application.id,
+                models.Application.schedule_id,
+                models.Application.status,
+                models.Schedule.capacity,
+                models.Schedule.active_applicants,
+                func.coalesce(models.Schedule.current_applicants, 0).label("current_applicants"),
+            ).join(
+                models.Schedule, models.Schedule.id == models.Application.schedule_id
+            ).where(
+                models.Application.id.in_(application_ids)
+            ).order_by(models.Application.created_at, models.Application.id)
+        )).all()
+
+        found = {row.id: row for row in rows}
+        results = {}
+        accepted = {}  # schedule_id -> [(신청서 id, 이전 상태)]
+        free = {}  # schedule_id -> [남은 자리, 남은 승인 자리]
+        for row in rows:
+            if row.status == new_status:
+                results[row.id] = schemas.BulkItemResult(id=row.id, ok=True, detail="unchanged")
+                continue
+            seats = free.setdefault(row.schedule_id, [
+                row.capacity - row.active_applicants, row.capacity - row.current_applicants,
+            ])
+            _, active, current = counter_deltas(row.status, new_status)
+            if (active > 0 and seats[0] < active) or (current > 0 and seats[1] < current):
+                results[row.id] = schemas.BulkItemResult(id=row.id, ok=False, detail="정원이 초과되었습니다.")
+                continue
+            seats[0] -= active
+            seats[1] -= current
+            results[row.id] = schemas.BulkItemResult(id=row.id, ok=True)
+            accepted.setdefault(row.schedule_id, []).append((row.id, row.status))
+
+        changed_ids = []
+        for schedule_id, items in accepted.items():
+            totals = counter_totals((schedule_id, old_status, new_status) for _, old_status in items)
+            if (await db.execute(apply_counter_deltas(schedule_id, *totals[schedule_id]))).first() is None:
+                # 판정 뒤 다른 요청이 자리를 가져갔다 - 이 스케줄의 변경은 적용하지 않는다
+                for app_id, _ in items:
+                    results[app_id] = schemas.BulkItemResult(id=app_id, ok=False, detail="정원이 초과되었습니다.")
+                continue
+            changed_ids += [app_id for app_id, _ in items]
+
+        if changed_ids:
+            expected = {app_id: old_status for items in accepted.values() for app_id, old_status in items}
+            for old_status in set(expected.values()):
+                ids = [app_id for app_id in changed_ids if expected[app_id] == old_status]
+                updated = (await db.execute(
+                    update(models.Application).where(
+                        models.Application.id.in_(ids),
+                        models.Application.status == old_status,
+                    ).values(status=new_status).returning(models.Application.id).execution_options(synchronize_session=False)
+                )).all()
+                if len(updated) != len(ids):
+                    # 읽은 뒤 다른 요청이 상태를 바꿨다 - 카운터가 어긋나지 않도록 전체를 되돌린다
+                    raise HTTPException(status_code=409, detail="다른 요청이 먼저 상태를 변경했습니다. 다시 시도해주세요.")
+        await db.commit()
+        if changed_ids:
+            schedule_cache.bump()
+            changed_schedules = {found[app_id].schedule_id for app_id in changed_ids}
+            schedule_events.changed(*changed_schedules)
+            calendar_rollup.touch_schedules(*changed_schedules)
+
+        return schemas.BulkResult(
+            updated=len(changed_ids),
+            results=[
+                results[app_id] if app_id in found
+                else schemas.BulkItemResult(id=app_id, ok=False, detail="Application not found")
+                for app_id in application_ids
+            ],
+        )
+
+    except (HTTPException, PoolTimeoutError):
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
@@ -1,111 +1,158 @@
 # backend/app/routers/applications.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, delete, literal, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List
 
 from .. import models, schemas
-from ..database import get_db
+from ..cache import schedule_cache
+from ..calendar_rollup import calendar_rollup
+from ..counters import counter_update, reserve_seat
+from ..database import async_engine, get_db, get_read_db
 from ..dependencies import get_current_active_user, get_current_admin_user
+from ..projection import application_projection, json_response
+from ..schedule_events import schedule_events
+from ..user_cache import AuthenticatedUser
 
 router = APIRouter(
     prefix="/applications",
     tags=["applications"],
 )
 
+def _insert_application(user_id: int, schedule_id):
+    """INSERT ... SELECT ... ON CONFLICT (user_id, schedule_id) DO NOTHING RETURNING id
+
+    schedule_id 는 값 또는 CTE 컬럼(자리 확보 UPDATE 의 RETURNING)
+    """
+    insert = pg_insert if async_engine.dialect.name == "postgresql" else sqlite_insert
+    table = models.Application.__table__
+    if not isinstance(schedule_id, ColumnElement):
+        schedule_id = literal(schedule_id, table.c.schedule_id.type)
+    source = select(
+        literal(user_id, table.c.user_id.type),
+        schedule_id,
+        literal(models.ApplicationStatusEnum.pending, table.c.status.type),
+        literal(models.utcnow(), table.c.created_at.type),
+    ).where(true())  # SQLite: INSERT ... SELECT ... ON CONFLICT 구문 모호성 회피
+    return insert(table).from_select(
+        ["user_id", "schedule_id", "status", "created_at"], source
+    ).on_conflict_do_nothing(
+        index_elements=["user_id", "schedule_id"]
+    ).returning(table.c.id)
+
+async def _reserve_and_insert(db: AsyncSession, user_id: int, schedule_id: int):
+    """자리 확보 + 신청서 생성. 성공 시 신청서 id, 실패(정원 초과/중복/없음) 시 None"""
+    if async_engine.dialect.name == "postgresql":
+        # WITH reserved AS (UPDATE schedules ... RETURNING id) INSERT ... SELECT FROM reserved
+        # 한 번의 왕복으로 처리. 중복이면 자리만 잡히므로 호출 측에서 롤백한다.
+        reserved = reserve_seat(schedule_id).cte("reserved")
+        stmt = _insert_application(user_id, reserved.c.id).add_cte(reserved)
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    if (await db.execute(reserve_seat(schedule_id))).first() is None:
+        return None
+    return (await db.execute(_insert_application(user_id, schedule_id))).scalar_one_or_none()
+
 @router.post("/", response_model=schemas.Application)
-def create_application(
+async def create_application(
     application: schemas.ApplicationCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
 ):
-    """(User) 스케줄 신청 - 동시성 제어 포함"""
+    """(User) 스케줄 신청 - 조건부 UPDATE 로 자리 확보, 유니크 제약으로 중복 방지"""
     try:
-        schedule = db.query(models.Schedule).filter(
-            models.Schedule.id == application.schedule_id
-        ).with_for_update().first()
-
-        if not schedule:
-            raise HTTPException(status_code=404, detail="Schedule not found")
-
-        # 중복 신청 확인
-        existing = db.query(models.Application).filter(
-            models.Application.user_id == current_user.id,
-            models.Application.schedule_id == application.schedule_id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="이미 신청한 스케줄입니다.")
-
-        # 정원 확인
-        active_count = db.query(models.Application).filter(
-            models.Application.schedule_id == application.schedule_id,
-            models.Application.status.in_([models.ApplicationStatusEnum.pending, models.ApplicationStatusEnum.approved])
-        ).count()
-
-        if active_count >= schedule.capacity:
+        new_app_id = await _reserve_and_insert(db, current_user.id, application.schedule_id)
+
+        if new_app_id is None:
+            # 실패 원인 판별 (자리 확보분은 롤백)
+            await db.rollback()
+            if await db.get(models.Schedule, application.schedule_id) is None:
+                raise HTTPException(status_code=404, detail="Schedule not found")
+            existing = (await db.execute(
+                select(models.Application.id).where(
+                    models.Application.user_id == current_user.id,
+                    models.Application.schedule_id == application.schedule_id
+                ).limit(1)
+            )).first()
+            if existing:
+                raise HTTPException(status_code=400, detail="이미 신청한 스케줄입니다.")
             raise HTTPException(status_code=400, detail="근무 인원이 초과되었습니다.")
 
-        # 신청서 생성
-        new_app = models.Application(
-            user_id=current_user.id,
-            schedule_id=application.schedule_id,
-            status=models.ApplicationStatusEnum.pending
-        )
-        db.add(new_app)
-        db.commit()
-        db.refresh(new_app)
+        await db.commit()
+        schedule_cache.bump()
+        schedule_events.changed(application.schedule_id)
+        calendar_rollup.touch_schedules(application.schedule_id)
 
-        return new_app
+        return await db.get(
+            models.Application,
+            new_app_id,
+            options=[joinedload(models.Application.schedule), joinedload(models.Application.user)],
+        )
 
-    except HTTPException:
+    except (HTTPException, PoolTimeoutError):  # 풀 대기 시간 초과는 503 (app/admission.py pool_timeout_handler)
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
-def cancel_application(
+async def cancel_application(
     application_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
 ):
     """(User) 본인의 신청 취소 - pending 상태만 가능"""
     try:
-        application = db.query(models.Application).filter(
-            models.Application.id == application_id
-        ).first()
-        
-        if not application:
-            raise HTTPException(status_code=404, detail="Application not found")
-        if application.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not authorized")
-        
-        # pending 상태만 취소 가능
-        if application.status != models.ApplicationStatusEnum.pending:
+        # 확인과 삭제를 한 문장으로 - 읽은 뒤 관리자가 상태를 바꿔도 실제로 지운 행의 상태로 카운터를 고친다
+        deleted = (await db.execute(
+            delete(models.Application).where(
+                models.Application.id == application_id,
+                models.Application.user_id == current_user.id,
+                models.Application.status == models.ApplicationStatusEnum.pending,
+            ).returning(models.Application.schedule_id, models.Application.status)
+        )).first()
+
+        if deleted is None:
+            # 실패 원인 판별
+            await db.rollback()
+            application = await db.get(models.Application, application_id)
+            if not application:
+                raise HTTPException(status_code=404, detail="Application not found")
+            if application.user_id != current_user.id:
+                raise HTTPException(status_code=403, detail="Not authorized")
             raise HTTPException(status_code=400, detail="승인된 신청은 취소할 수 없습니다.")
 
-        db.delete(application)
-        db.commit()
+        await db.execute(counter_update(deleted.schedule_id, deleted.status, None))
+        await db.commit()
+        schedule_cache.bump()
+        schedule_events.changed(deleted.schedule_id)
+        calendar_rollup.touch_schedules(deleted.schedule_id)
         return {"ok": True}
-    except HTTPException:
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
 @router.get("/schedule/{schedule_id}", response_model=List[schemas.Application])
-def get_applications_for_schedule(
+async def get_applications_for_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
     """(Admin+) 스케줄별 신청자 목록 (신청 시간순)"""
-    apps = db.query(models.Application).filter(
-        models.Application.schedule_id == schedule_id
-    ).options(
-        joinedload(models.Application.user)
-    ).order_by(
-        models.Application.created_at.asc()
-    ).all()
-    return apps
+    rows = (await db.execute(
+        application_projection.select().where(
+            models.Application.schedule_id == schedule_id
+        ).order_by(
+            models.Application.created_at.asc()
+        )
+    )).all()
+    return json_response(application_projection.dump_list([application_projection.to_dict(row) for row in rows]))
@@ -1,26 +1,44 @@
 # backend/app/routers/auth.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from .. import models, schemas, security
+from .. import models, refresh_tokens, schemas, security
 from ..database import get_db
 from ..dependencies import get_current_user
+from ..rate_limit import LOGIN_ACCOUNT, LOGIN_IP, PASSWORD_CHANGE_USER, REGISTER_IP, client_ip, rate_limiter
+from ..user_cache import AuthenticatedUser, user_cache
 
 router = APIRouter(
     prefix="/auth",
     tags=["auth"],
 )
 
+def _token_response(user_id: int, refresh_token: str) -> dict:
+    access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = security.create_access_token(
+        data={"id": user_id}, expires_delta=access_token_expires
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": int(access_token_expires.total_seconds()),
+    }
+
 @router.post("/register", response_model=schemas.User)
-def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: schemas.UserCreate, request: Request, db: AsyncSession = Depends(get_db)):
     """(User) 회원가입 신청. 상태 'pending', 비밀번호 'abcd1234' 고정"""
-    db_user = db.query(models.User).filter(models.User.phone_number == user.phone_number).first()
+    await rate_limiter.check((REGISTER_IP, client_ip(request)))
+    db_user = (await db.execute(
+        select(models.User).where(models.User.phone_number == user.phone_number)
+    )).scalar_one_or_none()
     if db_user:
         raise HTTPException(status_code=400, detail="이미 등록된 전화번호입니다.")
     
     initial_password = "abcd1234"
-    hashed_password = security.get_password_hash(initial_password)
+    hashed_password = await security.get_password_hash_async(initial_password)
     
     new_user = models.User(
         phone_number=user.phone_number,
@@ -29,51 +47,81 @@ def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
         role=models.UserRoleEnum.user
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 @router.post("/login", response_model=schemas.Token)
-def login_user(form_data: schemas.UserLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.phone_number == form_data.phone_number).first()
+async def login_user(form_data: schemas.UserLogin, request: Request, db: AsyncSession = Depends(get_db)):
+    # DB 조회/bcrypt 전에 IP, 전화번호별 한도 확인 (초과 시 429 + Retry-After)
+    await rate_limiter.check((LOGIN_IP, client_ip(request)), (LOGIN_ACCOUNT, form_data.phone_number))
+    user = (await db.execute(
+        select(models.User).where(models.User.phone_number == form_data.phone_number)
+    )).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-    if not security.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await security.verify_and_update_password_async(form_data.password, user.hashed_password)
+    if not verified:
         raise HTTPException(status_code=400, detail="비밀번호가 일치하지 않습니다.")
+    if new_hash:
+        user.hashed_password = new_hash  # cost 가 바뀐 해시 교체 - 아래 issue() 의 커밋에 함께 저장
     if user.status != models.UserStatusEnum.approved:
+        if new_hash:
+            await db.commit()  # 승인 전 사용자도 비밀번호는 맞았으므로 교체한 해시는 남긴다
         raise HTTPException(status_code=403, detail="관리자 승인이 필요합니다.")
 
-    access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = security.create_access_token(
-        data={"id": user.id}, expires_delta=access_token_expires
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _token_response(user.id, await refresh_tokens.issue(db, user.id))
 
 @router.post("/super-admin-login", response_model=schemas.Token)
-def login_admin(form_data: schemas.AdminLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.username == form_data.username).first()
+async def login_admin(form_data: schemas.AdminLogin, request: Request, db: AsyncSession = Depends(get_db)):
+    await rate_limiter.check((LOGIN_IP, client_ip(request)), (LOGIN_ACCOUNT, f"admin:{form_data.username}"))
+    user = (await db.execute(
+        select(models.User).where(models.User.username == form_data.username)
+    )).scalar_one_or_none()
     allowed_roles = [models.UserRoleEnum.admin, models.UserRoleEnum.super_admin]
     if not user or user.role not in allowed_roles:
         raise HTTPException(status_code=404, detail="관리자 계정을 찾을 수 없습니다.")
-    if not security.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await security.verify_and_update_password_async(form_data.password, user.hashed_password)
+    if not verified:
         raise HTTPException(status_code=400, detail="비밀번호가 일치하지 않습니다.")
+    if new_hash:
+        user.hashed_password = new_hash
 
-    access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = security.create_access_token(
-        data={"id": user.id}, expires_delta=access_token_expires
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _token_response(user.id, await refresh_tokens.issue(db, user.id))
+
+@router.post("/refresh", response_model=schemas.Token)
+async def refresh_access_token(payload: schemas.RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """access token 재발급 - bcrypt 없이 refresh token 서명 확인 + 계열 UPDATE 한 번.
+
+    refresh token 은 1회용으로 새 토큰으로 교체된다. 이미 쓴 토큰이 다시 오면 해당 로그인의
+    모든 토큰을 폐기하고 401 (다시 로그인).
+    """
+    user_id, refresh_token = await refresh_tokens.rotate(db, payload.refresh_token)
+    return _token_response(user_id, refresh_token)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: schemas.RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """이 로그인의 refresh token 폐기 (access token 은 만료까지 유효)"""
+    await refresh_tokens.revoke(db, payload.refresh_token)
 
 @router.put("/change-password")
-def change_password(
+async def change_password(
     password_data: schemas.PasswordChange,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    if not security.verify_password(password_data.old_password, current_user.hashed_password):
+    await rate_limiter.check((PASSWORD_CHANGE_USER, str(current_user.id)))
+    user = await db.get(models.User, current_user.id)
+    if not await security.verify_password_async(password_data.old_password, user.hashed_password):
         raise HTTPException(status_code=400, detail="기존 비밀번호가 일치하지 않습니다.")
 
-    current_user.hashed_password = security.get_password_hash(password_data.new_password)
-    db.add(current_user)
-    db.commit()
-    return {"message": "비밀번호가 성공적으로 변경되었습니다."}
+    user.hashed_password = await security.get_password_hash_async(password_data.new_password)
+    db.add(user)
+    # 다른 기기의 로그인은 모두 끊고, 요청한 클라이언트에는 새 토큰을 준다
+    await refresh_tokens.revoke_user(db, user.id, "password_change")
+    await db.commit()
+    user_cache.invalidate(user.id)
+    return {
+        "message": "비밀번호가 성공적으로 변경되었습니다.",
+        **_token_response(user.id, await refresh_tokens.issue(db, user.id)),
+    }
@@ -1,11 +1,15 @@
 # backend/app/routers/renew-mypage.py
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List
 
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..dependencies import get_current_active_user
+from ..projection import json_response, my_application_projection
+from ..user_cache import AuthenticatedUser
 
 router = APIRouter(
     prefix="/mypage",
@@ -13,36 +17,41 @@ router = APIRouter(
 )
 
 @router.get("/me", response_model=schemas.User)
-def get_my_info(current_user: models.User = Depends(get_current_active_user)):
-    return current_user
+async def get_my_info(
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
+):
+    return await db.get(models.User, current_user.id)
 
 @router.get("/my-applications", response_model=List[schemas.Application])
-def get_my_applications(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+async def get_my_applications(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
 ):
-    applications = db.query(models.Application).filter(
-        models.Application.user_id == current_user.id
-    ).options(
-        joinedload(models.Application.schedule)
-    ).order_by(
-        models.Application.created_at.desc()
-    ).all()
-
-    return applications
+    rows = (await db.execute(
+        my_application_projection.select().where(
+            models.Application.user_id == current_user.id
+        ).order_by(
+            models.Application.created_at.desc()
+        )
+    )).all()
+    return json_response(my_application_projection.dump_list([my_application_projection.to_dict(row) for row in rows]))
 
 @router.get("/schedule-approved/{schedule_id}")
-def get_approved_applicants_for_schedule(
+async def get_approved_applicants_for_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
 ):
-    approved_apps = db.query(models.Application).filter(
-        models.Application.schedule_id == schedule_id,
-        models.Application.status == models.ApplicationStatusEnum.approved
-    ).options(
-        joinedload(models.Application.user)
-    ).order_by(models.Application.created_at.asc()).all()
+    result = await db.execute(
+        select(models.Application).where(
+            models.Application.schedule_id == schedule_id,
+            models.Application.status == models.ApplicationStatusEnum.approved
+        ).options(
+            joinedload(models.Application.user)
+        ).order_by(models.Application.created_at.asc())
+    )
+    approved_apps = result.scalars().all()
 
     result = [{
         "application_id": app.id,
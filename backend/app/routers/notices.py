@@ -1,88 +1,109 @@
 # backend/app/routers/renew-notices.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..dependencies import get_current_admin_user, get_current_user
+from ..user_cache import AuthenticatedUser
+from ..view_counter import notice_views
+from ..pagination import NEXT_CURSOR_HEADER, Keyset
+from ..projection import Projection, json_response
 
 router = APIRouter(
     prefix="/notices",
     tags=["notices"],
 )
 
+# 고정 공지 먼저, 최신순
+notice_keyset = Keyset(models.Notice.is_pinned, models.Notice.created_at, models.Notice.id, descending=True)
+notice_projection = Projection(schemas.Notice, models.Notice)
+
+def _with_pending_views(notice: models.Notice) -> schemas.Notice:
+    """DB에 저장된 조회수 + 아직 반영되지 않은 증가분"""
+    data = {name: getattr(notice, name) for name in schemas.Notice.model_fields}
+    data["view_count"] = (notice.view_count or 0) + notice_views.pending(notice.id)  # view_count 는 NULL 일 수 있다
+    return schemas.Notice.model_validate(data)
+
 @router.post("/", response_model=schemas.Notice)
-def create_notice(
+async def create_notice(
     notice: schemas.NoticeCreate,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    db_notice = models.Notice(**notice.dict())
+    db_notice = models.Notice(**notice.model_dump())
     db.add(db_notice)
-    db.commit()
-    db.refresh(db_notice)
+    await db.commit()
+    await db.refresh(db_notice)
     return db_notice
 
 @router.get("/", response_model=List[schemas.Notice])
-def get_notices(
+async def get_notices(
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    notices = db.query(models.Notice).order_by(
-        models.Notice.is_pinned.desc(),
-        models.Notice.created_at.desc()
-    ).offset(skip).limit(limit).all()
-    return notices
+    stmt = notice_keyset.apply(notice_projection.select(), cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    rows = (await db.execute(stmt.limit(limit))).all()
+
+    headers = {}
+    next_cursor = notice_keyset.next_cursor(rows, limit)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    items = [notice_projection.to_dict(row) for row in rows]
+    for item in items:
+        item["view_count"] = (item["view_count"] or 0) + notice_views.pending(item["id"])
+    return json_response(notice_projection.dump_list(items), headers)
 
 @router.get("/{notice_id}", response_model=schemas.Notice)
-def get_notice(
+async def get_notice(
     notice_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    notice = db.query(models.Notice).filter(models.Notice.id == notice_id).first()
+    notice = await db.get(models.Notice, notice_id)
     if not notice:
         raise HTTPException(status_code=404, detail="Notice not found")
 
-    notice.view_count += 1
-    db.add(notice)
-    db.commit()
-    db.refresh(notice)
-
-    return notice
+    # 조회수는 메모리에 모았다가 주기적으로 일괄 반영 (app/view_counter.py)
+    notice_views.increment(notice_id)
+    return _with_pending_views(notice)
 
 @router.put("/{notice_id}", response_model=schemas.Notice)
-def update_notice(
+async def update_notice(
     notice_id: int,
     notice: schemas.NoticeUpdate,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    db_notice = db.query(models.Notice).filter(models.Notice.id == notice_id).first()
+    db_notice = await db.get(models.Notice, notice_id)
     if not db_notice:
         raise HTTPException(status_code=404, detail="Notice not found")
 
-    for key, value in notice.dict().items():
+    for key, value in notice.model_dump().items():
         setattr(db_notice, key, value)
 
     db.add(db_notice)
-    db.commit()
-    db.refresh(db_notice)
-    return db_notice
+    await db.commit()
+    await db.refresh(db_notice)
+    return _with_pending_views(db_notice)
 
 @router.delete("/{notice_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_notice(
+async def delete_notice(
     notice_id: int,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
-    db_notice = db.query(models.Notice).filter(models.Notice.id == notice_id).first()
+    db_notice = await db.get(models.Notice, notice_id)
     if not db_notice:
         raise HTTPException(status_code=404, detail="Notice not found")
 
-    db.delete(db_notice)
-    db.commit()
+    await db.delete(db_notice)
+    await db.commit()
+    notice_views.discard(notice_id)
     return {"ok": True}
@@ -1,131 +1,321 @@
 # backend/app/routers/schedules.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select
+from typing import List, Optional
+from pydantic import TypeAdapter
 
 from .. import models, schemas
-from ..database import get_db
+from ..cache import schedule_cache
+from ..calendar_rollup import calendar_rollup, day_start
+from ..database import get_db, get_read_db
 from ..dependencies import get_current_admin_user
+from ..user_cache import AuthenticatedUser
+from ..pagination import NEXT_CURSOR_HEADER, Keyset
+from ..projection import Projection, dump_json
+from ..schedule_events import event_stream, schedule_events
 
 router = APIRouter(
     prefix="/schedules",
     tags=["schedules"],
 )
 
+schedule_projection = Projection(schemas.ScheduleWithPendingCount, models.Schedule)
+schedule_keyset = Keyset(models.Schedule.work_date, models.Schedule.id)
+calendar_adapter = TypeAdapter(schemas.ScheduleCalendar)
+
+# 반복 규칙의 HH:MM 을 해석할 현지 시간대 (프론트엔드와 동일하게 work_date 는 해당 날짜 UTC 자정)
+SCHEDULE_TIMEZONE = ZoneInfo(os.environ.get("SCHEDULE_TIMEZONE", "Asia/Seoul"))
+SCHEDULE_BULK_MAX_ITEMS = int(os.environ.get("SCHEDULE_BULK_MAX_ITEMS", 1000))
+STREAM_MAX_IDS = 200
+CALENDAR_MAX_DAYS = int(os.environ.get("CALENDAR_MAX_DAYS", 62))
+
+def _parse_hhmm(value: str) -> time:
+    return datetime.strptime(value, "%H:%M").time()
+
+def _expand_recurrence(rule: schemas.ScheduleRecurrence, errors: list) -> List[dict]:
+    """반복 규칙을 스케줄 행 목록으로 펼친다. 규칙 오류는 errors 에 모은다."""
+    if rule.date_to < rule.date_from:
+        errors.append({"index": None, "field": "date_to", "msg": "date_to 는 date_from 이후여야 합니다."})
+    bad_days = sorted(d for d in set(rule.weekdays) if not 0 <= d <= 6)
+    if bad_days:
+        errors.append({"index": None, "field": "weekdays", "msg": f"요일은 0(월)~6(일) 이어야 합니다: {bad_days}"})
+    try:
+        start_t = _parse_hhmm(rule.start_time_str)
+        end_t = _parse_hhmm(rule.end_time_str)
+    except ValueError:
+        errors.append({"index": None, "field": "start_time_str/end_time_str", "msg": "유효하지 않은 시간입니다."})
+    if errors:
+        return []
+
+    rows = []
+    weekdays = set(rule.weekdays)
+    day = rule.date_from
+    while day <= rule.date_to:
+        if day.weekday() in weekdays:
+            start_time = datetime.combine(day, start_t, tzinfo=SCHEDULE_TIMEZONE)
+            end_time = datetime.combine(day, end_t, tzinfo=SCHEDULE_TIMEZONE)
+            if end_time <= start_time:  # 야간 근무는 다음 날 종료
+                end_time += timedelta(days=1)
+            rows.append({
+                "title": rule.title,
+                "description": rule.description,
+                "start_time": start_time,
+                "end_time": end_time,
+                "start_time_str": rule.start_time_str,
+                "end_time_str": rule.end_time_str,
+                "work_date": datetime.combine(day, time(0), tzinfo=timezone.utc),
+                "capacity": rule.capacity,
+            })
+        day += timedelta(days=1)
+    return rows
+
+def _validate_items(items: List[schemas.ScheduleCreate], errors: list) -> List[dict]:
+    rows = []
+    for index, item in enumerate(items):
+        try:
+            _parse_hhmm(item.start_time_str)
+            _parse_hhmm(item.end_time_str)
+        except ValueError:
+            errors.append({"index": index, "field": "start_time_str/end_time_str", "msg": "유효하지 않은 시간입니다."})
+        if item.end_time <= item.start_time:
+            errors.append({"index": index, "field": "end_time", "msg": "end_time 은 start_time 이후여야 합니다."})
+        rows.append(item.model_dump())
+    return rows
+
 @router.post("/", response_model=schemas.Schedule)
-def create_schedule(
+async def create_schedule(
     schedule: schemas.ScheduleCreate,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
     """(Admin+) 스케줄(채용공고) 생성"""
-    db_schedule = models.Schedule(**schedule.dict())
+    db_schedule = models.Schedule(**schedule.model_dump())
     db.add(db_schedule)
-    db.commit()
-    db.refresh(db_schedule)
+    await db.commit()
+    schedule_cache.bump()
+    await db.refresh(db_schedule)
+    schedule_events.changed(db_schedule.id)
+    calendar_rollup.touch(db_schedule.work_date)
     return db_schedule
 
+@router.post("/bulk", response_model=List[schemas.Schedule])
+async def create_schedules_bulk(
+    payload: schemas.ScheduleBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
+):
+    """(Admin+) 스케줄 일괄 생성 - 목록 또는 반복 규칙, 단일 트랜잭션/단일 INSERT
+
+    검증 오류가 하나라도 있으면 아무것도 만들지 않고 모든 오류를 한 번에 422로 반환.
+    """
+    errors = []
+    if payload.recurrence is not None:
+        rows = _expand_recurrence(payload.recurrence, errors)
+    else:
+        rows = _validate_items(payload.items, errors)
+
+    if not errors and not rows:
+        errors.append({"index": None, "field": None, "msg": "생성할 스케줄이 없습니다."})
+    if len(rows) > SCHEDULE_BULK_MAX_ITEMS:
+        errors.append({"index": None, "field": None, "msg": f"한 번에 최대 {SCHEDULE_BULK_MAX_ITEMS}건까지 생성할 수 있습니다."})
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+
+    result = await db.scalars(
+        insert(models.Schedule).values(rows).returning(models.Schedule)
+    )
+    created = result.all()
+    await db.commit()
+    schedule_cache.bump()
+    schedule_events.changed(*(schedule.id for schedule in created))
+    calendar_rollup.touch(*(schedule.work_date for schedule in created))
+    return created
+
 @router.get("/", response_model=List[schemas.ScheduleWithPendingCount])
-def get_schedules(
-    skip: int = 0, 
-    limit: int = 100, 
-    db: Session = Depends(get_db)
+async def get_schedules(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """(Public) 모든 스케줄 조회 - 로그인 불필요"""
-    
-    # Pending 신청자 수 서브쿼리
-    pending_subquery = db.query(
-            models.Application.schedule_id,
-            func.count(models.Application.id).label("pending_count")
-        ).filter(
-            models.Application.status == models.ApplicationStatusEnum.pending
-        ).group_by(
-            models.Application.schedule_id
-        ).subquery()
-
-    # Schedule과 서브쿼리 조인
-    results = db.query(
-            models.Schedule,
-            func.coalesce(pending_subquery.c.pending_count, 0).label("pending_applicants")
-        ).outerjoin(
-            pending_subquery,
-            models.Schedule.id == pending_subquery.c.schedule_id
-        ).order_by(
-            models.Schedule.work_date.asc()
-        ).offset(skip).limit(limit).all()
-
-    # Pydantic 스키마로 변환
-    schedules_with_counts = []
-    for schedule, pending_count in results:
-        schedule_data = schemas.ScheduleWithPendingCount.from_orm(schedule)
-        schedule_data.pending_applicants = pending_count
-        schedules_with_counts.append(schedule_data)
-        
-    return schedules_with_counts
+    """(Public) 모든 스케줄 조회 - 로그인 불필요 (ETag/압축 응답 캐시)
+
+    cursor 를 주면 (work_date, id) 키셋 페이지네이션, 없으면 기존 skip/limit 방식.
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환.
+    """
+    cached = schedule_cache.get(request)
+    if cached is not None:
+        return cached.respond(request)
+    version = schedule_cache.version
+
+    # pending_applicants 는 스케줄 행에 유지되는 카운터 - 단일 테이블, 응답 필드 컬럼만 조회
+    stmt = schedule_keyset.apply(schedule_projection.select(), cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    rows = (await db.execute(stmt.limit(limit))).all()
+
+    headers = {}
+    next_cursor = schedule_keyset.next_cursor(rows, limit)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    body = schedule_projection.dump_list([schedule_projection.to_dict(row) for row in rows])
+    return schedule_cache.put(request, version, body, headers).respond(request)
+
+# /calendar, /stream 은 /{schedule_id} 보다 먼저 선언해야 id 로 매칭되지 않는다
+@router.get("/calendar", response_model=schemas.ScheduleCalendar)
+async def get_schedule_calendar(
+    request: Request,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    include_schedules: bool = True,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """(Public) 기간 달력 - 로그인 불필요 (ETag/압축 응답 캐시)
+
+    from ~ to (포함, UTC 날짜) 중 근무가 있는 날의 근무 수/총 정원/남은 자리/승인·대기 인원과
+    기간 안의 스케줄을 반환한다. 날짜별 집계는 schedule_daily_stats 기본 키 범위 한 번으로 읽고
+    (쓰기 후 최대 CALENDAR_ROLLUP_INTERVAL 초 뒤 반영), 스케줄은 work_date 인덱스 범위로 읽는다.
+    """
+    if date_to < date_from:
+        raise HTTPException(status_code=422, detail="to 는 from 이후 날짜여야 합니다.")
+    if (date_to - date_from).days + 1 > CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=422, detail=f"한 번에 최대 {CALENDAR_MAX_DAYS}일까지 조회할 수 있습니다.")
+
+    cached = schedule_cache.get(request)
+    if cached is not None:
+        return cached.respond(request)
+    version = schedule_cache.version
+
+    stats = models.ScheduleDailyStats
+    stat_rows = (await db.execute(
+        select(stats).where(stats.day >= date_from, stats.day <= date_to, stats.shift_count > 0).order_by(stats.day)
+    )).scalars().all()
+    days = [
+        {
+            "day": row.day,
+            "shift_count": row.shift_count,
+            "total_capacity": row.total_capacity,
+            "seats_left": max(row.total_capacity - row.active, 0),
+            "approved": row.approved,
+            "pending": row.pending,
+        }
+        for row in stat_rows
+    ]
+
+    schedule_rows = []
+    if include_schedules and days:
+        schedule_rows = (await db.execute(
+            schedule_projection.select().where(
+                models.Schedule.work_date >= day_start(date_from),
+                models.Schedule.work_date < day_start(date_to + timedelta(days=1)),
+            ).order_by(models.Schedule.work_date, models.Schedule.id)
+        )).all()
+
+    body = dump_json(
+        {"days": days, "schedules": [schedule_projection.to_dict(row) for row in schedule_rows]},
+        calendar_adapter,
+    )
+    return schedule_cache.put(request, version, body).respond(request)
+
+# /{schedule_id} 보다 먼저 선언해야 "stream" 이 id 로 매칭되지 않는다
+@router.get("/stream")
+async def stream_schedule_availability(ids: Optional[str] = None):
+    """(Public) 자리 현황 실시간 스트림 (Server-Sent Events) - 로그인 불필요
+
+    신청/취소/승인 상태 변경/스케줄 수정으로 자리 현황이 바뀌면 event: availability 로
+    [{"id", "current", "pending", "capacity"}] (삭제 시 {"id", "deleted": true}) 를 보낸다.
+    ids=1,2,3 을 주면 해당 스케줄의 변경만 받는다.
+    """
+    selected = None
+    if ids:
+        try:
+            selected = {int(value) for value in ids.split(",") if value.strip()}
+        except ValueError:
+            raise HTTPException(status_code=422, detail="ids 는 쉼표로 구분한 스케줄 id 여야 합니다.")
+        if len(selected) > STREAM_MAX_IDS:
+            raise HTTPException(status_code=422, detail=f"ids 는 최대 {STREAM_MAX_IDS}개까지 지정할 수 있습니다.")
+
+    subscription = schedule_events.subscribe(selected)
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="실시간 연결이 많습니다. 잠시 후 다시 시도해 주세요.")
+    return StreamingResponse(
+        event_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/{schedule_id}", response_model=schemas.ScheduleWithPendingCount)
-def get_schedule(
+async def get_schedule(
+    request: Request,
     schedule_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """(Public) 특정 스케줄 상세 조회 - 로그인 불필요"""
-    schedule = db.query(models.Schedule).filter(models.Schedule.id == schedule_id).first()
-    if not schedule:
+    """(Public) 특정 스케줄 상세 조회 - 로그인 불필요 (ETag/압축 응답 캐시)"""
+    cached = schedule_cache.get(request)
+    if cached is not None:
+        return cached.respond(request)
+    version = schedule_cache.version
+
+    row = (await db.execute(
+        schedule_projection.select().where(models.Schedule.id == schedule_id)
+    )).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    
-    # Pending 신청자 수 계산
-    pending_count = db.query(models.Application).filter(
-        models.Application.schedule_id == schedule_id,
-        models.Application.status == models.ApplicationStatusEnum.pending
-    ).count()
-    
-    schedule_data = schemas.ScheduleWithPendingCount.from_orm(schedule)
-    schedule_data.pending_applicants = pending_count
-
-    return schedule_data
+
+    body = schedule_projection.dump_item(schedule_projection.to_dict(row))
+    return schedule_cache.put(request, version, body).respond(request)
 
 @router.put("/{schedule_id}", response_model=schemas.Schedule)
-def update_schedule(
+async def update_schedule(
     schedule_id: int,
     schedule_update: schemas.ScheduleUpdate,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
     """(Admin+) 스케줄 수정"""
-    db_schedule = db.query(models.Schedule).filter(models.Schedule.id == schedule_id).first()
+    db_schedule = await db.get(models.Schedule, schedule_id)
     if not db_schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    
+
     # 신청자가 있으면 정원 수정 불가
-    applicant_count = db.query(models.Application).filter(
-        models.Application.schedule_id == schedule_id,
-        models.Application.status.in_([models.ApplicationStatusEnum.pending, models.ApplicationStatusEnum.approved])
-    ).count()
-    
-    if applicant_count > 0 and schedule_update.capacity != db_schedule.capacity:
+    if db_schedule.active_applicants > 0 and schedule_update.capacity != db_schedule.capacity:
          raise HTTPException(status_code=400, detail="신청자가 있는 스케줄의 정원은 변경할 수 없습니다.")
 
-    for key, value in schedule_update.dict().items():
+    previous_work_date = db_schedule.work_date
+    for key, value in schedule_update.model_dump().items():
         setattr(db_schedule, key, value)
-        
+
     db.add(db_schedule)
-    db.commit()
-    db.refresh(db_schedule)
+    await db.commit()
+    schedule_cache.bump()
+    schedule_events.changed(schedule_id)
+    calendar_rollup.touch(previous_work_date, db_schedule.work_date)
+    await db.refresh(db_schedule)
     return db_schedule
 
 @router.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_schedule(
+async def delete_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_admin: models.User = Depends(get_current_admin_user)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AuthenticatedUser = Depends(get_current_admin_user)
 ):
     """(Admin+) 스케줄 삭제 (CASCADE로 관련 신청서 자동 삭제)"""
-    db_schedule = db.query(models.Schedule).filter(models.Schedule.id == schedule_id).first()
+    db_schedule = await db.get(models.Schedule, schedule_id)
     if not db_schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    
+
     # CASCADE 설정으로 관련 Applications 자동 삭제
-    db.delete(db_schedule)
-    db.commit()
+    await db.delete(db_schedule)
+    await db.commit()
+    schedule_cache.bump()
+    schedule_events.changed(schedule_id)
+    calendar_rollup.touch(db_schedule.work_date)
     return {"ok": True}
@@ -0,0 +1,204 @@
+# backend/app/schedule_events.py
+import asyncio
+import json
+import logging
+import os
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+
+from .database import ASYNC_DATABASE_URL, AsyncSessionLocal
+from .metrics import SSE_CLIENTS, SSE_CLIENTS_DROPPED, SSE_EVENTS_PUBLISHED
+from .models import Schedule
+
+# local: 워커 프로세스 안에서만 전달 / postgres: LISTEN/NOTIFY 로 모든 워커에 전달 (워커 여러 개일 때)
+SSE_BACKEND = os.environ.get("SSE_BACKEND", "local")
+SSE_CHANNEL = os.environ.get("SSE_CHANNEL", "schedule_availability")
+# 이 시간 동안 바뀐 스케줄을 모아 한 번의 SELECT / 한 번의 이벤트로 보낸다 (신청 러시 때 이벤트 폭증 방지)
+SSE_COALESCE_INTERVAL = float(os.environ.get("SSE_COALESCE_INTERVAL", 0.2))
+SSE_CLIENT_QUEUE_SIZE = int(os.environ.get("SSE_CLIENT_QUEUE_SIZE", 32))  # 이만큼 밀린 클라이언트는 끊는다
+SSE_MAX_CLIENTS = int(os.environ.get("SSE_MAX_CLIENTS", 2000))
+SSE_HEARTBEAT_INTERVAL = float(os.environ.get("SSE_HEARTBEAT_INTERVAL", 15))  # 프록시 유휴 타임아웃 방지용 주석 줄
+SSE_RETRY_MS = 3000  # 끊긴 뒤 EventSource 재연결 간격
+# NOTIFY payload 는 8000 바이트 제한 - 델타 하나가 60바이트 남짓이므로 이 개수씩 나눠 보낸다
+NOTIFY_CHUNK = 100
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """SSE 클라이언트 하나의 이벤트 큐. ids 가 있으면 해당 스케줄의 델타만 받는다."""
+
+    __slots__ = ("queue", "ids", "dropped")
+
+    def __init__(self, ids: Optional[Set[int]]):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_CLIENT_QUEUE_SIZE)
+        self.ids = ids
+        self.dropped = False
+
+
+class ScheduleEventBroker:
+    """스케줄 자리 현황 변경을 SSE 구독자에게 나눠 주는 프로세스 내 pub/sub.
+
+    쓰기 요청은 커밋 뒤 changed(schedule_id) 로 id 만 남기고, 백그라운드 run() 이 모아 둔 id 의
+    카운터를 한 번에 읽어 {"id", "current", "pending", "capacity"} 델타 목록으로 발행한다.
+    postgres 백엔드는 발행을 NOTIFY 로 보내고, 각 워커의 LISTEN 연결이 받아 자기 구독자에게 전달한다.
+    구독자 큐가 가득 차면(느린 클라이언트) 기다리지 않고 연결을 끊는다 - EventSource 가 재연결 후 다시 조회.
+    """
+
+    def __init__(self, backend: str, channel: str, interval: float):
+        self.backend = backend
+        self.channel = channel
+        self.interval = interval
+        self.subscribers: Set[Subscription] = set()
+        self._changed: Set[int] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._listener = None  # postgres 백엔드의 asyncpg 연결
+
+    # --- 쓰기 쪽 ---
+    def changed(self, *schedule_ids: int):
+        """자리 현황이 바뀐 스케줄 id 를 기록 (커밋 뒤 호출, DB 작업 없음)"""
+        self._changed.update(schedule_ids)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _load(self, schedule_ids: Set[int]) -> List[dict]:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(
+                    Schedule.id, Schedule.current_applicants, Schedule.pending_applicants, Schedule.capacity
+                ).where(Schedule.id.in_(schedule_ids))
+            )).all()
+        deltas = [
+            {"id": row.id, "current": row.current_applicants or 0, "pending": row.pending_applicants, "capacity": row.capacity}
+            for row in rows
+        ]
+        deltas += [{"id": schedule_id, "deleted": True} for schedule_id in schedule_ids - {row.id for row in rows}]
+        return sorted(deltas, key=lambda delta: delta["id"])
+
+    async def _publish(self, deltas: List[dict]):
+        if self.backend == "postgres" and self._listener is not None:
+            for start in range(0, len(deltas), NOTIFY_CHUNK):
+                payload = json.dumps(deltas[start:start + NOTIFY_CHUNK], separators=(",", ":"))
+                await self._listener.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        else:
+            self.fan_out(deltas)
+
+    # --- 읽기 쪽 ---
+    def fan_out(self, deltas: List[dict]):
+        """이 워커의 구독자 큐에 델타를 넣는다. 큐가 가득 찬 구독자는 끊는다."""
+        SSE_EVENTS_PUBLISHED.inc()
+        for subscription in list(self.subscribers):
+            if subscription.ids is not None:
+                selected = [delta for delta in deltas if delta["id"] in subscription.ids]
+                if not selected:
+                    continue
+            else:
+                selected = deltas
+            try:
+                subscription.queue.put_nowait(selected)
+            except asyncio.QueueFull:
+                self._drop(subscription)
+
+    def subscribe(self, ids: Optional[Iterable[int]] = None) -> Optional[Subscription]:
+        """SSE_MAX_CLIENTS 를 넘으면 None"""
+        if len(self.subscribers) >= SSE_MAX_CLIENTS:
+            return None
+        subscription = Subscription(set(ids) if ids else None)
+        self.subscribers.add(subscription)
+        SSE_CLIENTS.set(len(self.subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscribers.discard(subscription)
+        SSE_CLIENTS.set(len(self.subscribers))
+
+    def _drop(self, subscription: Subscription):
+        subscription.dropped = True
+        self.unsubscribe(subscription)
+        SSE_CLIENTS_DROPPED.inc()
+        # 대기 중인 스트림을 깨워 바로 종료시키기 위해 큐를 비우고 None 을 넣는다
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    # --- 백그라운드 작업 ---
+    async def _listen(self):
+        import asyncpg  # postgres 백엔드에서만 필요
+
+        dsn = make_url(ASYNC_DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+
+        def on_notify(connection, pid, channel, payload):
+            try:
+                self.fan_out(json.loads(payload))
+            except Exception as e:
+                logger.error(f"Invalid schedule event payload: {e}")
+
+        while True:
+            try:
+                self._listener = await asyncpg.connect(dsn)
+                await self._listener.add_listener(self.channel, on_notify)
+                logger.info(f"Listening for schedule events on '{self.channel}'")
+                while not self._listener.is_closed():
+                    await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Schedule event listener failed, reconnecting: {e}")
+            finally:
+                if self._listener is not None and not self._listener.is_closed():
+                    await self._listener.close()
+                self._listener = None
+            await asyncio.sleep(1)
+
+    async def flush(self) -> int:
+        """모아 둔 스케줄의 델타를 발행. 발행한 스케줄 수를 반환"""
+        if not self._changed:
+            return 0
+        schedule_ids, self._changed = self._changed, set()
+        try:
+            await self._publish(await self._load(schedule_ids))
+        except Exception:
+            # 다음 주기에 다시 시도 (델타는 현재 값이라 일부가 이미 나갔어도 다시 보내도 된다)
+            self._changed.update(schedule_ids)
+            raise
+        return len(schedule_ids)
+
+    async def run(self):
+        """startup 에서 create_task 로 실행 - 바뀐 스케줄을 interval 마다 모아 발행"""
+        self._wakeup = asyncio.Event()
+        if self._changed:
+            self._wakeup.set()
+        if self.backend == "postgres":
+            asyncio.create_task(self._listen())
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error publishing schedule events: {e}")
+                self._wakeup.set()
+                await asyncio.sleep(1)  # DB 장애 중 재시도 간격
+
+
+async def event_stream(subscription: Subscription):
+    """text/event-stream 본문 - availability 이벤트(델타 JSON 배열)와 주기적인 ping 주석"""
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        while True:
+            try:
+                deltas = await asyncio.wait_for(subscription.queue.get(), SSE_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if deltas is None:  # 느린 소비자로 끊김
+                return
+            yield "event: availability\ndata: " + json.dumps(deltas, separators=(",", ":")) + "\n\n"
+    finally:
+        schedule_events.unsubscribe(subscription)
+
+
+schedule_events = ScheduleEventBroker(SSE_BACKEND, SSE_CHANNEL, SSE_COALESCE_INTERVAL)
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Optional
+from datetime import date, datetime
 from .models import UserRoleEnum, UserStatusEnum, ApplicationStatusEnum
 import re
 
@@ -25,17 +25,53 @@ class Schedule(ScheduleBase):
     id: int
     current_applicants: int
     
-    class Config:
-        from_attributes = True  # 수정됨
+    model_config = ConfigDict(from_attributes=True)
 
 class ScheduleWithPendingCount(Schedule):
     pending_applicants: int = 0
 
+class ScheduleRecurrence(BaseModel):
+    """반복 근무 규칙 - date_from ~ date_to 사이의 지정 요일마다 한 건씩 생성"""
+    title: str
+    description: Optional[str] = None
+    weekdays: List[int] = Field(..., min_length=1)  # 0=월 ... 6=일
+    date_from: date
+    date_to: date
+    start_time_str: str = Field(..., pattern=r'^\d{2}:\d{2}$')
+    end_time_str: str = Field(..., pattern=r'^\d{2}:\d{2}$')
+    capacity: int = Field(gt=0)
+
+class ScheduleBulkCreate(BaseModel):
+    """items(개별 스케줄 목록) 또는 recurrence(반복 규칙) 중 하나만 지정"""
+    items: Optional[List[ScheduleCreate]] = None
+    recurrence: Optional[ScheduleRecurrence] = None
+
+    @model_validator(mode="after")
+    def exactly_one_source(self):
+        if (self.items is None) == (self.recurrence is None):
+            raise ValueError("items 또는 recurrence 중 하나만 지정해야 합니다.")
+        return self
+
+class CalendarDay(BaseModel):
+    """날짜별 자리 현황 집계"""
+    day: date
+    shift_count: int
+    total_capacity: int
+    seats_left: int
+    approved: int
+    pending: int
+
+class ScheduleCalendar(BaseModel):
+    """기간 달력 - 근무가 있는 날의 집계와 기간 안의 스케줄"""
+    days: List[CalendarDay]
+    schedules: List[ScheduleWithPendingCount]
+
 # --- User Schemas ---
 class UserBase(BaseModel):
     phone_number: str
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def phone_validation(cls, v):
         if not re.match(r'^\d{10,11}$', v):
             raise ValueError("유효하지 않은 전화번호 형식입니다 (10~11자리 숫자).")
@@ -52,13 +88,17 @@ class User(BaseModel):
     username: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True  # 수정됨
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Auth Schemas ---
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # access token 유효 시간 (초)
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 class UserLogin(BaseModel):
     phone_number: str
@@ -88,8 +128,7 @@ class Application(ApplicationBase):
     schedule: Optional[Schedule] = None
     user: Optional[User] = None
     
-    class Config:
-        from_attributes = True  # 수정됨
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Admin Schemas ---
 class UserApproval(BaseModel):
@@ -104,12 +143,35 @@ class ApplicationApproval(BaseModel):
     application_id: int
     new_status: ApplicationStatusEnum
 
+class UserBulkApproval(BaseModel):
+    user_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    status: UserStatusEnum
+
+class ApplicationBulkApproval(BaseModel):
+    application_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    new_status: ApplicationStatusEnum
+
+class BulkItemResult(BaseModel):
+    id: int
+    ok: bool
+    detail: Optional[str] = None
+
+class BulkResult(BaseModel):
+    updated: int
+    results: List[BulkItemResult]
+
 # --- Notice Schemas ---
 class NoticeBase(BaseModel):
     title: str
     content: str
     is_pinned: Optional[bool] = False
 
+    @field_validator('is_pinned')
+    @classmethod
+    def pinned_not_null(cls, v):
+        # notices.is_pinned 는 NOT NULL (공지 커서 키) - null 은 고정 안 함으로 저장
+        return bool(v)
+
 class NoticeCreate(NoticeBase):
     pass
 
@@ -121,5 +183,4 @@ class Notice(NoticeBase):
     created_at: datetime
     view_count: int
 
-    class Config:
-        from_attributes = True  # 수정됨
+    model_config = ConfigDict(from_attributes=True)
@@ -2,21 +2,80 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import asyncio
+import hashlib
+import hmac
+import logging
 import os
+import time
+
+from .hashing import hash_pool
+from .metrics import PASSWORD_HASH_MEASURED_SECONDS, PASSWORD_HASH_REHASHED, PASSWORD_HASH_ROUNDS
 
 SECRET_KEY = os.environ.get("SECRET_KEY", "default_secret_key_for_dev")
 ALGORITHM = os.environ.get("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
+# access token 은 짧게, 만료되면 refresh token 으로 bcrypt 없이 재발급 (POST /auth/refresh)
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", 15))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", 14))  # 로그인 후 이 기간이 지나면 다시 로그인
+# 앱 시작 후 이 시간(초)이 지나서 해시 시간을 잰다 - 콜드 스타트 직후의 요청과 CPU 를 다투지 않도록
+PASSWORD_HASH_PROBE_DELAY = float(os.environ.get("PASSWORD_HASH_PROBE_DELAY", 60))
+
+# bcrypt cost - 배포 대상과 같은 인스턴스에서 python -m app.password_calibration 을 한 번 돌려 고른 값 (render.yaml).
+# BCRYPT_MIN_ROUNDS 아래로는 내려가지 않는다. cost 가 다른 기존 해시는 로그인 성공 시 다시 해시된다.
+BCRYPT_MIN_ROUNDS = int(os.environ.get("BCRYPT_MIN_ROUNDS", 10))
+BCRYPT_ROUNDS = max(int(os.environ.get("BCRYPT_ROUNDS", 12)), BCRYPT_MIN_ROUNDS)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,  # 위아래 모두 현재 cost 와 다르면 needs_update
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+PASSWORD_HASH_ROUNDS.set(BCRYPT_ROUNDS)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password, hashed_password) -> Tuple[bool, Optional[str]]:
+    """(일치 여부, 새 해시) - 일치하고 저장된 해시가 현재 설정과 다르면(needs_update) 현재 cost 로 다시 해시"""
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False, None
+    if pwd_context.needs_update(hashed_password):
+        return True, pwd_context.hash(plain_password)
+    return True, None
+
+def measure_hash_time() -> float:
+    """현재 cost 로 해시 한 번에 걸린 시간 (초)"""
+    started = time.perf_counter()
+    pwd_context.hash("calibration")
+    return time.perf_counter() - started
+
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# 요청 처리 경로에서는 bcrypt를 워커 프로세스 풀에서 실행 (이벤트 루프/GIL 점유 방지)
+async def verify_password_async(plain_password, hashed_password):
+    return await hash_pool.run("verify", verify_password, plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password, hashed_password) -> Tuple[bool, Optional[str]]:
+    verified, new_hash = await hash_pool.run("verify", verify_and_update_password, plain_password, hashed_password)
+    if new_hash is not None:
+        PASSWORD_HASH_REHASHED.inc()
+    return verified, new_hash
+
+async def get_password_hash_async(password):
+    return await hash_pool.run("hash", get_password_hash, password)
+
+async def publish_hash_time(delay: float = PASSWORD_HASH_PROBE_DELAY):
+    """시작 delay 초 후 워커에서 해시 한 번을 재서 게이지로 내보낸다"""
+    await asyncio.sleep(delay)
+    try:
+        PASSWORD_HASH_MEASURED_SECONDS.set(await hash_pool.run("measure", measure_hash_time))
+    except Exception as e:
+        logging.warning(f"Failed to measure password hash time: {e!r}")
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -36,3 +95,21 @@ def verify_token(token: str, credentials_exception) -> Optional[int]:
         return user_id
     except JWTError:
         raise credentials_exception
+
+def _refresh_signature(family_id: str, generation: int) -> str:
+    message = f"refresh:{family_id}:{generation}".encode()
+    return hmac.new(SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+def create_refresh_token(family_id: str, generation: int) -> str:
+    """'계열 id.세대.HMAC' - 같은 (계열, 세대) 면 항상 같은 토큰이므로 DB 에 토큰을 저장하지 않는다"""
+    return f"{family_id}.{generation}.{_refresh_signature(family_id, generation)}"
+
+def parse_refresh_token(token: str) -> Optional[Tuple[str, int]]:
+    """서명이 맞으면 (계열 id, 세대), 아니면 None (DB 조회 없음)"""
+    parts = token.split(".")
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    family_id, generation = parts[0], int(parts[1])
+    if not hmac.compare_digest(parts[2], _refresh_signature(family_id, generation)):
+        return None
+    return family_id, generation
@@ -0,0 +1,69 @@
+# backend/app/user_cache.py
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from . import metrics
+from .models import UserRoleEnum, UserStatusEnum
+
+USER_CACHE_ENABLED = os.environ.get("USER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+# 다른 워커에서 바뀐 상태/권한은 최대 TTL 만큼 늦게 반영된다
+USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL", 30))
+USER_CACHE_MAX_SIZE = int(os.environ.get("USER_CACHE_MAX_SIZE", 10000))
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """토큰 검증 후 의존성에서 넘겨주는 최소 사용자 정보"""
+    id: int
+    status: UserStatusEnum
+    role: UserRoleEnum
+
+
+class UserCache:
+    """user_id -> AuthenticatedUser TTL + LRU 캐시 (이벤트 루프 전용, 락 없음)"""
+
+    def __init__(self, ttl: float, max_size: int, enabled: bool = True):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[AuthenticatedUser]:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            metrics.USER_CACHE_REQUESTS.labels("miss").inc()
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        metrics.USER_CACHE_REQUESTS.labels("hit").inc()
+        return entry[0]
+
+    def set(self, user: AuthenticatedUser):
+        if not self.enabled:
+            return
+        self._entries[user.id] = (user, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+user_cache = UserCache(USER_CACHE_TTL, USER_CACHE_MAX_SIZE, enabled=USER_CACHE_ENABLED)
@@ -0,0 +1,77 @@
+# backend/app/view_counter.py
+import asyncio
+import logging
+import os
+from typing import Dict
+
+from sqlalchemy import Integer, bindparam, column, func, update, values
+
+from .database import AsyncSessionLocal, async_engine
+from .models import Notice
+
+NOTICE_VIEW_FLUSH_INTERVAL = float(os.environ.get("NOTICE_VIEW_FLUSH_INTERVAL", 10))
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """공지 조회수 write-behind 버퍼.
+
+    조회 시에는 메모리의 증가분만 올리고, 주기적으로 한 번의 UPDATE 로 DB에 반영한다.
+    워커마다 자기 증가분만 더하므로 여러 워커에서도 합이 맞는다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: Dict[int, int] = {}
+
+    def increment(self, notice_id: int) -> int:
+        self._pending[notice_id] = self._pending.get(notice_id, 0) + 1
+        return self._pending[notice_id]
+
+    def pending(self, notice_id: int) -> int:
+        return self._pending.get(notice_id, 0)
+
+    def discard(self, notice_id: int):
+        self._pending.pop(notice_id, None)
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(*self._statement(batch))
+                await db.commit()
+        except Exception:
+            # 실패한 증가분은 다음 주기에 다시 시도
+            for notice_id, delta in batch.items():
+                self._pending[notice_id] = self._pending.get(notice_id, 0) + delta
+            raise
+        return len(batch)
+
+    @staticmethod
+    def _statement(batch: Dict[int, int]):
+        if async_engine.dialect.name == "postgresql":
+            # UPDATE notices SET view_count = view_count + v.delta FROM (VALUES ...) AS v(id, delta)
+            deltas = values(column("id", Integer), column("delta", Integer), name="v").data(list(batch.items()))
+            stmt = update(Notice).where(Notice.id == deltas.c.id).values(
+                view_count=func.coalesce(Notice.view_count, 0) + deltas.c.delta
+            )
+            return (stmt,)
+        # VALUES 별칭 컬럼을 지원하지 않는 DB(SQLite)는 executemany 로 대체
+        stmt = update(Notice.__table__).where(Notice.__table__.c.id == bindparam("notice_id")).values(
+            view_count=func.coalesce(Notice.__table__.c.view_count, 0) + bindparam("delta")
+        )
+        return (stmt, [{"notice_id": notice_id, "delta": delta} for notice_id, delta in batch.items()])
+
+    async def run_periodic(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing notice view counts: {e}")
+
+
+notice_views = ViewCounter(NOTICE_VIEW_FLUSH_INTERVAL)
@@ -0,0 +1,109 @@
+# backend/benchmarks/bench_admission.py
+"""트래픽 급증 시 동시 요청 제한(admission control) 유무 비교 - 커넥션 풀 대기 500 vs 우선순위 대기열 + 503
+
+    cd backend && python -m benchmarks.bench_admission --spike 300 --pool-size 5 --query-ms 50
+
+작은 커넥션 풀(--pool-size, overflow 0)을 가진 SQLite 파일 DB 에 요청마다 커넥션을 --query-ms 동안
+붙잡는 엔드포인트를 두고, 공개 목록 조회 --spike 개를 한꺼번에 보내는 동안 관리자 요청 --admin 개를
+일정 간격으로 섞어 보낸다. 우선순위별 성공/503/500 수와 지연을 출력한다.
+- off: 제한 없음 - 풀이 모자라면 요청이 풀 타임아웃(--pool-timeout)까지 기다렸다가 500
+- on : app/admission.py 의 AdmissionMiddleware (제한 = 풀 크기, --queue-size, --max-wait)
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections import defaultdict
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.admission import AdmissionController, AdmissionMiddleware
+from benchmarks.report import percentile
+
+
+def build_app(mode: str, engine, query_ms: float, queue_size: int, max_wait: float) -> FastAPI:
+    app = FastAPI()
+
+    async def hold_connection():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await asyncio.sleep(query_ms / 1000)  # 느린 쿼리 동안 커넥션 점유
+
+    @app.get("/api/schedules/")
+    async def list_schedules():
+        await hold_connection()
+        return {"ok": True}
+
+    @app.get("/api/admin/users")
+    async def list_users():
+        await hold_connection()
+        return {"ok": True}
+
+    if mode == "on":
+        controller = AdmissionController(engine.pool.size(), queue_size, max_wait)
+        app.add_middleware(AdmissionMiddleware, controller=controller)
+    return app
+
+
+async def drive(app: FastAPI, spike: int, admin: int, admin_interval_ms: float) -> dict:
+    results = defaultdict(list)  # 종류 -> [(상태 코드, 지연)]
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def call(kind: str, path: str):
+            started = time.perf_counter()
+            response = await client.get(path)
+            results[kind].append((response.status_code, time.perf_counter() - started))
+
+        async def admin_trickle():
+            for _ in range(admin):
+                await asyncio.sleep(admin_interval_ms / 1000)
+                await call("admin", "/api/admin/users")
+
+        await asyncio.gather(admin_trickle(), *(call("public", "/api/schedules/") for _ in range(spike)))
+    return results
+
+
+def main(spike: int, admin: int, admin_interval_ms: float, pool_size: int, pool_timeout: float,
+         query_ms: float, queue_size: int, max_wait: float):
+    path = os.path.join(tempfile.mkdtemp(), "admission.db")
+    print(
+        f"spike={spike} admin={admin}@{admin_interval_ms}ms pool={pool_size} pool_timeout={pool_timeout}s "
+        f"query={query_ms}ms queue={queue_size} max_wait={max_wait}s"
+    )
+    print(f"{'mode':<5} {'kind':<7} {'ok':>5} {'503':>5} {'500':>5} {'p50':>9} {'p99':>9} {'max':>9} {'elapsed':>8}")
+    for mode in ("off", "on"):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}", pool_size=pool_size, max_overflow=0, pool_timeout=pool_timeout,
+        )
+        app = build_app(mode, engine, query_ms, queue_size, max_wait)
+        started = time.perf_counter()
+        results = asyncio.run(drive(app, spike, admin, admin_interval_ms))
+        elapsed = time.perf_counter() - started
+        asyncio.run(engine.dispose())
+        for kind in ("public", "admin"):
+            codes = [code for code, _ in results[kind]]
+            values = sorted(latency for _, latency in results[kind])
+            print(
+                f"{mode:<5} {kind:<7} {codes.count(200):>5} {codes.count(503):>5} {codes.count(500):>5} "
+                f"{percentile(values, 50) * 1000:>7.0f}ms {percentile(values, 99) * 1000:>7.0f}ms "
+                f"{values[-1] * 1000:>7.0f}ms {elapsed:>7.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spike", type=int, default=300, help="한꺼번에 보내는 공개 목록 조회 수")
+    parser.add_argument("--admin", type=int, default=20, help="급증 중에 섞어 보내는 관리자 요청 수")
+    parser.add_argument("--admin-interval-ms", type=float, default=50)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--pool-timeout", type=float, default=2)
+    parser.add_argument("--query-ms", type=float, default=50)
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument("--max-wait", type=float, default=1)
+    args = parser.parse_args()
+    main(args.spike, args.admin, args.admin_interval_ms, args.pool_size, args.pool_timeout,
+         args.query_ms, args.queue_size, args.max_wait)
@@ -0,0 +1,86 @@
+# backend/benchmarks/bench_async_db.py
+"""동기(psycopg2 + threadpool) vs 비동기(asyncpg) DB 경로 동시 처리량 비교
+
+    cd backend && python -m benchmarks.bench_async_db --requests 2000 --concurrency 200
+
+DATABASE_URL 이 가리키는 DB에 대해 동일한 스케줄 목록 쿼리를 두 경로로 실행한다.
+httpx(ASGITransport)로 앱을 프로세스 내에서 직접 호출하므로 네트워크 비용은 제외된다.
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import get_db, get_sync_db
+
+QUERY = select(models.Schedule.id, models.Schedule.work_date).order_by(models.Schedule.work_date.asc()).limit(100)
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_list(db: Session = Depends(get_sync_db)):
+        return {"count": len(db.execute(QUERY).all())}
+
+    @app.get("/async")
+    async def async_list(db: AsyncSession = Depends(get_db)):
+        return {"count": len((await db.execute(QUERY)).all())}
+
+    @app.get("/sync-count")
+    def sync_count(db: Session = Depends(get_sync_db)):
+        return {"count": db.scalar(select(func.count(models.Schedule.id)))}
+
+    return app
+
+async def run(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one():
+        nonlocal errors
+        async with sem:
+            started = time.perf_counter()
+            resp = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if resp.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "path": path,
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+async def main(total: int, concurrency: int):
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        rows = (await client.get("/sync-count")).json()["count"]
+        print(f"schedules in DB: {rows}, requests={total}, concurrency={concurrency}")
+        for path in ("/sync", "/async"):
+            await run(client, path, min(total, 50), concurrency)  # warm-up
+            result = await run(client, path, total, concurrency)
+            print(
+                f"{result['path']:>7}: {result['rps']:8.1f} req/s  "
+                f"p50={result['p50_ms']:7.2f}ms  p99={result['p99_ms']:7.2f}ms  errors={result['errors']}"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
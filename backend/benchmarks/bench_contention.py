@@ -0,0 +1,146 @@
+# backend/benchmarks/bench_contention.py
+"""한 스케줄에 N명이 동시에 신청할 때의 처리량과 정원 초과 여부 검사
+
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../scratch python -m benchmarks.bench_contention --applicants 500 --capacity 50
+
+전용(스크래치) DB에서 실행할 것 - 사용자/스케줄/신청서를 새로 만든다.
+각 신청자는 --repeat 번씩 신청하므로 중복 신청 경합도 함께 검사한다.
+정원 초과, 중복 신청, 카운터 불일치, 200/400 이외의 응답(503 등)이 하나라도 있으면 종료 코드 1.
+
+요청을 한꺼번에 보내 DB 경합을 재므로 admission control(app/admission.py)은 끄고 실행한다
+(켜 두면 대부분이 503 으로 바로 돌아와 경합 경로가 아닌 거절 속도를 재게 된다).
+처리량은 200(신청됨)과 400(중복/정원 초과) 응답만 센다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("ADMISSION_ENABLED", "0")  # app.main import 전에 (미들웨어는 import 시 설치)
+
+import httpx  # noqa: E402
+from sqlalchemy import func, insert, select  # noqa: E402
+
+from app import models, security  # noqa: E402
+from app.counters import reconcile_statement  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def seed(applicants: int, capacity: int):
+    models.Base.metadata.create_all(bind=engine)
+    # 실행마다 다른 전화번호 대역 (010 + 4자리 + 4자리)
+    prefix = uuid.uuid4().int % 9000 + 1000
+    hashed = security.get_password_hash("bench")  # 한 번만 해시해서 재사용
+    db = SessionLocal()
+    try:
+        work_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=7)
+        schedule = models.Schedule(
+            title="contention bench",
+            start_time=work_date + timedelta(hours=9),
+            end_time=work_date + timedelta(hours=18),
+            start_time_str="09:00",
+            end_time_str="18:00",
+            work_date=work_date,
+            capacity=capacity,
+        )
+        db.add(schedule)
+        db.flush()
+        user_ids = db.execute(
+            insert(models.User).returning(models.User.id),
+            [
+                {
+                    "phone_number": f"010{prefix}{i:04d}",
+                    "hashed_password": hashed,
+                    "role": models.UserRoleEnum.user,
+                    "status": models.UserStatusEnum.approved,
+                }
+                for i in range(applicants)
+            ],
+        ).scalars().all()
+        db.commit()
+        return schedule.id, user_ids
+    finally:
+        db.close()
+
+
+async def fire(schedule_id: int, user_ids: list, repeat: int):
+    tokens = [security.create_access_token({"id": user_id}) for user_id in user_ids]
+    statuses = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def apply(token):
+            resp = await client.post(
+                "/api/applications/",
+                json={"schedule_id": schedule_id},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(apply(token) for token in tokens for _ in range(repeat)))
+        elapsed = time.perf_counter() - started
+    return statuses, elapsed
+
+
+def verify(schedule_id: int, capacity: int, accepted: int) -> list:
+    problems = []
+    db = SessionLocal()
+    try:
+        schedule = db.get(models.Schedule, schedule_id)
+        rows = db.scalar(select(func.count(models.Application.id)).where(models.Application.schedule_id == schedule_id))
+        distinct_users = db.scalar(
+            select(func.count(func.distinct(models.Application.user_id))).where(models.Application.schedule_id == schedule_id)
+        )
+        drift = db.execute(reconcile_statement()).rowcount
+        db.rollback()  # 검사만 하고 되돌림
+        if rows > capacity:
+            problems.append(f"capacity exceeded: {rows} applications > capacity {capacity}")
+        if rows != distinct_users:
+            problems.append(f"duplicate applications: {rows} rows for {distinct_users} users")
+        if rows != accepted:
+            problems.append(f"accepted responses ({accepted}) != stored applications ({rows})")
+        if schedule.active_applicants != rows or schedule.pending_applicants != rows:
+            problems.append(
+                f"counter mismatch: active={schedule.active_applicants} pending={schedule.pending_applicants} rows={rows}"
+            )
+        if drift:
+            problems.append(f"reconcile would fix {drift} schedule(s)")
+    finally:
+        db.close()
+    return problems
+
+
+def main(applicants: int, capacity: int, repeat: int) -> int:
+    schedule_id, user_ids = seed(applicants, capacity)
+    statuses, elapsed = asyncio.run(fire(schedule_id, user_ids, repeat))
+    total = applicants * repeat
+    accepted = statuses.get(200, 0)
+    handled = accepted + statuses.get(400, 0)  # 경합 경로를 끝까지 거친 응답만
+    print(f"schedule={schedule_id} applicants={applicants} repeat={repeat} capacity={capacity}")
+    print(f"{total} requests in {elapsed:.2f}s -> {handled / elapsed:.1f} req/s (200/400 only), status codes: {statuses}")
+
+    problems = verify(schedule_id, capacity, accepted)
+    if handled != total:
+        problems.append(f"{total - handled} response(s) other than 200/400 (503 = load shed or pool timeout)")
+    if accepted != min(applicants, capacity):
+        problems.append(f"expected {min(applicants, capacity)} accepted, got {accepted}")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if not problems:
+        print("OK: capacity respected, no duplicates, counters consistent")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+    if not 0 < args.applicants <= 10000:
+        parser.error("--applicants must be between 1 and 10000")
+    sys.exit(main(args.applicants, args.capacity, args.repeat))
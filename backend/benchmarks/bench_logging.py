@@ -0,0 +1,141 @@
+# backend/benchmarks/bench_logging.py
+"""로그 출력이 요청 지연에 주는 영향 - 핸들러 직접 연결 vs 큐 + 백그라운드 리스너
+
+    cd backend && python -m benchmarks.bench_logging --requests 3000 --concurrency 50 --sink-latency-ms 1
+
+요청마다 --logs-per-request 줄을 남기는 엔드포인트를 동시에 호출하고 p50/p95/p99 를 비교한다.
+출력 대상은 write() 마다 --sink-latency-ms 만큼 막히는 가짜 스트림 (느린 디스크/CloudWatch 전송 흉내).
+- none  : 로그 레벨을 올려 아무것도 출력하지 않음 (하한선)
+- direct: 루트 로거에 JSON StreamHandler 를 직접 연결 (기존 방식)
+- queue : app/logging_config.py 의 DroppingQueueHandler -> BatchingQueueListener -> BatchStreamHandler
+"""
+import argparse
+import asyncio
+import logging
+import queue
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.logging_config import BatchingQueueListener, BatchStreamHandler, DroppingQueueHandler, JsonFormatter
+from benchmarks.report import percentile
+
+logger = logging.getLogger("bench")
+
+
+class SlowStream:
+    """write() 한 번마다 지정한 시간만큼 블로킹되는 출력 대상"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.writes = 0
+        self.lines = 0
+
+    def write(self, text: str):
+        time.sleep(self.latency)
+        self.writes += 1
+        self.lines += text.count("\n")
+
+    def flush(self):
+        pass
+
+
+def build_app(logs_per_request: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work/{item_id}")
+    async def work(item_id: int):
+        for i in range(logs_per_request):
+            logger.info("processed item %s step %s", item_id, i, extra={"item_id": item_id})
+        return {"id": item_id}
+
+    return app
+
+
+def install(mode: str, sink: SlowStream, queue_size: int):
+    """모드별 루트 로거 구성. 정리 함수(버려진 레코드 수 반환)를 돌려준다."""
+    root = logging.getLogger()
+    saved = (root.handlers[:], root.level)
+    if mode == "none":
+        root.handlers = []
+        root.setLevel(logging.WARNING)
+    elif mode == "direct":
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(JsonFormatter())
+        root.handlers = [handler]
+        root.setLevel(logging.INFO)
+    if mode != "queue":
+        def restore():
+            root.handlers = saved[0]
+            root.setLevel(saved[1])
+            return 0
+        return restore
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    handler = BatchStreamHandler(sink)
+    handler.setFormatter(JsonFormatter())
+    listener = BatchingQueueListener(log_queue, handler)
+    queue_handler = DroppingQueueHandler(log_queue)
+    root.handlers = [queue_handler]
+    root.setLevel(logging.INFO)
+    listener.start()
+
+    def restore():
+        listener.stop()
+        handler.flush()
+        root.handlers = saved[0]
+        root.setLevel(saved[1])
+        return queue_handler.dropped
+
+    return restore
+
+
+async def drive(app: FastAPI, requests: int, concurrency: int) -> tuple:
+    latencies = []
+    counter = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for i in counter:
+                started = time.perf_counter()
+                response = await client.get(f"/work/{i}")
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return sorted(latencies), elapsed
+
+
+def main(requests: int, concurrency: int, logs_per_request: int, sink_latency_ms: float, queue_size: int):
+    app = build_app(logs_per_request)
+    print(
+        f"requests={requests} concurrency={concurrency} logs/request={logs_per_request} "
+        f"sink={sink_latency_ms}ms/write queue={queue_size}"
+    )
+    print(f"{'mode':<8} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'writes':>8} {'lines':>8} {'dropped':>8}")
+    for mode in ("none", "direct", "queue"):
+        sink = SlowStream(sink_latency_ms / 1000)
+        restore = install(mode, sink, queue_size)
+        try:
+            values, elapsed = asyncio.run(drive(app, requests, concurrency))
+        finally:
+            dropped = restore()
+        print(
+            f"{mode:<8} {len(values) / elapsed:>8.0f} {percentile(values, 50) * 1000:>7.2f}ms "
+            f"{percentile(values, 95) * 1000:>7.2f}ms {percentile(values, 99) * 1000:>7.2f}ms "
+            f"{sink.writes:>8} {sink.lines:>8} {dropped:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--logs-per-request", type=int, default=3)
+    parser.add_argument("--sink-latency-ms", type=float, default=1.0)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.requests, args.concurrency, args.logs_per_request, args.sink_latency_ms, args.queue_size)
@@ -0,0 +1,81 @@
+# backend/benchmarks/bench_metrics_middleware.py
+"""MetricsMiddleware 오버헤드 측정 - 같은 앱을 미들웨어 없이/있이 ASGI 로 직접 호출
+
+    cd backend && python -m benchmarks.bench_metrics_middleware --requests 20000
+
+네트워크/DB 없이 빈 JSON 응답을 돌려주는 라우트만 호출해 요청당 추가 비용(µs)을 본다.
+/metrics 스크레이프 한 번에 걸리는 시간도 함께 출력한다.
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from app.instrumentation import MetricsMiddleware, metrics_response
+
+
+def build_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/schedules/{schedule_id}")
+    async def read_schedule(schedule_id: int):
+        return {"id": schedule_id}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call(app, path: str):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status = None
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app, requests: int) -> float:
+    for i in range(200):  # 워밍업 (라우터/미들웨어 스택 빌드)
+        await call(app, f"/api/schedules/{i}")
+    started = time.perf_counter()
+    for i in range(requests):
+        await call(app, f"/api/schedules/{i}")
+    return (time.perf_counter() - started) / requests
+
+
+async def run(requests: int, rounds: int):
+    plain, instrumented = build_app(False), build_app(True)
+    assert await call(instrumented, "/api/schedules/1") == 200
+    base, with_metrics = [], []
+    for _ in range(rounds):  # 번갈아 돌려 CPU 클럭 변동 영향을 줄인다
+        base.append(await measure(plain, requests))
+        with_metrics.append(await measure(instrumented, requests))
+    base_us, metrics_us = min(base) * 1e6, min(with_metrics) * 1e6
+    print(f"requests={requests} x {rounds} rounds (best round)")
+    print(f"without middleware    : {base_us:8.1f} µs/req")
+    print(f"with MetricsMiddleware: {metrics_us:8.1f} µs/req  (+{metrics_us - base_us:.1f} µs, {(metrics_us / base_us - 1) * 100:+.1f}%)")
+
+    started = time.perf_counter()
+    body = metrics_response().body
+    print(f"/metrics scrape        : {(time.perf_counter() - started) * 1000:8.2f} ms  ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.rounds))
@@ -0,0 +1,86 @@
+# backend/benchmarks/bench_pagination.py
+"""OFFSET vs 키셋(커서) 페이지네이션 - 페이지 깊이별 지연 비교
+
+    cd backend && python -m benchmarks.bench_pagination --rows 100000
+    cd backend && python -m benchmarks.bench_pagination --database-url postgresql+psycopg2://.../bench
+
+기본값은 임시 SQLite 파일. 지정한 DB에 schedules 테이블을 만들고 rows 개가 될 때까지 채운다.
+(운영 DB를 지정하지 말 것)
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, insert, select
+
+from app import models
+from app.pagination import Keyset
+
+PAGE_SIZE = 100
+
+
+def seed(engine, rows: int):
+    models.Base.metadata.create_all(bind=engine, tables=[models.Schedule.__table__])
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count(models.Schedule.id)))
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        batch = []
+        for i in range(existing, rows):
+            # 하루 여러 개의 근무가 같은 work_date 를 공유하도록 (id 타이브레이커 검증)
+            work_date = base + timedelta(days=i // 20)
+            batch.append({
+                "title": f"shift {i}",
+                "start_time": work_date + timedelta(hours=9),
+                "end_time": work_date + timedelta(hours=18),
+                "start_time_str": "09:00",
+                "end_time_str": "18:00",
+                "work_date": work_date,
+                "capacity": 5,
+                "current_applicants": 0,
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(models.Schedule), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(models.Schedule), batch)
+
+
+def timed(conn, stmt, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(stmt).all()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(database_url: str, rows: int, repeat: int):
+    engine = create_engine(database_url)
+    seed(engine, rows)
+    keyset = Keyset(models.Schedule.work_date, models.Schedule.id)
+    base = select(models.Schedule.id, models.Schedule.work_date, models.Schedule.title)
+
+    print(f"rows={rows} page_size={PAGE_SIZE} (best of {repeat}, ms)")
+    print(f"{'page':>6} {'offset':>10} {'keyset':>10}")
+    with engine.connect() as conn:
+        for page in (1, 10, 100, 250, 500, rows // PAGE_SIZE - 1):
+            offset = page * PAGE_SIZE
+            offset_stmt = base.order_by(*keyset.order_by()).offset(offset).limit(PAGE_SIZE)
+            # 직전 페이지 마지막 행으로 커서를 만든다 (클라이언트가 받은 X-Next-Cursor 와 동일)
+            anchor = conn.execute(
+                select(models.Schedule.work_date, models.Schedule.id)
+                .order_by(*keyset.order_by()).offset(offset - 1).limit(1)
+            ).one()
+            keyset_stmt = keyset.apply(base, keyset.encode(anchor)).limit(PAGE_SIZE)
+            print(f"{page:>6} {timed(conn, offset_stmt, repeat):>10.2f} {timed(conn, keyset_stmt, repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_pagination.db"))
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.database_url, args.rows, args.repeat)
@@ -0,0 +1,63 @@
+# backend/benchmarks/bench_rate_limit.py
+"""로그인 한도 검사 비용 - app/rate_limit.py RateLimiter.check 한 번에 드는 시간 (µs)
+
+    cd backend && python -m benchmarks.bench_rate_limit --calls 200000
+
+로그인 라우트가 부르는 것과 같은 (IP 한도, 계정 한도) 두 버킷 검사를 memory 백엔드로 반복한다.
+- allow : 매번 다른 IP/전화번호 - 새 버킷 생성, RATE_LIMIT_MAX_KEYS 를 넘으면 LRU 제거까지 포함
+- reuse : 같은 키 몇 개를 돌려 쓰며 허용되는 경우 (버킷 갱신)
+- reject: 이미 소진된 버킷 - 429 HTTPException 생성/포착까지 포함
+비교 대상: 로그인 한 번의 DB 조회(~0.5-2ms)와 bcrypt(~250ms).
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from app.rate_limit import MemoryBackend, RateLimit, RateLimiter
+
+LOGIN_IP = RateLimit("login_ip", 60, 60)
+LOGIN_ACCOUNT = RateLimit("login_account", 10, 300)
+UNLIMITED_IP = RateLimit("login_ip", 10**9, 1)
+UNLIMITED_ACCOUNT = RateLimit("login_account", 10**9, 1)
+
+
+async def run(mode: str, calls: int, max_keys: int) -> float:
+    limiter = RateLimiter(MemoryBackend(max_keys))
+    started = time.perf_counter()
+    if mode == "allow":
+        for i in range(calls):
+            await limiter.check((LOGIN_IP, f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"), (LOGIN_ACCOUNT, f"010{i:08d}"))
+    elif mode == "reuse":
+        for i in range(calls):
+            await limiter.check((UNLIMITED_IP, f"10.0.0.{i & 15}"), (UNLIMITED_ACCOUNT, f"010{i & 255:08d}"))
+    else:
+        for _ in range(LOGIN_IP.burst):
+            try:
+                await limiter.check((LOGIN_IP, "10.0.0.1"))
+            except HTTPException:
+                break
+        started = time.perf_counter()
+        for _ in range(calls):
+            try:
+                await limiter.check((LOGIN_IP, "10.0.0.1"), (LOGIN_ACCOUNT, "01000000000"))
+            except HTTPException:
+                pass
+    return time.perf_counter() - started
+
+
+def main(calls: int, max_keys: int):
+    print(f"calls={calls} max_keys={max_keys} (two buckets per check, memory backend)")
+    print(f"{'mode':<7} {'µs/check':>9} {'checks/s':>11}")
+    for mode in ("allow", "reuse", "reject"):
+        elapsed = asyncio.run(run(mode, calls, max_keys))
+        print(f"{mode:<7} {elapsed / calls * 1e6:>9.2f} {calls / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--max-keys", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.calls, args.max_keys)
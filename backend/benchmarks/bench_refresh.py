@@ -0,0 +1,110 @@
+# backend/benchmarks/bench_refresh.py
+"""access token 재발급 비용 - POST /auth/login (bcrypt 검증) vs POST /auth/refresh (HMAC + UPDATE 한 번)
+
+    cd backend && DATABASE_URL=sqlite:////tmp/refresh.db python -m benchmarks.bench_refresh --requests 200 --concurrency 8
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../scratch python -m benchmarks.bench_refresh
+
+전용(스크래치) DB에서 실행할 것. alembic upgrade head 후 --concurrency 명의 승인된 사용자를 만들고,
+사용자마다 한 줄로 login 을 --requests 번 나눠 반복한 뒤, 같은 방식으로 refresh 를 연쇄 호출한다
+(매번 직전 응답의 refresh token 사용 - 실제 클라이언트와 같은 회전). 한도 검사(app/rate_limit.py)는 끈다.
+요청당 SQL 문 수는 X-DB-Query-Count 응답 헤더 평균.
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlalchemy import delete, insert, select
+
+from app import models, security
+from app.database import engine
+from app.hashing import hash_pool
+from app.main import app
+from app.rate_limit import rate_limiter
+from benchmarks.datagen import migrate
+from benchmarks.report import percentile
+
+PASSWORD = "bench-refresh"
+PHONE_PREFIX = "0106"
+
+
+def prepare(users: int) -> list:
+    """벤치마크 사용자 전화번호 목록 (이전 실행분은 지우고 다시 만든다)"""
+    migrate()
+    phones = [f"{PHONE_PREFIX}{i:07d}" for i in range(users)]
+    hashed = security.get_password_hash(PASSWORD)
+    with engine.begin() as conn:
+        user_ids = select(models.User.id).where(models.User.phone_number.in_(phones))
+        conn.execute(delete(models.RefreshTokenFamily).where(models.RefreshTokenFamily.user_id.in_(user_ids)))
+        conn.execute(delete(models.User).where(models.User.phone_number.in_(phones)))
+        conn.execute(insert(models.User), [
+            {
+                "phone_number": phone,
+                "hashed_password": hashed,
+                "role": models.UserRoleEnum.user,
+                "status": models.UserStatusEnum.approved,
+            }
+            for phone in phones
+        ])
+    return phones
+
+
+async def drive(phones: list, requests: int) -> dict:
+    results = {"login": [], "refresh": []}  # 종류 -> [(지연, SQL 문 수)]
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def call(kind: str, path: str, payload: dict) -> dict:
+            started = time.perf_counter()
+            response = await client.post(path, json=payload)
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            results[kind].append((elapsed, int(response.headers.get("X-DB-Query-Count", 0))))
+            return response.json()
+
+        per_user = max(requests // len(phones), 1)
+
+        async def login_chain(phone: str) -> str:
+            for _ in range(per_user):
+                body = await call("login", "/api/auth/login", {"phone_number": phone, "password": PASSWORD})
+            return body["refresh_token"]
+
+        async def refresh_chain(refresh_token: str):
+            for _ in range(per_user):
+                body = await call("refresh", "/api/auth/refresh", {"refresh_token": refresh_token})
+                refresh_token = body["refresh_token"]
+
+        timings = {}
+        started = time.perf_counter()
+        refresh_tokens = await asyncio.gather(*(login_chain(phone) for phone in phones))
+        timings["login"] = time.perf_counter() - started
+        started = time.perf_counter()
+        await asyncio.gather(*(refresh_chain(token) for token in refresh_tokens))
+        timings["refresh"] = time.perf_counter() - started
+    return {kind: (results[kind], timings[kind]) for kind in results}
+
+
+def main(requests: int, concurrency: int):
+    phones = prepare(concurrency)
+    rate_limiter.enabled = False
+    try:
+        results = asyncio.run(drive(phones, requests))
+    finally:
+        hash_pool.shutdown()
+    rounds = security.pwd_context.handler().default_rounds
+    print(f"requests={requests} concurrency={concurrency} db={engine.dialect.name} bcrypt_rounds={rounds}")
+    print(f"{'endpoint':<9} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'sql/req':>8}")
+    for kind, (rows, elapsed) in results.items():
+        values = sorted(latency for latency, _ in rows)
+        queries = sum(count for _, count in rows) / len(rows)
+        print(
+            f"{kind:<9} {len(values) / elapsed:>8.0f} {percentile(values, 50) * 1000:>7.2f}ms "
+            f"{percentile(values, 95) * 1000:>7.2f}ms {percentile(values, 99) * 1000:>7.2f}ms {queries:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="종류별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 사용자 수")
+    args = parser.parse_args()
+    main(args.requests, args.concurrency)
@@ -0,0 +1,141 @@
+# backend/benchmarks/bench_serialization.py
+"""목록 응답 직렬화 전/후 비교 - ORM 엔티티 + response_model vs 컬럼 투영 + orjson
+
+    cd backend && python -m benchmarks.bench_serialization --rows 1000
+    cd backend && python -m benchmarks.bench_serialization --database-url postgresql+psycopg2://.../bench
+
+before: 엔티티 전체 로드(joinedload) -> 행마다 model_validate -> FastAPI response_model 재검증/직렬화
+after : 응답 필드 컬럼만 SELECT -> dict -> orjson (app/projection.py)
+기본값은 임시 SQLite 파일. 지정한 DB에 테이블을 만들고 데이터를 채운다 (운영 DB를 지정하지 말 것).
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+
+from app import models, schemas
+from app.database import to_async_url
+from app.projection import Projection, json_response, my_application_projection
+
+schedule_projection = Projection(schemas.ScheduleWithPendingCount, models.Schedule)
+
+
+def seed(database_url: str, rows: int):
+    engine = create_engine(database_url)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for table in (models.Application, models.Schedule, models.User):
+            conn.execute(delete(table))
+        user_id = conn.execute(
+            insert(models.User).returning(models.User.id),
+            [{"phone_number": "01012345678", "hashed_password": "x", "status": models.UserStatusEnum.approved}],
+        ).scalar_one()
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        schedule_ids = conn.execute(insert(models.Schedule).returning(models.Schedule.id), [
+            {
+                "title": f"shift {i}",
+                "description": "연회장 서빙 / 행사 준비",
+                "start_time": base + timedelta(days=i, hours=9),
+                "end_time": base + timedelta(days=i, hours=18),
+                "start_time_str": "09:00",
+                "end_time_str": "18:00",
+                "work_date": base + timedelta(days=i),
+                "capacity": 10,
+                "current_applicants": 0,
+            }
+            for i in range(rows)
+        ]).scalars().all()
+        conn.execute(insert(models.Application), [
+            {"user_id": user_id, "schedule_id": schedule_id, "status": models.ApplicationStatusEnum.pending}
+            for schedule_id in schedule_ids
+        ])
+    engine.dispose()
+    return user_id
+
+
+def build_app(database_url: str, user_id: int, rows: int) -> FastAPI:
+    async_engine = create_async_engine(to_async_url(database_url))
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def get_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/before/schedules", response_model=List[schemas.ScheduleWithPendingCount])
+    async def schedules_before(db: AsyncSession = Depends(get_db)):
+        results = (await db.execute(select(models.Schedule).order_by(models.Schedule.work_date).limit(rows))).scalars().all()
+        return [schemas.ScheduleWithPendingCount.model_validate(schedule) for schedule in results]
+
+    @app.get("/after/schedules", response_model=List[schemas.ScheduleWithPendingCount])
+    async def schedules_after(db: AsyncSession = Depends(get_db)):
+        result = await db.execute(schedule_projection.select().order_by(models.Schedule.work_date).limit(rows))
+        return json_response(schedule_projection.dump_list([schedule_projection.to_dict(row) for row in result]))
+
+    @app.get("/before/applications", response_model=List[schemas.Application])
+    async def applications_before(db: AsyncSession = Depends(get_db)):
+        result = await db.execute(
+            select(models.Application).where(models.Application.user_id == user_id)
+            .options(joinedload(models.Application.schedule))
+            .order_by(models.Application.created_at.desc())
+        )
+        columns = [c.key for c in models.Application.__table__.columns]
+        # 내 신청 목록은 user 를 싣지 않는다 (null)
+        return [{**{key: getattr(a, key) for key in columns}, "schedule": a.schedule} for a in result.scalars()]
+
+    @app.get("/after/applications", response_model=List[schemas.Application])
+    async def applications_after(db: AsyncSession = Depends(get_db)):
+        result = await db.execute(
+            my_application_projection.select().where(models.Application.user_id == user_id)
+            .order_by(models.Application.created_at.desc())
+        )
+        return json_response(my_application_projection.dump_list([my_application_projection.to_dict(row) for row in result]))
+
+    return app
+
+
+async def run(app: FastAPI, repeat: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in ("schedules", "applications"):
+            timings = {}
+            for variant in ("before", "after"):
+                path = f"/{variant}/{name}"
+                first = await client.get(path)  # 워밍업 + 응답 확인
+                samples = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    resp = await client.get(path)
+                    samples.append(time.perf_counter() - started)
+                assert resp.json() == first.json()
+                samples.sort()
+                timings[variant] = (samples[len(samples) // 2] * 1000, len(first.content))
+            (before, size), (after, _) = timings["before"], timings["after"]
+            print(f"{name:<14} before={before:8.2f}ms  after={after:8.2f}ms  x{before / after:5.2f}  ({size} bytes)")
+            same = (await client.get(f"/before/{name}")).json() == (await client.get(f"/after/{name}")).json()
+            print(f"{'':<14} identical response body: {same}")
+
+
+def main(database_url: str, rows: int, repeat: int):
+    user_id = seed(database_url, rows)
+    print(f"rows={rows} (median of {repeat})")
+    asyncio.run(run(build_app(database_url, user_id, rows), repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_serialization.db"))
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    main(args.database_url, args.rows, args.repeat)
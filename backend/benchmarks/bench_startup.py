@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_startup.py
+"""콜드 스타트 측정 - app.main import 시간과 uvicorn 기동 후 첫 응답까지 걸린 시간
+
+    cd backend && python -m benchmarks.bench_startup --runs 5
+    cd backend && python -m benchmarks.bench_startup --path /ready --path /api/schedules/
+
+매 실행마다 새 프로세스를 띄우므로 import 캐시 없이 측정된다 (.pyc 캐시는 유지).
+DATABASE_URL 이 가리키는 DB를 사용한다. 변경 전후 비교는 이전 커밋을 체크아웃해서 같은 명령으로 측정.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import() -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def measure_first_response(path: str, timeout: float) -> float:
+    """프로세스 생성 시각부터 path 가 처음 2xx 를 돌려줄 때까지의 시간"""
+    port = free_port()
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if client.get(path).is_success:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                if proc.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+                time.sleep(0.005)
+        raise TimeoutError(f"{path} did not respond within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def summary(samples: list) -> str:
+    ms = [s * 1000 for s in samples]
+    return f"p50={statistics.median(ms):8.1f}  min={min(ms):8.1f}  max={max(ms):8.1f}"
+
+
+def main(runs: int, paths: list, timeout: float):
+    print(f"runs={runs} (ms)")
+    print(f"{'import app.main':<28} {summary([measure_import() for _ in range(runs)])}")
+    for path in paths:
+        samples = [measure_first_response(path, timeout) for _ in range(runs)]
+        print(f"{'first response ' + path:<28} {summary(samples)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", action="append", dest="paths", help="측정할 경로 (여러 번 지정 가능, 기본 /health)")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+    main(args.runs, args.paths or ["/health"], args.timeout)
@@ -0,0 +1,102 @@
+# backend/benchmarks/check_query_budgets.py
+"""엔드포인트별 SQL 문 수 상한(쿼리 예산) 검사 - N+1 회귀가 생기면 실패
+
+    cd backend && DATABASE_URL=sqlite:////tmp/budgets.db python -m benchmarks.check_query_budgets
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../scratch python -m benchmarks.check_query_budgets
+
+전용(스크래치) DB에서 실행할 것. 스키마를 만들고 check_query_plans 와 같은 샘플 데이터를 채운 뒤,
+목록 크기와 무관하게 일정해야 하는 조회 API 를 app.query_stats.assert_max_queries 로 감싸 호출한다.
+예산을 넘으면 실행된 문장 목록을 출력하고 종료 코드 1.
+테스트 DB(SQLite)에서는 python -m pytest 가 함께 실행한다 (tests/test_query_checks.py).
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import select
+
+from app import models, security
+from app.calendar_rollup import calendar_rollup
+from app.database import engine
+from app.main import app
+from app.query_stats import assert_max_queries
+from benchmarks.check_query_plans import seed
+from benchmarks.datagen import migrate
+
+# (메서드, 경로, 최대 SQL 문 수) - 인증 사용자는 user_cache 를 미리 채워 두므로 예산에 포함되지 않는다
+BUDGETS = [
+    ("GET", "/api/schedules/?limit=100", 1),
+    ("GET", "/api/schedules/{schedule_id}", 1),
+    ("GET", "/api/schedules/calendar?from={calendar_from}&to={calendar_to}", 2),
+    ("GET", "/api/notices/?limit=100", 1),
+    ("GET", "/api/notices/{notice_id}", 1),
+    ("GET", "/api/admin/users?limit=100", 1),
+    ("GET", "/api/admin/pending-users", 1),
+    ("GET", "/api/applications/schedule/{schedule_id}", 1),
+    ("GET", "/api/mypage/me", 1),
+    ("GET", "/api/mypage/my-applications", 1),
+    ("GET", "/api/mypage/schedule-approved/{schedule_id}", 1),
+]
+
+
+async def check() -> list:
+    """[(메서드, 경로, 실행 문장 수, 예산, 실패 메시지 또는 None)]"""
+    with engine.connect() as conn:
+        # 신청서가 있는 사용자를 관리자로 만들어 my-applications 목록이 여러 건이 되게 한다
+        user_id = conn.scalar(
+            select(models.Application.user_id).order_by(models.Application.user_id).limit(1)
+        )
+        schedule_id = conn.scalar(select(models.Application.schedule_id).where(models.Application.user_id == user_id).limit(1))
+        notice_id = conn.scalar(select(models.Notice.id).limit(1))
+        conn.execute(
+            models.User.__table__.update().where(models.User.id == user_id).values(
+                role=models.UserRoleEnum.super_admin, status=models.UserStatusEnum.approved
+            )
+        )
+        conn.commit()
+    headers = {"Authorization": f"Bearer {security.create_access_token({'id': user_id})}"}
+    await calendar_rollup.rebuild()  # seed 는 INSERT 를 직접 하므로 달력 집계를 채워 둔다
+    today = datetime.now(timezone.utc).date()
+    ids = {
+        "schedule_id": schedule_id,
+        "notice_id": notice_id,
+        "calendar_from": today,
+        "calendar_to": today + timedelta(days=30),
+    }
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://budgets", headers=headers) as client:
+        for method, template, limit in BUDGETS:
+            path = template.format(**ids)
+            await client.get("/api/mypage/me")  # 사용자 캐시를 채워 인증 조회가 예산에 섞이지 않게
+            try:
+                with assert_max_queries(limit, f"{method} {template}") as stats:
+                    response = await client.request(method, path)
+                error = None if response.status_code < 400 else f"HTTP {response.status_code}: {response.text[:200]}"
+            except AssertionError as e:
+                error = str(e)
+            results.append((method, template, stats.count, limit, error))
+    return results
+
+
+def main() -> int:
+    migrate()
+    seed(users=200, schedules=50, notices=60)
+    results = asyncio.run(check())
+    failures = 0
+    for method, template, count, limit, error in results:
+        failures += bool(error)
+        print(f"{'FAIL' if error else 'ok':<5} {count:>3}/{limit:<3} {method} {template}")
+        if error:
+            print("      " + error.replace("\n", "\n      "))
+    print(f"{len(results)} endpoints checked, {failures} over budget or failing")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+    sys.exit(main())
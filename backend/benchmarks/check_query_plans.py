@@ -0,0 +1,216 @@
+# backend/benchmarks/check_query_plans.py
+"""라우터 조회 쿼리 실행 계획 회귀 검사 - 인덱스 없이 테이블 전체를 읽는 쿼리가 있으면 실패
+
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../scratch python -m benchmarks.check_query_plans
+    cd backend && DATABASE_URL=sqlite:////tmp/plans.db python -m benchmarks.check_query_plans
+
+전용(스크래치) DB에서 실행할 것.
+1. alembic upgrade head 로 스키마를 만든다 (마이그레이션이 모델 인덱스를 모두 만드는지도 함께 검증)
+2. 샘플 데이터를 채운 뒤 앱의 조회 API 를 실제로 호출하면서 실행된 SELECT 문을 수집한다
+3. 수집한 문장마다 EXPLAIN 을 돌려 전체 스캔을 찾는다
+   - PostgreSQL: enable_seqscan = off 상태에서도 남는 "Seq Scan" = 쓸 수 있는 인덱스가 없음.
+     선두 컬럼 조건 없이 인덱스 전체를 훑는 Index Scan (필터만 있는 경우 포함)도 실패로 본다.
+   - SQLite: EXPLAIN QUERY PLAN 의 "SCAN <table>" (USING INDEX 없음)
+전체 스캔이 하나라도 있으면 종료 코드 1.
+테스트 DB(SQLite)에서는 python -m pytest 가 함께 실행한다 (tests/test_query_checks.py).
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import event, func, insert, inspect, select, text
+
+from app import models, security
+from app.calendar_rollup import calendar_rollup
+from app.database import async_engine, engine
+from app.main import app
+from benchmarks.datagen import migrate
+
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def seed(users: int, schedules: int, notices: int):
+    with engine.begin() as conn:
+        if conn.scalar(select(func.count(models.User.id))) >= users:
+            return
+        hashed = security.get_password_hash("plans")
+        conn.execute(insert(models.User), [
+            {
+                "phone_number": f"0109{i:07d}",
+                "hashed_password": hashed,
+                "role": models.UserRoleEnum.user,
+                "status": models.UserStatusEnum.pending if i % 10 == 0 else models.UserStatusEnum.approved,
+            }
+            for i in range(users)
+        ])
+        base = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        conn.execute(insert(models.Schedule), [
+            {
+                "title": f"shift {i}",
+                "start_time": base + timedelta(days=i // 5, hours=9),
+                "end_time": base + timedelta(days=i // 5, hours=18),
+                "start_time_str": "09:00",
+                "end_time_str": "18:00",
+                "work_date": base + timedelta(days=i // 5),
+                "capacity": 10,
+            }
+            for i in range(schedules)
+        ])
+        user_ids = conn.scalars(select(models.User.id).order_by(models.User.id)).all()
+        schedule_ids = conn.scalars(select(models.Schedule.id).order_by(models.Schedule.id)).all()
+        statuses = list(models.ApplicationStatusEnum)
+        conn.execute(insert(models.Application), [
+            {"user_id": user_id, "schedule_id": schedule_ids[(n * 7 + k) % len(schedule_ids)], "status": statuses[k % 3]}
+            for n, user_id in enumerate(user_ids)
+            for k in range(3)
+        ])
+        conn.execute(insert(models.Notice), [
+            {"title": f"notice {i}", "content": "body", "view_count": 0, "is_pinned": i % 25 == 0}
+            for i in range(notices)
+        ])
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE"))
+
+
+async def collect_statements() -> dict:
+    """앱의 조회 API 를 호출하면서 실행된 SELECT 문을 {문장: (경로, 파라미터)} 로 모은다."""
+    with engine.connect() as conn:
+        admin_id = conn.scalar(select(models.User.id).order_by(models.User.id).limit(1))
+        schedule_id = conn.scalar(select(models.Application.schedule_id).limit(1))
+        notice_id = conn.scalar(select(models.Notice.id).limit(1))
+        conn.execute(
+            models.User.__table__.update().where(models.User.id == admin_id).values(
+                role=models.UserRoleEnum.super_admin, status=models.UserStatusEnum.approved
+            )
+        )
+        conn.commit()
+    await calendar_rollup.rebuild()  # seed 는 INSERT 를 직접 하므로 달력 집계를 채워 둔다
+    headers = {"Authorization": f"Bearer {security.create_access_token({'id': admin_id})}"}
+    today = datetime.now(timezone.utc).date()
+
+    statements = {}
+    current = {"path": None}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and statement not in statements:
+            statements[statement] = (current["path"], parameters)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://plans", headers=headers) as client:
+            async def call(method: str, path: str, **kwargs):
+                current["path"] = f"{method} {path.split('?')[0]}"
+                return await client.request(method, path, **kwargs)
+
+            first = await call("GET", "/api/schedules/?limit=20")
+            await call("GET", f"/api/schedules/?limit=20&cursor={first.headers.get('X-Next-Cursor', '')}")
+            await call("GET", f"/api/schedules/{schedule_id}")
+            await call("GET", f"/api/schedules/calendar?from={today}&to={today + timedelta(days=30)}")
+            first = await call("GET", "/api/notices/?limit=10")
+            await call("GET", f"/api/notices/?limit=10&cursor={first.headers.get('X-Next-Cursor', '')}")
+            await call("GET", f"/api/notices/{notice_id}")
+            first = await call("GET", "/api/admin/users?limit=50")
+            await call("GET", f"/api/admin/users?limit=50&cursor={first.headers.get('X-Next-Cursor', '')}")
+            await call("GET", "/api/admin/pending-users")
+            await call("GET", f"/api/applications/schedule/{schedule_id}")
+            await call("GET", "/api/mypage/me")
+            await call("GET", "/api/mypage/my-applications")
+            await call("GET", f"/api/mypage/schedule-approved/{schedule_id}")
+            await call("POST", "/api/auth/login", json={"phone_number": "01000000000", "password": "x"})
+            await call("POST", "/api/auth/super-admin-login", json={"username": "nobody", "password": "x"})
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+    return statements
+
+
+def leading_columns() -> dict:
+    """{인덱스 이름: 선두 컬럼} (PK 인덱스 포함)"""
+    inspector = inspect(engine)
+    leading = {}
+    for table in inspector.get_table_names():
+        pk = inspector.get_pk_constraint(table)
+        if pk.get("name") and pk["constrained_columns"]:
+            leading[pk["name"]] = pk["constrained_columns"][0]
+        for index in inspector.get_indexes(table):
+            leading[index["name"]] = index["column_names"][0]
+        for unique in inspector.get_unique_constraints(table):
+            leading[unique["name"]] = unique["column_names"][0]
+    return leading
+
+
+def postgres_scans(node: dict, leading: dict) -> list:
+    """JSON 실행 계획에서 테이블/인덱스 전체를 읽는 노드를 찾는다."""
+    scans = []
+    node_type = node.get("Node Type", "")
+    if node_type == "Seq Scan":
+        scans.append(node["Relation Name"])
+    elif node_type in ("Index Scan", "Index Only Scan", "Bitmap Index Scan"):
+        cond = node.get("Index Cond", "")
+        column = leading.get(node.get("Index Name"))
+        # 조건 없이 정렬 순서만 쓰는 스캔(LIMIT 페이지네이션)은 허용, 선두 컬럼 없는 조건/필터는 전체 스캔
+        if (cond and column and not re.search(rf"\b{column}\b", cond)) or (not cond and node.get("Filter")):
+            scans.append(f"{node.get('Relation Name', node.get('Index Name'))} (full {node['Index Name']})")
+    for child in node.get("Plans", []):
+        scans.extend(postgres_scans(child, leading))
+    return scans
+
+
+async def explain(statements: dict) -> list:
+    """[(경로, 문장, 계획 줄 목록, 전체 스캔 목록)]"""
+    results = []
+    postgres = async_engine.dialect.name == "postgresql"
+    leading = leading_columns()
+    async with async_engine.connect() as conn:
+        if postgres:
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, (path, parameters) in statements.items():
+            if postgres:
+                plan = [row[0] for row in (await conn.exec_driver_sql("EXPLAIN " + statement, parameters)).all()]
+                tree = (await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)).scalar()
+                if isinstance(tree, str):
+                    tree = json.loads(tree)
+                scans = postgres_scans(tree[0]["Plan"], leading)
+            else:
+                rows = (await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)).all()
+                plan = [row[-1] for row in rows]
+                scans = [m.group(1) for m in map(SQLITE_SCAN.match, plan) if m]
+            results.append((path, statement, plan, scans))
+    return results
+
+
+async def check() -> list:
+    # 비동기 엔진 풀이 한 이벤트 루프에 묶이므로 수집과 EXPLAIN 을 같은 루프에서 실행
+    return await explain(await collect_statements())
+
+
+def main(users: int, schedules: int, notices: int, verbose: bool) -> int:
+    migrate()
+    seed(users, schedules, notices)
+    results = asyncio.run(check())
+
+    failures = 0
+    for path, statement, plan, scans in results:
+        if scans:
+            failures += 1
+        print(f"{'FULL SCAN' if scans else 'ok':<9} {path:<45} {', '.join(scans)}")
+        if scans or verbose:
+            print("    " + " ".join(statement.split())[:300])
+            for line in plan:
+                print(f"      {line}")
+    print(f"{len(results)} statements checked, {failures} with full scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--schedules", type=int, default=500)
+    parser.add_argument("--notices", type=int, default=300)
+    parser.add_argument("--verbose", action="store_true", help="통과한 쿼리의 계획도 출력")
+    args = parser.parse_args()
+    sys.exit(main(args.users, args.schedules, args.notices, args.verbose))
@@ -0,0 +1,115 @@
+# backend/benchmarks/check_read_routing.py
+"""복제본 읽기 라우팅/쓰기 후 주 DB 고정(read-your-writes) 검사 - 로컬 DB 두 개로 실행
+
+    cd backend && DATABASE_URL=sqlite:////tmp/primary.db REPLICA_DATABASE_URL=sqlite:////tmp/replica.db \\
+        python -m benchmarks.check_read_routing
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../primary REPLICA_DATABASE_URL=postgresql+psycopg2://.../replica \\
+        python -m benchmarks.check_read_routing
+
+전용(스크래치) DB 두 개에서 실행할 것. 복제는 하지 않으므로 복제본은 "아직 따라오지 못한" 상태를 흉내 낸다:
+주 DB 에 스케줄을 만든 뒤
+- 고정 토큰 없이 조회하면 복제본으로 가서 보이지 않아야 하고
+- 쓰기 응답의 X-Primary-Until 헤더 / primary_until 쿠키를 보내면 주 DB 에서 읽어 보여야 하며
+- 변조되었거나 만료된 토큰은 무시되어야 한다.
+하나라도 어긋나면 종료 코드 1.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+from app import models, security
+from app.database import REPLICA_DATABASE_URL, engine, replica_engine
+from app.main import app
+from app.read_routing import PRIMARY_COOKIE, PRIMARY_HEADER, sign_primary_until
+from benchmarks.datagen import migrate
+
+SCHEDULE = {
+    "title": "read routing check",
+    "start_time": "2030-03-01T09:00:00Z",
+    "end_time": "2030-03-01T18:00:00Z",
+    "start_time_str": "09:00",
+    "end_time_str": "18:00",
+    "work_date": "2030-03-01T00:00:00Z",
+    "capacity": 3,
+}
+
+
+def prepare() -> int:
+    """두 DB 에 스키마를 만들고 주 DB 에만 관리자를 넣는다 (인증 조회는 항상 주 DB)"""
+    migrate()
+    models.Base.metadata.create_all(bind=create_engine(REPLICA_DATABASE_URL))
+    with engine.begin() as conn:
+        return conn.execute(insert(models.User).values(
+            phone_number=f"0107{int(time.time()) % 10_000_000:07d}",
+            hashed_password="-",
+            role=models.UserRoleEnum.super_admin,
+            status=models.UserStatusEnum.approved,
+        ).returning(models.User.id)).scalar_one()
+
+
+async def check(admin_id: int) -> list:
+    """[(검사 이름, 실패 메시지 또는 None)]"""
+    results = []
+
+    def expect(name: str, response: httpx.Response, status_code: int):
+        error = None
+        if response.status_code != status_code:
+            error = f"expected HTTP {status_code}, got {response.status_code}: {response.text[:200]}"
+        results.append((name, error))
+
+    headers = {"Authorization": f"Bearer {security.create_access_token({'id': admin_id})}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://routing", headers=headers) as client:
+        created = await client.post("/api/schedules/", json=SCHEDULE)
+        expect("write succeeds on primary", created, 200)
+        token = created.headers.get(PRIMARY_HEADER)
+        results.append(("write response carries pin header", None if token else f"missing {PRIMARY_HEADER}"))
+        cookie = client.cookies.get(PRIMARY_COOKIE)
+        results.append(("write response sets pin cookie", None if cookie else f"missing {PRIMARY_COOKIE} cookie"))
+        client.cookies.clear()
+        if created.status_code != 200 or not token:
+            return results
+        path = f"/api/schedules/{created.json()['id']}"
+
+        expect("unpinned read goes to replica", await client.get(path), 404)
+        expires, _, signature = token.partition(".")
+        forged = f"{int(expires) + 3600}.{signature}"
+        expect("forged pin is ignored", await client.get(path, headers={PRIMARY_HEADER: forged}), 404)
+        expired = sign_primary_until(int(time.time()) - 1)
+        expect("expired pin is ignored", await client.get(path, headers={PRIMARY_HEADER: expired}), 404)
+        # 아래 고정 조회는 주 DB 결과를 응답 캐시에 넣으므로 고정 없는 조회 검사는 위에서 끝낸다
+        expect("header-pinned read goes to primary", await client.get(path, headers={PRIMARY_HEADER: token}), 200)
+        expect("cookie-pinned read goes to primary", await client.get(path, headers={"Cookie": f"{PRIMARY_COOKIE}={token}"}), 200)
+
+        listed = await client.get("/api/schedules/?limit=100")  # 복제본 결과가 응답 캐시에 들어간다
+        pinned = await client.get("/api/schedules/?limit=100", headers={PRIMARY_HEADER: token})
+        ids = {row["id"] for row in pinned.json()} if pinned.status_code == 200 else set()
+        results.append((
+            "pinned list bypasses replica-filled cache",
+            None if created.json()["id"] in ids and listed.status_code == 200 else "pinned list missing new schedule",
+        ))
+    return results
+
+
+def main() -> int:
+    if replica_engine is None:
+        print("REPLICA_DATABASE_URL 이 설정되지 않았습니다 (주 DB 와 다른 스크래치 DB 를 지정할 것).")
+        return 2
+    results = asyncio.run(check(prepare()))
+    failures = 0
+    for name, error in results:
+        failures += bool(error)
+        print(f"{'FAIL' if error else 'ok':<5} {name}")
+        if error:
+            print("      " + error)
+    print(f"{len(results)} checks, {failures} failing")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# backend/benchmarks/datagen.py
+"""부하 테스트용 합성 데이터 생성기 (같은 --seed 면 같은 데이터)
+
+    cd backend && python -m benchmarks.datagen --schedules 10000 --applications 500000
+    cd backend && DATABASE_URL=postgresql+psycopg2://.../bench python -m benchmarks.datagen --reset
+
+DATABASE_URL 이 가리키는 DB 에 alembic upgrade head 로 스키마를 만든 뒤 채운다 (운영 DB 지정 금지).
+모든 사용자 비밀번호는 PASSWORD, 관리자 계정은 ADMIN_USERNAME (super_admin).
+스케줄 work_date 는 오늘 기준 -30일 ~ +60일에 분포하고, 신청서는 (사용자, 스케줄) 쌍마다 최대 1건.
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import delete, func, insert, select, text
+
+from app import models, security
+from app.counters import reconcile_statement
+from app.database import engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASSWORD = "abcd1234"
+ADMIN_USERNAME = "bench-admin"
+ADMIN_PHONE = "0109999999"  # 10자리 - 생성 사용자(11자리)와 겹치지 않음
+CHUNK = 5000
+
+TITLES = ["연회장 서빙", "객실 정비", "행사 준비", "주방 보조", "프런트 지원", "주차 안내"]
+USER_STATUSES = [models.UserStatusEnum.approved] * 90 + [models.UserStatusEnum.pending] * 8 + [models.UserStatusEnum.rejected] * 2
+APPLICATION_STATUSES = [models.ApplicationStatusEnum.pending] * 5 + [models.ApplicationStatusEnum.approved] * 4 + [models.ApplicationStatusEnum.rejected]
+
+
+def migrate():
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    command.upgrade(config, "head")
+
+
+def _insert_chunks(conn, table, rows):
+    for start in range(0, len(rows), CHUNK):
+        conn.execute(insert(table), rows[start:start + CHUNK])
+
+
+def reset(conn):
+    for table in (models.Application, models.Schedule, models.Notice, models.User):
+        conn.execute(delete(table))
+
+
+def generate(users: int, schedules: int, applications: int, notices: int, seed: int):
+    rng = random.Random(seed)
+    hashed = security.get_password_hash(PASSWORD)  # 한 번만 해시해서 모든 사용자가 공유
+    now = datetime.now(timezone.utc)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{
+            "phone_number": ADMIN_PHONE,
+            "username": ADMIN_USERNAME,
+            "hashed_password": hashed,
+            "role": models.UserRoleEnum.super_admin,
+            "status": models.UserStatusEnum.approved,
+        }])
+        _insert_chunks(conn, models.User, [
+            {
+                "phone_number": f"010{i:08d}",
+                "hashed_password": hashed,
+                "role": models.UserRoleEnum.user,
+                "status": rng.choice(USER_STATUSES),
+                "created_at": now - timedelta(days=rng.uniform(0, 365)),
+            }
+            for i in range(users)
+        ])
+
+        schedule_rows = []
+        for i in range(schedules):
+            work_date = today + timedelta(days=rng.randint(-30, 60))
+            start_hour = rng.choice([7, 9, 10, 14, 17])
+            schedule_rows.append({
+                "title": f"{rng.choice(TITLES)} #{i}",
+                "description": "근무 복장: 검정 정장" if i % 3 == 0 else None,
+                "start_time": work_date + timedelta(hours=start_hour),
+                "end_time": work_date + timedelta(hours=start_hour + 8),
+                "start_time_str": f"{start_hour:02d}:00",
+                "end_time_str": f"{(start_hour + 8) % 24:02d}:00",
+                "work_date": work_date,
+                "capacity": rng.choice([5, 10, 20, 50, 100]),
+            })
+        _insert_chunks(conn, models.Schedule, schedule_rows)
+
+        user_ids = conn.scalars(
+            select(models.User.id).where(models.User.status == models.UserStatusEnum.approved)
+        ).all()
+        schedule_ids = conn.scalars(select(models.Schedule.id)).all()
+        # 스케줄마다 서로 다른 사용자 표본을 뽑아 (user_id, schedule_id) 유니크 제약을 지킨다
+        per_schedule = min(applications // max(len(schedule_ids), 1) + 1, len(user_ids))
+        application_rows = []
+        for schedule_id in schedule_ids:
+            if len(application_rows) >= applications:
+                break
+            for user_id in rng.sample(user_ids, per_schedule):
+                application_rows.append({
+                    "user_id": user_id,
+                    "schedule_id": schedule_id,
+                    "status": rng.choice(APPLICATION_STATUSES),
+                    "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+                })
+        _insert_chunks(conn, models.Application, application_rows[:applications])
+
+        _insert_chunks(conn, models.Notice, [
+            {
+                "title": f"공지 {i}",
+                "content": "근무 관련 안내입니다. " * rng.randint(1, 20),
+                "created_at": now - timedelta(hours=i),
+                "view_count": rng.randint(0, 500),
+                "is_pinned": i < 3,
+            }
+            for i in range(notices)
+        ])
+        # 카운터 컬럼을 실제 신청서 수에 맞춘다
+        conn.execute(reconcile_statement())
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))  # 대량 적재 직후 통계 갱신
+
+
+def main(users: int, schedules: int, applications: int, notices: int, seed: int, do_reset: bool):
+    migrate()
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count(models.User.id)))
+        if existing and do_reset:
+            reset(conn)
+        elif existing:
+            raise SystemExit(f"{existing} users already present - pass --reset to regenerate")
+    started = time.perf_counter()
+    generate(users, schedules, applications, notices, seed)
+    print(
+        f"generated users={users} schedules={schedules} applications<={applications} notices={notices} "
+        f"seed={seed} in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--schedules", type=int, default=10_000)
+    parser.add_argument("--applications", type=int, default=500_000)
+    parser.add_argument("--notices", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="기존 사용자/스케줄/신청서/공지를 지우고 다시 생성")
+    args = parser.parse_args()
+    main(args.users, args.schedules, args.applications, args.notices, args.seed, args.reset)
@@ -0,0 +1,266 @@
+# backend/benchmarks/loadtest.py
+"""프로세스 내 부하 테스트 - 실제 사용 패턴(시나리오 혼합)으로 모든 라우터를 호출하고 엔드포인트별 지연을 보고
+
+    cd backend && python -m benchmarks.datagen --reset --schedules 2000 --applications 50000
+    cd backend && python -m benchmarks.loadtest --duration 30 --concurrency 32 --save before
+    (변경 후) cd backend && python -m benchmarks.loadtest --duration 30 --concurrency 32 --compare before
+
+httpx ASGITransport 로 app.main:app 을 직접 호출한다 (네트워크/외부 서비스 없음).
+모든 가상 사용자가 같은 클라이언트 IP 로 보이므로 로그인/가입 한도(app/rate_limit.py)는 끄고 돌린다
+(--rate-limit 으로 켜면 한도 초과 429 가 그대로 기록된다).
+DATABASE_URL 의 DB 는 benchmarks.datagen 으로 미리 채워 두어야 한다. 쓰기 시나리오가 데이터를 바꾸므로
+같은 조건으로 비교하려면 실행 전마다 datagen --reset 을 다시 돌릴 것.
+
+시나리오 (--mix 로 비중 선택):
+  morning_rush  로그인 -> 내 정보 -> 스케줄 목록 -> 상세 -> (일부) 신청
+  browse        스케줄 목록 2페이지(커서) -> 공지 목록/상세 -> 내 신청 목록 -> 스케줄 승인자 목록
+  apply_cancel  신청 -> 취소
+  admin_burst   관리자 로그인 -> 승인 대기 목록 -> 일괄 승인 -> 사용자 목록 -> 신청자 목록 -> 상태 일괄/단건 변경
+  admin_content 공지 작성/수정/삭제, 스케줄 작성/수정/삭제, 반복 일괄 생성
+  account       회원가입, 비밀번호 변경
+"""
+import argparse
+import asyncio
+import itertools
+import platform
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import select
+
+from app import models, security
+from app.database import engine
+from app.main import app
+from app.rate_limit import rate_limiter
+from benchmarks.datagen import ADMIN_USERNAME, PASSWORD
+from benchmarks.report import Recorder, load_baseline, print_table, save_baseline, summarize
+
+MIXES = {
+    "default": {"morning_rush": 25, "browse": 40, "apply_cancel": 10, "admin_burst": 10, "admin_content": 5, "account": 10},
+    "morning": {"morning_rush": 70, "browse": 30},
+    "admin": {"admin_burst": 60, "admin_content": 40},
+    "read": {"browse": 100},
+}
+
+
+class Pools:
+    """시나리오가 고르는 id 표본 (실행 시작 시 DB에서 한 번 읽음)"""
+
+    def __init__(self, sample: int = 5000):
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        with engine.connect() as conn:
+            self.users = conn.execute(
+                select(models.User.id, models.User.phone_number)
+                .where(models.User.status == models.UserStatusEnum.approved, models.User.role == models.UserRoleEnum.user)
+                .limit(sample)
+            ).all()
+            self.pending_users = conn.scalars(
+                select(models.User.id).where(models.User.status == models.UserStatusEnum.pending).limit(sample)
+            ).all()
+            self.schedules = conn.scalars(
+                select(models.Schedule.id).where(models.Schedule.work_date >= today).limit(sample)
+            ).all()
+            self.applications = conn.scalars(
+                select(models.Application.id).where(models.Application.status == models.ApplicationStatusEnum.pending).limit(sample)
+            ).all()
+            self.notices = conn.scalars(select(models.Notice.id).limit(sample)).all()
+            self.admin_id = conn.scalar(select(models.User.id).where(models.User.username == ADMIN_USERNAME))
+        if not (self.users and self.schedules and self.admin_id):
+            raise SystemExit("no generated data found - run `python -m benchmarks.datagen` first")
+        self.tokens = {user_id: security.create_access_token({"id": user_id}) for user_id, _ in self.users}
+        self.admin_token = security.create_access_token({"id": self.admin_id})
+        self.phone_counter = itertools.count(int(time.time()) % 10_000_000)
+
+
+class Session:
+    """가상 사용자 한 명 - 호출마다 "METHOD 경로템플릿" 단위로 기록"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random, pools: Pools):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.pools = pools
+
+    async def call(self, method: str, template: str, token: str = None, json=None, params=None, **path):
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        started = time.perf_counter()
+        resp = await self.client.request(method, template.format(**path), headers=headers, json=json, params=params)
+        self.recorder.record(f"{method} {template}", time.perf_counter() - started, resp.status_code)
+        return resp
+
+    def user(self):
+        user_id, phone = self.rng.choice(self.pools.users)
+        return user_id, phone, self.pools.tokens[user_id]
+
+
+async def morning_rush(s: Session):
+    _, phone, _ = s.user()
+    resp = await s.call("POST", "/api/auth/login", json={"phone_number": phone, "password": PASSWORD})
+    if resp.status_code != 200:
+        return
+    token = resp.json()["access_token"]
+    await s.call("GET", "/api/mypage/me", token=token)
+    await s.call("GET", "/api/schedules/", params={"limit": 50})
+    schedule_id = s.rng.choice(s.pools.schedules)
+    await s.call("GET", "/api/schedules/{schedule_id}", schedule_id=schedule_id)
+    if s.rng.random() < 0.3:
+        await s.call("POST", "/api/applications/", token=token, json={"schedule_id": schedule_id})
+
+
+async def browse(s: Session):
+    _, _, token = s.user()
+    first = await s.call("GET", "/api/schedules/", params={"limit": 50})
+    cursor = first.headers.get("X-Next-Cursor")
+    if cursor:
+        await s.call("GET", "/api/schedules/", params={"limit": 50, "cursor": cursor})
+    await s.call("GET", "/api/notices/", token=token, params={"limit": 10})
+    if s.pools.notices:
+        await s.call("GET", "/api/notices/{notice_id}", token=token, notice_id=s.rng.choice(s.pools.notices))
+    await s.call("GET", "/api/mypage/my-applications", token=token)
+    await s.call("GET", "/api/mypage/schedule-approved/{schedule_id}", token=token, schedule_id=s.rng.choice(s.pools.schedules))
+
+
+async def apply_cancel(s: Session):
+    _, _, token = s.user()
+    resp = await s.call("POST", "/api/applications/", token=token, json={"schedule_id": s.rng.choice(s.pools.schedules)})
+    if resp.status_code == 200:
+        await s.call("DELETE", "/api/applications/{application_id}", token=token, application_id=resp.json()["id"])
+
+
+async def admin_burst(s: Session):
+    resp = await s.call("POST", "/api/auth/super-admin-login", json={"username": ADMIN_USERNAME, "password": PASSWORD})
+    token = resp.json()["access_token"] if resp.status_code == 200 else s.pools.admin_token
+    await s.call("GET", "/api/admin/pending-users", token=token)
+    if s.pools.pending_users:
+        user_ids = s.rng.sample(s.pools.pending_users, min(20, len(s.pools.pending_users)))
+        await s.call("POST", "/api/admin/approve-users", token=token, json={"user_ids": user_ids, "status": "approved"})
+    first = await s.call("GET", "/api/admin/users", token=token, params={"limit": 100})
+    if first.headers.get("X-Next-Cursor"):
+        await s.call("GET", "/api/admin/users", token=token, params={"limit": 100, "cursor": first.headers["X-Next-Cursor"]})
+    await s.call("GET", "/api/applications/schedule/{schedule_id}", token=token, schedule_id=s.rng.choice(s.pools.schedules))
+    if s.pools.applications:
+        application_ids = s.rng.sample(s.pools.applications, min(10, len(s.pools.applications)))
+        new_status = s.rng.choice(["approved", "rejected", "pending"])
+        await s.call("POST", "/api/admin/applications/update-status-bulk", token=token,
+                     json={"application_ids": application_ids, "new_status": new_status})
+        await s.call("POST", "/api/admin/applications/update-status", token=token,
+                     json={"application_id": s.rng.choice(s.pools.applications), "new_status": new_status})
+
+
+async def admin_content(s: Session):
+    token = s.pools.admin_token
+    resp = await s.call("POST", "/api/notices/", token=token, json={"title": "부하 테스트 공지", "content": "내용", "is_pinned": False})
+    if resp.status_code == 200:
+        notice_id = resp.json()["id"]
+        await s.call("PUT", "/api/notices/{notice_id}", token=token, notice_id=notice_id,
+                     json={"title": "수정된 공지", "content": "수정", "is_pinned": False})
+        await s.call("DELETE", "/api/notices/{notice_id}", token=token, notice_id=notice_id)
+
+    work_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=s.rng.randint(1, 30))
+    body = {
+        "title": "부하 테스트 근무",
+        "start_time": (work_date + timedelta(hours=9)).isoformat(),
+        "end_time": (work_date + timedelta(hours=18)).isoformat(),
+        "start_time_str": "09:00",
+        "end_time_str": "18:00",
+        "work_date": work_date.isoformat(),
+        "capacity": 10,
+    }
+    resp = await s.call("POST", "/api/schedules/", token=token, json=body)
+    if resp.status_code == 200:
+        schedule_id = resp.json()["id"]
+        await s.call("PUT", "/api/schedules/{schedule_id}", token=token, schedule_id=schedule_id, json={**body, "capacity": 12})
+        await s.call("DELETE", "/api/schedules/{schedule_id}", token=token, schedule_id=schedule_id)
+    if s.rng.random() < 0.2:
+        start = date.today() + timedelta(days=s.rng.randint(1, 60))
+        await s.call("POST", "/api/schedules/bulk", token=token, json={"recurrence": {
+            "title": "부하 테스트 반복 근무",
+            "weekdays": [0, 2, 4],
+            "date_from": start.isoformat(),
+            "date_to": (start + timedelta(days=13)).isoformat(),
+            "start_time_str": "09:00",
+            "end_time_str": "18:00",
+            "capacity": 5,
+        }})
+
+
+async def account(s: Session):
+    phone = f"011{next(s.pools.phone_counter) % 100_000_000:08d}"
+    await s.call("POST", "/api/auth/register", json={"phone_number": phone})
+    _, _, token = s.user()
+    await s.call("PUT", "/api/auth/change-password", token=token,
+                 json={"old_password": PASSWORD, "new_password": PASSWORD})
+
+
+SCENARIOS = {
+    "morning_rush": morning_rush,
+    "browse": browse,
+    "apply_cancel": apply_cancel,
+    "admin_burst": admin_burst,
+    "admin_content": admin_content,
+    "account": account,
+}
+
+
+async def run(mix: dict, duration: float, concurrency: int, seed: int) -> tuple:
+    pools = Pools()
+    recorder = Recorder()
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    deadline = time.perf_counter() + duration
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+        async def virtual_user(index: int):
+            session = Session(client, recorder, random.Random(seed + index), pools)
+            while time.perf_counter() < deadline:
+                scenario = session.rng.choices(names, weights)[0]
+                await SCENARIOS[scenario](session)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return recorder, elapsed
+
+
+def main(mix_name: str, duration: float, concurrency: int, seed: int, save: str, compare: str, rate_limit: bool):
+    mix = MIXES[mix_name]
+    rate_limiter.enabled = rate_limit
+    recorder, elapsed = asyncio.run(run(mix, duration, concurrency, seed))
+    summary = summarize(recorder, elapsed)
+
+    baseline = None
+    if compare:
+        saved = load_baseline(compare)
+        baseline = saved["endpoints"]
+        meta = saved["meta"]
+        if (meta["mix"], meta["concurrency"], meta["database"]) != (mix_name, concurrency, engine.dialect.name):
+            print(f"note: baseline was recorded with mix={meta['mix']} concurrency={meta['concurrency']} db={meta['database']}")
+    print(f"mix={mix_name} concurrency={concurrency} duration={elapsed:.1f}s db={engine.dialect.name} (latency ms)")
+    print_table(summary, baseline)
+    if save:
+        meta = {
+            "mix": mix_name,
+            "concurrency": concurrency,
+            "duration": round(elapsed, 2),
+            "seed": seed,
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        print(f"saved baseline: {save_baseline(save, summary, meta)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="결과를 benchmarks/baselines/<이름>.json 으로 저장 (경로도 가능)")
+    parser.add_argument("--compare", help="저장된 기준선과 p95/처리량 비교")
+    parser.add_argument("--rate-limit", action="store_true", help="로그인/가입 한도를 켠 채로 실행")
+    args = parser.parse_args()
+    main(args.mix, args.duration, args.concurrency, args.seed, args.save, args.compare, args.rate_limit)
@@ -0,0 +1,96 @@
+# backend/benchmarks/report.py
+"""부하 테스트 결과 집계 - 엔드포인트별 p50/p95/p99, 처리량, 오류 수 및 기준선 저장/비교"""
+import json
+import math
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+TOTAL = "TOTAL"
+
+
+class Recorder:
+    """엔드포인트("METHOD /경로/템플릿")별 지연 시간과 상태 코드 수집"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, seconds: float, status_code: int):
+        self.latencies[endpoint].append(seconds)
+        self.statuses[endpoint][status_code] += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _stats(latencies: List[float], statuses: Dict[int, int], elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        "4xx": sum(n for code, n in statuses.items() if 400 <= code < 500),
+        "5xx": sum(n for code, n in statuses.items() if code >= 500),
+    }
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, dict]:
+    summary = {
+        endpoint: _stats(latencies, recorder.statuses[endpoint], elapsed)
+        for endpoint, latencies in sorted(recorder.latencies.items())
+    }
+    all_statuses = defaultdict(int)
+    for statuses in recorder.statuses.values():
+        for code, n in statuses.items():
+            all_statuses[code] += n
+    summary[TOTAL] = _stats([v for values in recorder.latencies.values() for v in values], all_statuses, elapsed)
+    return summary
+
+
+def _delta(current: float, previous: Optional[float]) -> str:
+    if not previous:
+        return ""
+    return f"{(current - previous) / previous * 100:+.0f}%"
+
+
+def print_table(summary: Dict[str, dict], baseline: Optional[Dict[str, dict]] = None):
+    header = f"{'endpoint':<52} {'n':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'4xx':>6} {'5xx':>5}"
+    if baseline:
+        header += f" {'Δp95':>7} {'Δrps':>7}"
+    print(header)
+    for endpoint, stats in summary.items():
+        line = (
+            f"{endpoint:<52} {stats['count']:>7} {stats['rps']:>8.1f} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['4xx']:>6} {stats['5xx']:>5}"
+        )
+        if baseline:
+            previous = baseline.get(endpoint, {})
+            line += f" {_delta(stats['p95_ms'], previous.get('p95_ms')):>7} {_delta(stats['rps'], previous.get('rps')):>7}"
+        print(line)
+
+
+def baseline_path(name: str) -> str:
+    return name if name.endswith(".json") else os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name: str, summary: Dict[str, dict], meta: dict) -> str:
+    path = baseline_path(name)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "endpoints": summary}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_baseline(name: str) -> dict:
+    with open(baseline_path(name)) as f:
+        return json.load(f)
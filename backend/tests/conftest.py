@@ -0,0 +1,163 @@
+# backend/tests/conftest.py
+"""테스트 공용 fixture - 임시 SQLite 파일 DB 에 alembic upgrade head 를 한 번 적용하고 테스트마다 행을 비운다
+
+    cd backend && pip install -r requirements-dev.txt && python -m pytest -q
+
+app 모듈은 import 시점에 환경 변수를 읽으므로 app 을 import 하기 전에 설정한다.
+"""
+import itertools
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+_DB_DIR = tempfile.mkdtemp(prefix="parktel-tests-")
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}",
+    "PASSWORD_HASH_WORKERS": "0",  # 프로세스 풀 대신 스레드풀 (spawn 없음)
+    "BCRYPT_MIN_ROUNDS": "4",
+    "BCRYPT_ROUNDS": "4",
+    "RATE_LIMIT_ENABLED": "0",  # 한도 테스트는 rate_limiter 를 직접 켠다
+})
+for _name in ("ASYNC_DATABASE_URL", "REPLICA_DATABASE_URL", "ASYNC_REPLICA_DATABASE_URL"):
+    os.environ.pop(_name, None)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app import models, security  # noqa: E402
+from app.cache import schedule_cache  # noqa: E402
+from app.calendar_rollup import calendar_rollup  # noqa: E402
+from app.counters import reconcile_statement  # noqa: E402
+from app.database import async_engine, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.user_cache import user_cache  # noqa: E402
+from app.view_counter import notice_views  # noqa: E402
+from benchmarks.datagen import migrate  # noqa: E402
+
+PASSWORD = "test-password"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    migrate()
+    yield
+    engine.dispose()
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    yield
+    with engine.begin() as conn:
+        for table in reversed(models.Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    schedule_cache.bump()
+    user_cache.clear()
+    calendar_rollup._days.clear()
+    calendar_rollup._schedule_ids.clear()
+    notice_views._pending.clear()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client(anyio_backend):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    # 비동기 엔진 풀은 이벤트 루프에 묶이므로 테스트(루프)마다 비운다
+    await async_engine.dispose()
+
+
+_phones = itertools.count()
+
+
+@pytest.fixture
+def make_user():
+    """사용자를 만들고 id 반환 - password 를 주면 로그인 가능한 해시를 넣는다"""
+    def create(
+        role=models.UserRoleEnum.user,
+        status=models.UserStatusEnum.approved,
+        password=None,
+        phone=None,
+        username=None,
+    ) -> int:
+        with engine.begin() as conn:
+            return conn.execute(insert(models.User).values(
+                phone_number=phone or f"0105{next(_phones):07d}",
+                username=username,
+                hashed_password=security.get_password_hash(password) if password else "-",
+                role=role,
+                status=status,
+            ).returning(models.User.id)).scalar_one()
+    return create
+
+
+@pytest.fixture
+def make_schedule():
+    """스케줄을 만들고 id 반환 (카운터 0)"""
+    def create(capacity: int = 3, days: int = 1) -> int:
+        work_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=days)
+        with engine.begin() as conn:
+            return conn.execute(insert(models.Schedule).values(
+                title="test shift",
+                start_time=work_date + timedelta(hours=9),
+                end_time=work_date + timedelta(hours=18),
+                start_time_str="09:00",
+                end_time_str="18:00",
+                work_date=work_date,
+                capacity=capacity,
+            ).returning(models.Schedule.id)).scalar_one()
+    return create
+
+
+@pytest.fixture
+def make_application():
+    """신청서를 직접 넣고 스케줄 카운터를 다시 맞춘 뒤 id 반환 (API 로 만들 수 없는 상태 준비용)"""
+    def create(user_id: int, schedule_id: int, status=models.ApplicationStatusEnum.pending) -> int:
+        with engine.begin() as conn:
+            app_id = conn.execute(insert(models.Application).values(
+                user_id=user_id, schedule_id=schedule_id, status=status,
+            ).returning(models.Application.id)).scalar_one()
+            conn.execute(reconcile_statement())
+        return app_id
+    return create
+
+
+@pytest.fixture
+def auth_headers():
+    def headers(user_id: int) -> dict:
+        return {"Authorization": f"Bearer {security.create_access_token({'id': user_id})}"}
+    return headers
+
+
+@pytest.fixture
+def counter_drift():
+    """카운터가 실제 신청서 수와 다른 스케줄 수 (0 이어야 정상) - 바로잡지 않고 롤백한다"""
+    def drift() -> int:
+        with engine.connect() as conn:
+            with conn.begin() as tx:
+                count = conn.execute(reconcile_statement()).rowcount
+                tx.rollback()
+        return count
+    return drift
+
+
+@pytest.fixture
+def schedule_counters():
+    """(current, pending, active, capacity)"""
+    def counters(schedule_id: int) -> tuple:
+        with engine.connect() as conn:
+            schedule = models.Schedule.__table__
+            return tuple(conn.execute(
+                schedule.select().with_only_columns(
+                    schedule.c.current_applicants, schedule.c.pending_applicants,
+                    schedule.c.active_applicants, schedule.c.capacity,
+                ).where(schedule.c.id == schedule_id)
+            ).one())
+    return counters
@@ -0,0 +1,145 @@
+# backend/tests/test_admin_status.py
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.database import engine
+from app.models import Application, ApplicationStatusEnum, UserRoleEnum
+
+pytestmark = pytest.mark.anyio
+
+PENDING, APPROVED, REJECTED = ApplicationStatusEnum.pending, ApplicationStatusEnum.approved, ApplicationStatusEnum.rejected
+
+
+@pytest.fixture
+def admin(make_user, auth_headers):
+    return auth_headers(make_user(role=UserRoleEnum.admin))
+
+
+def status_of(application_id: int) -> str:
+    with engine.connect() as conn:
+        return conn.scalar(select(Application.status).where(Application.id == application_id)).value
+
+
+async def update_status(client, headers, application_id, new_status):
+    return await client.post(
+        "/api/admin/applications/update-status",
+        json={"application_id": application_id, "new_status": new_status.value},
+        headers=headers,
+    )
+
+
+async def test_approve_pending(client, admin, make_user, make_schedule, make_application, schedule_counters):
+    schedule_id = make_schedule(capacity=1)
+    app_id = make_application(make_user(), schedule_id)
+    response = await update_status(client, admin, app_id, APPROVED)
+    assert response.status_code == 200
+    assert response.json()["status"] == "approved"
+    assert schedule_counters(schedule_id) == (1, 0, 1, 1)
+
+
+async def test_rejected_cannot_take_seat_held_by_pending(client, admin, make_user, make_schedule, make_application, schedule_counters):
+    schedule_id = make_schedule(capacity=1)
+    make_application(make_user(), schedule_id)  # 대기 중인 신청이 마지막 자리를 잡고 있다
+    rejected_id = make_application(make_user(), schedule_id, REJECTED)
+
+    for new_status in (APPROVED, PENDING):
+        response = await update_status(client, admin, rejected_id, new_status)
+        assert response.status_code == 400
+    assert status_of(rejected_id) == "rejected"
+    assert schedule_counters(schedule_id) == (0, 1, 1, 1)
+
+
+async def test_concurrent_approvals_respect_capacity(client, admin, make_user, make_schedule, make_application, schedule_counters, counter_drift):
+    schedule_id = make_schedule(capacity=1)
+    rejected = [make_application(make_user(), schedule_id, REJECTED) for _ in range(4)]
+    responses = await asyncio.gather(*(update_status(client, admin, app_id, APPROVED) for app_id in rejected))
+
+    assert sorted(r.status_code for r in responses) == [200, 400, 400, 400]
+    assert schedule_counters(schedule_id) == (1, 0, 1, 1)
+    assert counter_drift() == 0
+
+
+async def test_concurrent_changes_to_same_application(client, admin, make_user, make_schedule, make_application, counter_drift):
+    schedule_id = make_schedule(capacity=3)
+    app_id = make_application(make_user(), schedule_id)
+    responses = await asyncio.gather(
+        *(update_status(client, admin, app_id, status) for status in (APPROVED, REJECTED, APPROVED, REJECTED))
+    )
+    # 먼저 읽은 상태가 바뀌었으면 409 - 어느 쪽이든 카운터는 최종 상태와 맞아야 한다
+    assert {r.status_code for r in responses} <= {200, 409}
+    assert counter_drift() == 0
+
+
+async def test_unknown_application(client, admin):
+    assert (await update_status(client, admin, 999_999, APPROVED)).status_code == 404
+
+
+async def update_bulk(client, headers, application_ids, new_status):
+    return await client.post(
+        "/api/admin/applications/update-status-bulk",
+        json={"application_ids": application_ids, "new_status": new_status.value},
+        headers=headers,
+    )
+
+
+async def test_bulk_counts_seats_held_by_pending(client, admin, make_user, make_schedule, make_application, schedule_counters, counter_drift):
+    schedule_id = make_schedule(capacity=2)
+    pending_id = make_application(make_user(), schedule_id)
+    first_rejected = make_application(make_user(), schedule_id, REJECTED)
+    second_rejected = make_application(make_user(), schedule_id, REJECTED)
+
+    response = await update_bulk(client, admin, [second_rejected, pending_id, first_rejected], APPROVED)
+    assert response.status_code == 200
+    results = {item["id"]: item for item in response.json()["results"]}
+    assert results[pending_id]["ok"] and results[first_rejected]["ok"]  # 신청 시간순으로 남은 한 자리
+    assert not results[second_rejected]["ok"]
+    assert response.json()["updated"] == 2
+    assert schedule_counters(schedule_id) == (2, 0, 2, 2)
+    assert counter_drift() == 0
+
+
+async def test_bulk_reopen_rejected_respects_capacity(client, admin, make_user, make_schedule, make_application, schedule_counters):
+    schedule_id = make_schedule(capacity=1)
+    make_application(make_user(), schedule_id, APPROVED)
+    rejected_id = make_application(make_user(), schedule_id, REJECTED)
+
+    response = await update_bulk(client, admin, [rejected_id], PENDING)
+    assert response.json()["results"][0]["ok"] is False
+    assert status_of(rejected_id) == "rejected"
+    assert schedule_counters(schedule_id) == (1, 0, 1, 1)
+
+
+async def test_bulk_across_schedules(client, admin, make_user, make_schedule, make_application, schedule_counters, counter_drift):
+    full = make_schedule(capacity=1)
+    open_ = make_schedule(capacity=5)
+    make_application(make_user(), full)
+    blocked = make_application(make_user(), full, REJECTED)
+    allowed = [make_application(make_user(), open_, REJECTED) for _ in range(2)]
+
+    response = await update_bulk(client, admin, [blocked, *allowed, 999_999], APPROVED)
+    results = {item["id"]: item for item in response.json()["results"]}
+    assert [results[app_id]["ok"] for app_id in (blocked, *allowed, 999_999)] == [False, True, True, False]
+    assert schedule_counters(open_) == (2, 0, 2, 5)
+    assert counter_drift() == 0
+
+
+async def test_bulk_reject_frees_seats(client, admin, make_user, make_schedule, make_application, schedule_counters):
+    schedule_id = make_schedule(capacity=2)
+    ids = [make_application(make_user(), schedule_id), make_application(make_user(), schedule_id, APPROVED)]
+    assert (await update_bulk(client, admin, ids, REJECTED)).json()["updated"] == 2
+    assert schedule_counters(schedule_id) == (0, 0, 0, 2)
+
+
+async def test_concurrent_bulk_and_single_approvals(client, admin, make_user, make_schedule, make_application, schedule_counters, counter_drift):
+    schedule_id = make_schedule(capacity=2)
+    rejected = [make_application(make_user(), schedule_id, REJECTED) for _ in range(6)]
+    await asyncio.gather(
+        update_bulk(client, admin, rejected[:3], APPROVED),
+        update_bulk(client, admin, rejected[3:], APPROVED),
+        *(update_status(client, admin, app_id, APPROVED) for app_id in rejected[::2]),
+    )
+    current, pending, active, capacity = schedule_counters(schedule_id)
+    assert current == active == capacity == 2
+    assert counter_drift() == 0
@@ -0,0 +1,153 @@
+# backend/tests/test_admission.py
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.admission import ADMISSION_RETRY_AFTER, PRIORITY_HIGH, PRIORITY_LOW, AdmissionController, AdmissionMiddleware
+from app.models import UserRoleEnum
+from app.routers import admin, applications
+
+pytestmark = pytest.mark.anyio
+
+
+async def pool_exhausted(*args, **kwargs):
+    raise PoolTimeoutError("QueuePool limit of size 10 overflow 5 reached, connection timed out")
+
+
+async def test_pool_timeout_on_apply_is_503(client, make_user, make_schedule, auth_headers, monkeypatch):
+    monkeypatch.setattr(applications, "_reserve_and_insert", pool_exhausted)
+    response = await client.post(
+        "/api/applications/", json={"schedule_id": make_schedule()}, headers=auth_headers(make_user())
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+
+
+async def test_pool_timeout_on_status_change_is_503(client, make_user, make_schedule, make_application, auth_headers, monkeypatch):
+    def exhausted(*args):
+        raise PoolTimeoutError("connection timed out")
+
+    app_id = make_application(make_user(), make_schedule())
+    monkeypatch.setattr(admin, "counter_update", exhausted)
+    response = await client.post(
+        "/api/admin/applications/update-status",
+        json={"application_id": app_id, "new_status": "approved"},
+        headers=auth_headers(make_user(role=UserRoleEnum.admin)),
+    )
+    assert response.status_code == 503
+
+
+async def test_queue_admits_higher_priority_first():
+    controller = AdmissionController(limit=1, queue_size=2, max_wait=1)
+    assert await controller.acquire(PRIORITY_LOW) is None
+    order = []
+
+    async def wait(name, priority):
+        assert await controller.acquire(priority) is None
+        order.append(name)
+        controller.release()
+
+    waiters = [asyncio.create_task(wait("low", PRIORITY_LOW)), asyncio.create_task(wait("high", PRIORITY_HIGH))]
+    await asyncio.sleep(0)
+    assert await controller.acquire(PRIORITY_LOW) == "queue_full"
+    controller.release()
+    await asyncio.gather(*waiters)
+    assert order == ["high", "low"]
+
+
+class Gate:
+    """요청마다 release 될 때까지 붙잡아 두는 ASGI 앱 - 슬롯을 차지한 상태를 만든다"""
+
+    def __init__(self):
+        self.opened = asyncio.Event()
+        self.entered = 0
+
+    async def __call__(self, scope, receive, send):
+        self.entered += 1
+        await self.opened.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def call(middleware, path, method="GET"):
+    """(status, headers)"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "query_string": b""}
+    await middleware(scope, receive, send)
+    start = messages[0]
+    return start["status"], {k.decode().lower(): v.decode() for k, v in start["headers"]}
+
+
+@pytest.fixture
+def gated():
+    """limit=1 인 AdmissionMiddleware - 반환값 (middleware, gate, controller)"""
+    def build(queue_size, max_wait=5):
+        gate = Gate()
+        controller = AdmissionController(limit=1, queue_size=queue_size, max_wait=max_wait)
+        return AdmissionMiddleware(gate, controller), gate, controller
+    return build
+
+
+def assert_overloaded(response):
+    status, headers = response
+    assert status == 503
+    assert headers["retry-after"] == str(ADMISSION_RETRY_AFTER)
+
+
+async def test_queue_full_is_503(gated):
+    middleware, gate, _ = gated(queue_size=0)
+    holder = asyncio.create_task(call(middleware, "/api/mypage/me"))
+    await asyncio.sleep(0)
+    assert_overloaded(await call(middleware, "/api/mypage/me"))
+    gate.opened.set()
+    assert (await holder)[0] == 200
+
+
+async def test_evicted_is_503(gated):
+    middleware, gate, _ = gated(queue_size=1)
+    holder = asyncio.create_task(call(middleware, "/api/mypage/me"))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(call(middleware, "/api/schedules/"))  # 대기열의 낮은 우선순위
+    await asyncio.sleep(0)
+    high = asyncio.create_task(call(middleware, "/api/admin/users"))  # 자리를 빼앗는다
+    assert_overloaded(await low)
+    gate.opened.set()
+    assert (await holder)[0] == 200 and (await high)[0] == 200
+
+
+async def test_wait_timeout_is_503(gated):
+    middleware, gate, controller = gated(queue_size=5, max_wait=0.05)
+    holder = asyncio.create_task(call(middleware, "/api/mypage/me"))
+    await asyncio.sleep(0)
+    assert_overloaded(await call(middleware, "/api/mypage/me"))
+    assert controller.waiting == 0
+    gate.opened.set()
+    await holder
+    assert controller.in_flight == 0
+
+
+def test_admission_switch_leaves_middleware_out():
+    # app.main 은 import 시점에 미들웨어를 설치하므로 새 프로세스에서 확인한다
+    check = (
+        "from app.admission import AdmissionMiddleware; from app.main import app; "
+        "print(any(m.cls is AdmissionMiddleware for m in app.user_middleware))"
+    )
+    results = [
+        subprocess.run(
+            [sys.executable, "-c", check], env={**os.environ, "ADMISSION_ENABLED": value},
+            capture_output=True, text=True, check=True,
+        ).stdout.split()[-1]
+        for value in ("0", "1")
+    ]
+    assert results == ["False", "True"]
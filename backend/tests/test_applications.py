@@ -0,0 +1,95 @@
+# backend/tests/test_applications.py
+import asyncio
+
+import pytest
+
+from app.models import ApplicationStatusEnum, UserRoleEnum
+
+pytestmark = pytest.mark.anyio
+
+
+async def apply(client, headers, schedule_id):
+    return await client.post("/api/applications/", json={"schedule_id": schedule_id}, headers=headers)
+
+
+async def test_apply_reserves_seat(client, make_user, make_schedule, auth_headers, schedule_counters):
+    schedule_id = make_schedule(capacity=2)
+    response = await apply(client, auth_headers(make_user()), schedule_id)
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert schedule_counters(schedule_id) == (0, 1, 1, 2)
+
+
+async def test_apply_rejects_duplicate_and_full(client, make_user, make_schedule, auth_headers, schedule_counters, counter_drift):
+    schedule_id = make_schedule(capacity=1)
+    first = auth_headers(make_user())
+    assert (await apply(client, first, schedule_id)).status_code == 200
+
+    duplicate = await apply(client, first, schedule_id)
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "이미 신청한 스케줄입니다."
+
+    full = await apply(client, auth_headers(make_user()), schedule_id)
+    assert full.status_code == 400
+    assert full.json()["detail"] == "근무 인원이 초과되었습니다."
+    assert schedule_counters(schedule_id) == (0, 1, 1, 1)
+    assert counter_drift() == 0
+
+
+async def test_apply_unknown_schedule(client, make_user, auth_headers):
+    response = await apply(client, auth_headers(make_user()), 999_999)
+    assert response.status_code == 404
+
+
+async def test_concurrent_applications_never_exceed_capacity(client, make_user, make_schedule, auth_headers, schedule_counters, counter_drift):
+    schedule_id = make_schedule(capacity=3)
+    users = [auth_headers(make_user()) for _ in range(10)]
+    responses = await asyncio.gather(*(apply(client, headers, schedule_id) for headers in users))
+
+    assert sorted(r.status_code for r in responses) == [200] * 3 + [400] * 7
+    assert schedule_counters(schedule_id) == (0, 3, 3, 3)
+    assert counter_drift() == 0
+
+
+async def test_cancel_pending_releases_seat(client, make_user, make_schedule, auth_headers, schedule_counters):
+    schedule_id = make_schedule(capacity=1)
+    headers = auth_headers(make_user())
+    app_id = (await apply(client, headers, schedule_id)).json()["id"]
+
+    assert (await client.delete(f"/api/applications/{app_id}", headers=headers)).status_code == 204
+    assert schedule_counters(schedule_id) == (0, 0, 0, 1)
+    assert (await apply(client, auth_headers(make_user()), schedule_id)).status_code == 200
+
+
+async def test_cancel_checks_owner_and_status(client, make_user, make_schedule, make_application, auth_headers, schedule_counters):
+    schedule_id = make_schedule(capacity=2)
+    owner, approved_owner = make_user(), make_user()
+    pending_id = make_application(owner, schedule_id)
+    approved_id = make_application(approved_owner, schedule_id, ApplicationStatusEnum.approved)
+
+    other = await client.delete(f"/api/applications/{pending_id}", headers=auth_headers(make_user()))
+    assert other.status_code == 403
+    approved = await client.delete(f"/api/applications/{approved_id}", headers=auth_headers(approved_owner))
+    assert approved.status_code == 400
+    missing = await client.delete("/api/applications/999999", headers=auth_headers(owner))
+    assert missing.status_code == 404
+    assert schedule_counters(schedule_id) == (1, 1, 2, 2)
+
+
+async def test_cancel_racing_admin_approval_keeps_counters(client, make_user, make_schedule, auth_headers, counter_drift):
+    admin = auth_headers(make_user(role=UserRoleEnum.admin))
+    schedule_id = make_schedule(capacity=20)
+    for _ in range(10):
+        headers = auth_headers(make_user())
+        app_id = (await apply(client, headers, schedule_id)).json()["id"]
+        cancel, approve = await asyncio.gather(
+            client.delete(f"/api/applications/{app_id}", headers=headers),
+            client.post(
+                "/api/admin/applications/update-status",
+                json={"application_id": app_id, "new_status": "approved"},
+                headers=admin,
+            ),
+        )
+        # 취소가 먼저면 승인은 404/409, 승인이 먼저면 취소는 400
+        assert (cancel.status_code == 204) != (approve.status_code == 200)
+    assert counter_drift() == 0
@@ -0,0 +1,122 @@
+# backend/tests/test_cache.py
+import pytest
+from starlette.requests import Request
+
+from app import cache
+from app.cache import VersionedResponseCache
+from app.models import UserRoleEnum
+
+
+def make_request(path="/api/schedules/", replica=False) -> Request:
+    request = Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []})
+    if replica:
+        request.state.read_replica = True  # get_read_db 가 복제본 세션을 골랐을 때
+    return request
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_replica_read_right_after_bump_is_not_cached(clock):
+    response_cache = VersionedResponseCache(ttl=60, max_entries=8, replica_holdoff=5)
+    response_cache.bump()
+    version = response_cache.version
+
+    # 지연된 복제본이 bump 이전 데이터를 돌려줬을 수 있다 - 응답은 하되 저장하지 않는다
+    entry = response_cache.put(make_request(replica=True), version, b"[]")
+    assert entry.body == b"[]"
+    assert response_cache.get(make_request()) is None
+
+    # 주 DB 에서 읽은 응답은 바로 저장
+    response_cache.put(make_request(), version, b"[1]")
+    assert response_cache.get(make_request()).body == b"[1]"
+
+
+def test_replica_read_is_cached_after_holdoff(clock):
+    response_cache = VersionedResponseCache(ttl=60, max_entries=8, replica_holdoff=5)
+    response_cache.bump()
+    clock[0] += 5
+    response_cache.put(make_request(replica=True), response_cache.version, b"[2]")
+    assert response_cache.get(make_request()).body == b"[2]"
+
+
+def test_put_skips_entries_read_before_bump(clock):
+    response_cache = VersionedResponseCache(ttl=60, max_entries=8)
+    version = response_cache.version
+    response_cache.bump()
+    response_cache.put(make_request(), version, b"[]")
+    assert response_cache.get(make_request()) is None
+
+
+@pytest.mark.anyio
+async def test_get_read_db_marks_replica_sessions(anyio_backend, monkeypatch):
+    from app import database
+
+    monkeypatch.setattr(database, "replica_engine", object())
+    monkeypatch.setattr(database, "ReadSessionLocal", database.AsyncSessionLocal)
+    for pinned, expected in ((False, True), (True, False)):
+        request = make_request()
+        request.state.read_primary = pinned
+        sessions = database.get_read_db(request)
+        await sessions.__anext__()
+        await sessions.aclose()
+        assert getattr(request.state, "read_replica", False) is expected
+
+
+@pytest.fixture
+def schedules(make_schedule):
+    """압축 사본이 생길 만큼(COMPRESS_MIN_SIZE 이상) 큰 목록"""
+    return [make_schedule(days=n) for n in range(1, 6)]
+
+
+@pytest.mark.anyio
+async def test_if_none_match_returns_304(client, schedules):
+    first = await client.get("/api/schedules/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    again = await client.get("/api/schedules/", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["ETag"] == etag
+    weak = await client.get("/api/schedules/", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept, encoding", [("br, gzip", "br"), ("gzip", "gzip"), ("identity", None)])
+async def test_accept_encoding_picks_precompressed_copy(client, schedules, accept, encoding):
+    plain = await client.get("/api/schedules/", headers={"Accept-Encoding": "identity"})
+    response = await client.get("/api/schedules/", headers={"Accept-Encoding": accept})
+    assert response.headers.get("Content-Encoding") == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]  # CORS 미들웨어가 Origin 을 덧붙인다
+    assert response.headers["ETag"] == plain.headers["ETag"]  # 본문 기준 - 인코딩과 무관
+    assert response.json() == plain.json()
+
+
+@pytest.mark.anyio
+async def test_writes_bump_version_and_change_etag(client, schedules, make_user, auth_headers):
+    admin = auth_headers(make_user(role=UserRoleEnum.admin))
+    user = auth_headers(make_user())
+
+    async def etag_after(write):
+        before = (await client.get("/api/schedules/")).headers["ETag"]
+        version = cache.schedule_cache.version
+        response = await write()
+        assert response.status_code == 200
+        assert cache.schedule_cache.version > version
+        after = await client.get("/api/schedules/", headers={"If-None-Match": before})
+        assert after.status_code == 200  # 이전 ETag 로는 304 가 나오지 않는다
+        return response.json()
+
+    application = await etag_after(lambda: client.post("/api/applications/", json={"schedule_id": schedules[0]}, headers=user))
+    await etag_after(lambda: client.post(
+        "/api/admin/applications/update-status",
+        json={"application_id": application["id"], "new_status": "approved"}, headers=admin,
+    ))
+    await etag_after(lambda: client.put(f"/api/schedules/{schedules[1]}", json={
+        "title": "renamed", "start_time": "2030-01-01T09:00:00Z", "end_time": "2030-01-01T18:00:00Z",
+        "start_time_str": "09:00", "end_time_str": "18:00", "work_date": "2030-01-01T00:00:00Z", "capacity": 4,
+    }, headers=admin))
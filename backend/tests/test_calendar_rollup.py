@@ -0,0 +1,146 @@
+# backend/tests/test_calendar_rollup.py
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, select
+
+from app import models
+from app.cache import schedule_cache
+from app.calendar_rollup import CalendarRollup, calendar_rollup, day_runs
+from app.database import async_engine, engine
+
+pytestmark = pytest.mark.anyio
+
+
+def stats(day):
+    with engine.connect() as conn:
+        return conn.execute(
+            select(models.ScheduleDailyStats.shift_count, models.ScheduleDailyStats.pending)
+            .where(models.ScheduleDailyStats.day == day)
+        ).one_or_none()
+
+
+@pytest.fixture
+def tomorrow():
+    return datetime.now(timezone.utc).date() + timedelta(days=1)
+
+
+async def test_sweep_without_changes_keeps_cache(anyio_backend, make_schedule, tomorrow):
+    make_schedule(days=1)
+    assert await calendar_rollup.refresh_range(tomorrow, tomorrow + timedelta(days=6)) == 1
+    assert stats(tomorrow) == (1, 0)
+
+    version = schedule_cache.version
+    assert await calendar_rollup.refresh_range(tomorrow - timedelta(days=7), tomorrow + timedelta(days=120)) == 0
+    assert schedule_cache.version == version
+
+
+async def test_flush_bumps_only_when_totals_change(anyio_backend, make_schedule, make_user, make_application, tomorrow):
+    schedule_id = make_schedule(days=1)
+    calendar_rollup.touch_schedules(schedule_id)
+    assert await calendar_rollup.flush() == 1
+
+    version = schedule_cache.version
+    calendar_rollup.touch_schedules(schedule_id)  # 신청 없이 다시 계산 - 집계 그대로
+    assert await calendar_rollup.flush() == 0
+    assert schedule_cache.version == version
+
+    make_application(make_user(), schedule_id)
+    calendar_rollup.touch_schedules(schedule_id)
+    assert await calendar_rollup.flush() == 1
+    assert schedule_cache.version > version
+    assert stats(tomorrow) == (1, 1)
+
+
+async def test_refresh_deletes_days_without_shifts(anyio_backend, make_schedule, tomorrow):
+    schedule_id = make_schedule(days=1)
+    await calendar_rollup.refresh_range(tomorrow, tomorrow)
+    with engine.begin() as conn:
+        conn.execute(models.Schedule.__table__.delete().where(models.Schedule.id == schedule_id))
+
+    version = schedule_cache.version
+    assert await calendar_rollup.refresh_range(tomorrow, tomorrow) == 1
+    assert stats(tomorrow) is None
+    assert schedule_cache.version > version
+
+
+async def test_first_sweep_waits_for_startup_delay(anyio_backend, monkeypatch):
+    rollup = CalendarRollup(interval=0.01, sweep_interval=600, first_sweep_delay=0.2)
+    sweeps = []
+
+    async def refresh_range(first, last):
+        sweeps.append((first, last))
+        return 0
+
+    monkeypatch.setattr(rollup, "refresh_range", refresh_range)
+    task = asyncio.create_task(rollup.run_periodic())
+    try:
+        await asyncio.sleep(0.1)
+        assert sweeps == []  # 시작 직후에는 flush 만
+        await asyncio.sleep(0.25)
+        assert len(sweeps) == 1  # 다음 보정은 sweep_interval 뒤
+    finally:
+        task.cancel()
+
+
+def test_day_runs_groups_consecutive_days(tomorrow):
+    days = {tomorrow, tomorrow + timedelta(days=1), tomorrow + timedelta(days=90), tomorrow + timedelta(days=2)}
+    assert day_runs(days) == [(tomorrow, tomorrow + timedelta(days=2)), (tomorrow + timedelta(days=90),) * 2]
+
+
+async def test_refresh_reads_only_touched_days(anyio_backend, make_schedule, tomorrow):
+    ids = [make_schedule(days=n) for n in (1, 45, 90)]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM schedules" in statement:
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        calendar_rollup.touch_schedules(ids[0], ids[2])
+        assert await calendar_rollup.flush() == 2
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+    # 1일, 90일 두 범위만 읽고 사이(45일)의 스케줄은 읽지 않는다
+    assert statements[-1].count("work_date >=") == 2
+    assert stats(tomorrow + timedelta(days=44)) is None
+    assert stats(tomorrow) == stats(tomorrow + timedelta(days=89)) == (1, 0)
+
+
+async def test_calendar_endpoint_reflects_applications(client, make_user, auth_headers, tomorrow):
+    admin = auth_headers(make_user(role=models.UserRoleEnum.admin))
+    created = []
+    for offset, capacity in ((0, 2), (0, 3), (2, 1)):
+        work_date = datetime.combine(tomorrow + timedelta(days=offset), datetime.min.time(), tzinfo=timezone.utc)
+        response = await client.post("/api/schedules/", json={
+            "title": "shift", "capacity": capacity, "work_date": work_date.isoformat(),
+            "start_time": (work_date + timedelta(hours=9)).isoformat(), "end_time": (work_date + timedelta(hours=18)).isoformat(),
+            "start_time_str": "09:00", "end_time_str": "18:00",
+        }, headers=admin)
+        assert response.status_code == 200
+        created.append(response.json()["id"])
+
+    applied = []
+    for schedule_id in (created[0], created[0], created[2]):
+        response = await client.post("/api/applications/", json={"schedule_id": schedule_id}, headers=auth_headers(make_user()))
+        assert response.status_code == 200
+        applied.append(response.json()["id"])
+    response = await client.post(
+        "/api/admin/applications/update-status", json={"application_id": applied[0], "new_status": "approved"}, headers=admin,
+    )
+    assert response.status_code == 200
+
+    await calendar_rollup.flush()
+    url = f"/api/schedules/calendar?from={tomorrow}&to={tomorrow + timedelta(days=6)}"
+    response = await client.get(url)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["days"] == [
+        {"day": str(tomorrow), "shift_count": 2, "total_capacity": 5, "seats_left": 3,
+         "approved": 1, "pending": 1},
+        {"day": str(tomorrow + timedelta(days=2)), "shift_count": 1, "total_capacity": 1, "seats_left": 0,
+         "approved": 0, "pending": 1},
+    ]
+    assert sorted(schedule["id"] for schedule in body["schedules"]) == sorted(created)
@@ -0,0 +1,54 @@
+# backend/tests/test_hashing.py
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import func, select
+
+from app import models
+from app.database import engine
+from app.hashing import PASSWORD_HASH_RETRY_AFTER, hash_pool
+from tests.conftest import PASSWORD
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def busy_pool(anyio_backend, monkeypatch):
+    """용량 1 인 풀을 오래 걸리는 작업 하나로 채워 둔다"""
+    monkeypatch.setattr(hash_pool, "capacity", 1)
+    release = threading.Event()
+    job = asyncio.create_task(hash_pool.run("hash", release.wait, 5))
+    while hash_pool.depth < 1:
+        await asyncio.sleep(0)
+    yield
+    release.set()
+    await job
+
+
+def assert_busy(response):
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(PASSWORD_HASH_RETRY_AFTER)
+
+
+async def test_login_is_rejected_when_hash_queue_is_full(client, make_user, busy_pool):
+    make_user(phone="01055550000", password=PASSWORD)
+    response = await asyncio.wait_for(
+        client.post("/api/auth/login", json={"phone_number": "01055550000", "password": PASSWORD}), 2,
+    )  # 기다리지 않고 바로 거절
+    assert_busy(response)
+
+
+async def test_register_is_rejected_without_creating_user(client, busy_pool):
+    response = await asyncio.wait_for(client.post("/api/auth/register", json={"phone_number": "01055550001"}), 2)
+    assert_busy(response)
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count(models.User.id))) == 0
+
+
+async def test_pool_accepts_again_after_queue_drains(client, make_user, monkeypatch):
+    monkeypatch.setattr(hash_pool, "capacity", 1)
+    make_user(phone="01055550002", password=PASSWORD)
+    response = await client.post("/api/auth/login", json={"phone_number": "01055550002", "password": PASSWORD})
+    assert response.status_code == 200
+    assert hash_pool.depth == 0
@@ -0,0 +1,62 @@
+# backend/tests/test_health.py
+import pytest
+
+from app import health
+
+pytestmark = pytest.mark.anyio
+
+
+class BrokenEngine:
+    """connect() 가 불릴 때마다 세고 바로 실패하는 엔진"""
+
+    def __init__(self):
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        raise ConnectionError("database is down")
+
+
+@pytest.fixture
+def broken_db(monkeypatch):
+    engine = BrokenEngine()
+    monkeypatch.setattr(health, "async_engine", engine)
+    monkeypatch.setattr(health.readiness, "_result", None)
+    monkeypatch.setattr(health.readiness, "_checked_at", 0.0)
+    return engine
+
+
+async def test_health_does_not_touch_database(client, broken_db):
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+    assert broken_db.connects == 0
+
+
+async def test_ready_is_503_when_database_fails(client, broken_db):
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "database": "error"}
+
+
+async def test_ready_reuses_result_within_ttl(client, broken_db, monkeypatch):
+    monkeypatch.setattr(health.readiness, "ttl", 60)
+    for _ in range(3):
+        assert (await client.get("/ready")).status_code == 503
+    assert broken_db.connects == 1
+
+    # ttl 이 지나면 다시 확인한다
+    monkeypatch.setattr(health.readiness, "_checked_at", health.readiness._checked_at - 61)
+    assert (await client.get("/ready")).status_code == 503
+    assert broken_db.connects == 2
+
+
+async def test_ready_recovers_after_ttl(client, broken_db, monkeypatch):
+    monkeypatch.setattr(health.readiness, "ttl", 0)
+    assert (await client.get("/ready")).status_code == 503
+    monkeypatch.undo()
+
+    monkeypatch.setattr(health.readiness, "_result", None)
+    response = await client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["database"] == "ok"
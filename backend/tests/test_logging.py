@@ -0,0 +1,71 @@
+# backend/tests/test_logging.py
+import logging
+import queue
+import threading
+import time
+
+from prometheus_client import REGISTRY
+
+from app.logging_config import BatchingQueueListener, DroppingQueueHandler
+
+
+def dropped_total() -> float:
+    return REGISTRY.get_sample_value("log_records_dropped_total") or 0.0
+
+
+class BlockingHandler(logging.Handler):
+    """unblock 이 set 될 때까지 첫 레코드에서 멈추는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.unblock = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.started.set()
+        self.unblock.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def make_record(message: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": message, "levelno": logging.INFO, "levelname": "INFO"})
+
+
+def test_full_queue_drops_without_blocking():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    before = dropped_total()
+
+    started = time.perf_counter()
+    for i in range(5):
+        handler.handle(make_record(f"record {i}"))
+    assert time.perf_counter() - started < 1
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
+    assert dropped_total() - before == 3
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ["record 0", "record 1"]
+
+
+def test_stop_with_full_queue_makes_room_for_sentinel():
+    log_queue = queue.Queue(maxsize=2)
+    output = BlockingHandler()
+    listener = BatchingQueueListener(log_queue, output)
+    listener.start()
+    log_queue.put_nowait(make_record("first"))
+    assert output.started.wait(5)  # 리스너가 first 에서 멈춤
+    log_queue.put_nowait(make_record("second"))
+    log_queue.put_nowait(make_record("third"))
+    before = dropped_total()
+
+    started = time.perf_counter()
+    listener.enqueue_sentinel()  # 큐가 가득 차 있어도 기다리지 않는다
+    assert time.perf_counter() - started < 1
+    assert listener.dropped == 1
+    assert dropped_total() - before == 1
+
+    output.unblock.set()
+    listener._thread.join(5)
+    assert not listener._thread.is_alive()
+    assert output.messages == ["first", "third"]
@@ -0,0 +1,51 @@
+# backend/tests/test_login.py
+import pytest
+from passlib.hash import bcrypt
+from sqlalchemy import select, update
+
+from app import models, security
+from app.database import engine
+from tests.conftest import PASSWORD
+
+pytestmark = pytest.mark.anyio
+
+PHONE = "01088880000"
+
+
+@pytest.fixture
+def old_cost_user(make_user):
+    """현재 BCRYPT_ROUNDS 와 다른 cost 로 해시된 비밀번호를 가진 사용자를 만든다"""
+    def create(status) -> int:
+        user_id = make_user(phone=PHONE, status=status)
+        with engine.begin() as conn:
+            conn.execute(update(models.User).where(models.User.id == user_id).values(
+                hashed_password=bcrypt.using(rounds=security.BCRYPT_ROUNDS + 1).hash(PASSWORD),
+            ))
+        return user_id
+    return create
+
+
+def stored_rounds(user_id: int) -> int:
+    with engine.connect() as conn:
+        hashed = conn.scalar(select(models.User.hashed_password).where(models.User.id == user_id))
+    return bcrypt.from_string(hashed).rounds
+
+
+async def login(client, password=PASSWORD):
+    return await client.post("/api/auth/login", json={"phone_number": PHONE, "password": password})
+
+
+@pytest.mark.parametrize("status, expected", [
+    (models.UserStatusEnum.approved, 200),
+    (models.UserStatusEnum.pending, 403),  # 승인 전이어도 비밀번호가 맞았으면 해시는 교체
+])
+async def test_login_rehashes_to_current_cost(client, old_cost_user, status, expected):
+    user_id = old_cost_user(status)
+    assert (await login(client)).status_code == expected
+    assert stored_rounds(user_id) == security.BCRYPT_ROUNDS
+
+
+async def test_wrong_password_keeps_old_hash(client, old_cost_user):
+    user_id = old_cost_user(models.UserStatusEnum.pending)
+    assert (await login(client, "wrong")).status_code == 400
+    assert stored_rounds(user_id) == security.BCRYPT_ROUNDS + 1
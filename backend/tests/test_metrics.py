@@ -0,0 +1,45 @@
+# backend/tests/test_metrics.py
+import pytest
+
+from app.models import UserRoleEnum
+
+pytestmark = pytest.mark.anyio
+
+
+def request_samples(body: str, method: str) -> list:
+    """/metrics 본문에서 해당 method 의 http_request_duration_seconds_count 줄"""
+    return [
+        line for line in body.splitlines()
+        if line.startswith("http_request_duration_seconds_count{") and f'method="{method}"' in line
+    ]
+
+
+async def test_request_histogram_is_labelled_by_route_template(client, make_user, make_schedule, auth_headers):
+    headers = auth_headers(make_user(role=UserRoleEnum.admin))
+    ids = [make_schedule(days=d) for d in (1, 2)]
+    for schedule_id in ids:
+        assert (await client.get(f"/api/schedules/{schedule_id}", headers=headers)).status_code == 200
+    assert (await client.get("/api/schedules/999999", headers=headers)).status_code == 404
+
+    body = (await client.get("/metrics")).text
+    samples = request_samples(body, "GET")
+    assert any('route="/api/schedules/{schedule_id}"' in line and 'status="200"' in line for line in samples)
+    assert any('route="/api/schedules/{schedule_id}"' in line and 'status="404"' in line for line in samples)
+    # 실제 id 가 들어간 경로는 라벨에 남지 않는다
+    for schedule_id in ids + [999999]:
+        assert f'route="/api/schedules/{schedule_id}"' not in body
+
+
+async def test_unmatched_paths_share_one_label(client):
+    for path in ("/no-such-page/1", "/no-such-page/2"):
+        assert (await client.get(path)).status_code == 404
+
+    body = (await client.get("/metrics")).text
+    assert "no-such-page" not in body
+    assert any('route="unmatched"' in line for line in request_samples(body, "GET"))
+
+
+async def test_metrics_endpoint_is_not_recorded(client):
+    await client.get("/metrics")
+    body = (await client.get("/metrics")).text
+    assert 'route="/metrics"' not in body
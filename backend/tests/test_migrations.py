@@ -0,0 +1,98 @@
+# backend/tests/test_migrations.py
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from app import models
+from app.database import engine
+from benchmarks.datagen import BACKEND_DIR
+
+
+@pytest.fixture
+def scratch(tmp_path):
+    """테스트 DB 와 별개인 빈 SQLite 와 그 DB 를 대상으로 하는 alembic 설정"""
+    scratch_engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+
+    def run(command_name: str, revision: str):
+        with scratch_engine.begin() as conn:
+            config.attributes["connection"] = conn
+            getattr(command, command_name)(config, revision)
+
+    yield scratch_engine, run
+    scratch_engine.dispose()
+
+
+def test_models_match_migrations():
+    """모델의 스키마 변경에는 같은 변경을 하는 리비전이 있어야 한다 (alembic upgrade head 결과와 비교)"""
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn, opts={"render_as_batch": True}), models.Base.metadata)
+    assert diff == []
+
+
+def test_downgrade_and_upgrade_round_trip(scratch):
+    scratch_engine, run = scratch
+    run("upgrade", "head")
+    run("downgrade", "base")
+    assert set(inspect(scratch_engine).get_table_names()) <= {"alembic_version"}
+    run("upgrade", "head")
+    assert {table.name for table in models.Base.metadata.sorted_tables} <= set(inspect(scratch_engine).get_table_names())
+
+
+def test_duplicate_cleanup_keeps_approved_application(scratch, caplog):
+    scratch_engine, run = scratch
+    run("upgrade", "0002_applicant_counters")  # 유니크 제약 전 - 중복 신청서가 있을 수 있던 스키마
+    with scratch_engine.begin() as conn:
+        user = conn.exec_driver_sql(
+            "INSERT INTO users (phone_number, hashed_password, role, status) "
+            "VALUES ('01000000001', '-', 'user', 'approved') RETURNING id"
+        ).scalar_one()
+        schedules = [
+            conn.exec_driver_sql(
+                "INSERT INTO schedules (title, start_time, end_time, start_time_str, end_time_str, work_date, capacity) "
+                "VALUES ('s', '2030-01-01', '2030-01-01', '09:00', '18:00', '2030-01-01', 5) RETURNING id"
+            ).scalar_one()
+            for _ in range(2)
+        ]
+        rows = [(schedules[0], "pending"), (schedules[0], "approved"), (schedules[0], "rejected"),
+                (schedules[1], "rejected"), (schedules[1], "pending"), (schedules[1], "pending")]
+        ids = [
+            conn.exec_driver_sql(
+                "INSERT INTO applications (user_id, schedule_id, status) VALUES (?, ?, ?) RETURNING id",
+                (user, schedule_id, status),
+            ).scalar_one()
+            for schedule_id, status in rows
+        ]
+
+    with caplog.at_level("WARNING"):
+        run("upgrade", "head")
+
+    with scratch_engine.connect() as conn:
+        kept = conn.exec_driver_sql("SELECT id FROM applications ORDER BY id").scalars().all()
+        counters = conn.exec_driver_sql(
+            "SELECT current_applicants, pending_applicants, active_applicants FROM schedules ORDER BY id"
+        ).all()
+    assert kept == [ids[1], ids[4]]  # 승인된 신청, 그다음 대기 중 id 가 가장 작은 신청
+    assert [tuple(row) for row in counters] == [(1, 0, 1), (0, 1, 1)]
+    assert sum("Deleting duplicate application" in record.message for record in caplog.records) == 4
+
+
+def test_null_pinned_notices_become_false(scratch):
+    scratch_engine, run = scratch
+    run("upgrade", "0006_refresh_token_families")
+    with scratch_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO notices (title, content, is_pinned, created_at) VALUES "
+            "('null', 'c', NULL, '2030-01-01'), ('pinned', 'c', 1, '2030-01-02')"
+        )
+    run("upgrade", "head")
+    with scratch_engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT title, is_pinned FROM notices ORDER BY id").all()
+    assert [tuple(row) for row in rows] == [("null", 0), ("pinned", 1)]
+    assert not {col["name"]: col for col in inspect(scratch_engine).get_columns("notices")}["is_pinned"]["nullable"]
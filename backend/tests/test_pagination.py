@@ -0,0 +1,61 @@
+# backend/tests/test_pagination.py
+import pytest
+
+from app.models import UserRoleEnum
+from benchmarks.check_query_plans import seed
+
+pytestmark = pytest.mark.anyio
+
+
+async def walk(client, path: str, headers=None) -> list:
+    """X-Next-Cursor 를 따라 끝까지 읽은 id 목록"""
+    ids, cursor = [], None
+    while True:
+        url = path if cursor is None else f"{path}&cursor={cursor}"
+        response = await client.get(url, headers=headers)
+        assert response.status_code == 200
+        ids += [row["id"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+
+
+@pytest.fixture
+def seeded():
+    seed(users=23, schedules=17, notices=19)
+
+
+async def test_schedule_cursor_matches_offset_listing(client, seeded):
+    everything = [row["id"] for row in (await client.get("/api/schedules/?limit=1000")).json()]
+    assert len(everything) == 17
+    assert await walk(client, "/api/schedules/?limit=5") == everything
+
+
+async def test_notice_cursor_matches_offset_listing(client, seeded, make_user, auth_headers):
+    headers = auth_headers(make_user())
+    everything = [row["id"] for row in (await client.get("/api/notices/?limit=1000", headers=headers)).json()]
+    assert len(everything) == 19
+    assert await walk(client, "/api/notices/?limit=4", headers) == everything
+
+
+async def test_admin_user_cursor(client, seeded, make_user, auth_headers):
+    headers = auth_headers(make_user(role="super_admin"))
+    everything = [row["id"] for row in (await client.get("/api/admin/users?limit=1000", headers=headers)).json()]
+    assert len(everything) == 24
+    assert await walk(client, "/api/admin/users?limit=6", headers) == everything
+
+
+async def test_invalid_cursor(client, seeded):
+    assert (await client.get("/api/schedules/?limit=5&cursor=not-a-cursor")).status_code == 400
+
+
+async def test_notice_cursor_with_unpinned_null_notice(client, make_user, auth_headers):
+    admin = auth_headers(make_user(role=UserRoleEnum.admin))
+    for n, pinned in enumerate([True, None, False, None, True, False, None]):
+        response = await client.post("/api/notices/", json={"title": f"n{n}", "content": "c", "is_pinned": pinned}, headers=admin)
+        assert response.status_code == 200
+        assert response.json()["is_pinned"] is bool(pinned)  # null 은 고정 안 함으로 저장
+    everything = [row["id"] for row in (await client.get("/api/notices/?limit=100", headers=admin)).json()]
+    assert len(everything) == 7
+    for limit in (1, 2, 3):
+        assert await walk(client, f"/api/notices/?limit={limit}", admin) == everything
@@ -0,0 +1,77 @@
+# backend/tests/test_projection.py
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import insert, update
+
+from app import models, projection, schemas
+from app.database import engine
+from app.routers.admin import user_projection
+from app.routers.notices import notice_projection
+from app.routers.schedules import schedule_projection
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def null_counters(make_schedule, make_user, make_application):
+    """current_applicants / capacity 가 NULL 인 스케줄 (마이그레이션 전 데이터처럼) + 그 신청서"""
+    schedule_id = make_schedule()
+    user_id = make_user()
+    make_application(user_id, schedule_id)
+    with engine.begin() as conn:
+        conn.execute(
+            update(models.Schedule).where(models.Schedule.id == schedule_id).values(current_applicants=None, capacity=None)
+        )
+    return user_id, schedule_id
+
+
+async def test_fast_path_output_passes_schema_validation(client, null_counters, auth_headers):
+    user_id, schedule_id = null_counters
+    response = await client.get("/api/schedules/?limit=10")
+    assert response.status_code == 200
+    # orjson 경로 결과가 TypeAdapter 검증(orjson 이 없을 때의 경로)을 통과해야 한다
+    [schedule] = schedule_projection.list_adapter.validate_json(response.content)
+    assert (schedule.current_applicants, schedule.capacity) == (0, 1)
+
+    response = await client.get("/api/mypage/my-applications", headers=auth_headers(user_id))
+    assert response.status_code == 200
+    [application] = projection.my_application_projection.list_adapter.validate_json(response.content)
+    assert application.schedule.current_applicants == 0
+
+
+@pytest.mark.parametrize("target, schema", [
+    (schedule_projection, schemas.ScheduleWithPendingCount),
+    (notice_projection, schemas.Notice),
+    (user_projection, schemas.User),
+    (projection.application_projection, schemas.Application),
+    (projection.my_application_projection, schemas.Application),
+])
+def test_fast_path_matches_schema_serialization(null_counters, make_schedule, make_user, make_application, target, schema):
+    make_application(make_user(), make_schedule(days=2), models.ApplicationStatusEnum.approved)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Notice).values(title="t", content="c", view_count=None))
+        conn.execute(insert(models.Notice).values(title="t2", content="c2", is_pinned=True, view_count=3))
+        rows = conn.execute(target.select()).all()
+    assert len(rows) >= 2
+    items = [target.to_dict(row) for row in rows]
+    # orjson 경로와 스키마 검증 후 직렬화한 결과가 바이트 단위로 같아야 한다
+    adapter = TypeAdapter(List[schema])
+    assert target.dump_list(items) == adapter.dump_json(adapter.validate_python(items))
+
+
+async def test_my_applications_do_not_nest_user(client, make_schedule, make_user, make_application, auth_headers):
+    user_id = make_user()
+    make_application(user_id, make_schedule())
+    response = await client.get("/api/mypage/my-applications", headers=auth_headers(user_id))
+    [application] = response.json()
+    assert application["user"] is None
+    assert application["schedule"]["id"] == application["schedule_id"]
+    assert "users" not in str(projection.my_application_projection.select())
+
+
+def test_nullable_columns_are_coalesced_only_where_schema_requires_value():
+    sql = str(schedule_projection.select())
+    assert "coalesce(schedules.current_applicants" in sql
+    assert "coalesce(schedules.description" not in sql  # Optional[str] 필드는 NULL 그대로
@@ -0,0 +1,25 @@
+# backend/tests/test_query_checks.py
+"""benchmarks/check_query_budgets.py, check_query_plans.py 를 SQLite 테스트 DB 에서 실행"""
+import pytest
+
+from benchmarks import check_query_budgets, check_query_plans
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def seeded():
+    check_query_plans.seed(users=200, schedules=50, notices=60)
+
+
+async def test_query_budgets(seeded, client):
+    results = await check_query_budgets.check()
+    failures = [f"{method} {template}: {error}" for method, template, _, _, error in results if error]
+    assert not failures, "\n".join(failures)
+
+
+async def test_query_plans_use_indexes(seeded, client):
+    results = await check_query_plans.check()
+    assert results
+    scans = [f"{path}: {', '.join(scans)}" for path, _, _, scans in results if scans]
+    assert not scans, "\n".join(scans)
@@ -0,0 +1,127 @@
+# backend/tests/test_rate_limit.py
+import ipaddress
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app import rate_limit
+from app.rate_limit import MemoryBackend, RateLimit, RateLimiter, client_ip
+from tests.conftest import PASSWORD
+
+pytestmark = pytest.mark.anyio
+
+LIMIT = RateLimit("test", 3, 30)  # 3번 연속, 10초마다 하나씩 회복
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucket_allows_burst_then_refills(clock):
+    backend = MemoryBackend(max_keys=10)
+    assert [backend.hit_now("k", LIMIT) for _ in range(3)] == [0, 0, 0]
+    assert backend.hit_now("k", LIMIT) == pytest.approx(10)
+    clock[0] += 10
+    assert backend.hit_now("k", LIMIT) == 0
+    assert backend.hit_now("k", LIMIT) > 0
+
+
+def test_bucket_evicts_least_recently_used(clock):
+    backend = MemoryBackend(max_keys=2)
+    for key in ("a", "b"):
+        for _ in range(3):
+            backend.hit_now(key, LIMIT)
+    backend.hit_now("c", LIMIT)  # "a" 가 밀려나 새 버킷으로 시작
+    assert backend.hit_now("a", LIMIT) == 0
+
+
+async def test_limiter_raises_429_with_retry_after(clock):
+    limiter = RateLimiter(MemoryBackend(10))
+    for _ in range(3):
+        await limiter.check((LIMIT, "user"), (LIMIT, None))  # 빈 키는 건너뛴다
+    with pytest.raises(HTTPException) as exc:
+        await limiter.check((LIMIT, "user"))
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "10"
+
+
+async def test_limiter_falls_back_to_memory_when_backend_fails(clock):
+    class Broken:
+        async def hit(self, key, limit):
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(Broken(), max_keys=10)
+    for _ in range(3):
+        await limiter.check((LIMIT, "user"))
+    with pytest.raises(HTTPException):
+        await limiter.check((LIMIT, "user"))
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = RateLimiter(MemoryBackend(100))
+    monkeypatch.setattr("app.routers.auth.rate_limiter", limiter)
+    return limiter
+
+
+async def test_login_account_limit(client, make_user, limiter):
+    make_user(phone="01066660000", password=PASSWORD)
+    codes = [
+        (await client.post("/api/auth/login", json={"phone_number": "01066660000", "password": "wrong"})).status_code
+        for _ in range(rate_limit.LOGIN_ACCOUNT.burst + 1)
+    ]
+    assert codes[:-1] == [400] * rate_limit.LOGIN_ACCOUNT.burst
+    assert codes[-1] == 429
+
+
+@pytest.fixture
+def login_ip_limit(monkeypatch, limiter):
+    monkeypatch.setattr("app.routers.auth.LOGIN_IP", RateLimit("login_ip", 3, 60))
+
+
+@pytest.fixture
+def trust_proxies(monkeypatch):
+    def trust(*cidrs):
+        monkeypatch.setattr(rate_limit, "RATE_LIMIT_TRUSTED_PROXIES", tuple(ipaddress.ip_network(c) for c in cidrs))
+    return trust
+
+
+async def login_codes(client, forwarded_for) -> list:
+    """매번 다른 (없는) 계정으로 로그인 - 계정 한도가 아닌 IP 한도만 걸린다"""
+    return [
+        (await client.post(
+            "/api/auth/login",
+            json={"phone_number": f"0109999{n:04d}", "password": "wrong"},
+            headers={"X-Forwarded-For": forwarded_for(n)},
+        )).status_code
+        for n in range(4)
+    ]
+
+
+async def test_spoofed_forwarded_for_does_not_reset_ip_bucket(client, login_ip_limit):
+    # 신뢰하는 프록시가 없으면 X-Forwarded-For 는 무시하고 연결 주소로 센다
+    assert await login_codes(client, lambda n: f"198.51.100.{n}") == [404, 404, 404, 429]
+
+
+async def test_forwarded_for_uses_hop_added_by_trusted_proxy(client, login_ip_limit, trust_proxies):
+    trust_proxies("127.0.0.0/8")  # ASGITransport 의 연결 주소 127.0.0.1 = 프록시
+    # 클라이언트가 왼쪽에 끼워 넣은 값은 바뀌어도 프록시가 붙인 오른쪽 주소로 센다
+    assert await login_codes(client, lambda n: f"198.51.100.{n}, 203.0.113.7") == [404, 404, 404, 429]
+    assert (await login_codes(client, lambda n: "203.0.113.8"))[0] == 404
+
+
+def test_client_ip_skips_trusted_hops(trust_proxies):
+    trust_proxies("10.0.0.0/8")
+
+    def request(peer, forwarded_for=None):
+        headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+        return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+    assert client_ip(request("203.0.113.1", "1.2.3.4")) == "203.0.113.1"  # 프록시가 아닌 상대는 헤더 무시
+    assert client_ip(request("10.1.2.3", "1.2.3.4, 203.0.113.9, 10.4.5.6")) == "203.0.113.9"
+    assert client_ip(request("10.1.2.3", "10.9.9.9")) == "10.9.9.9"  # 모두 프록시면 가장 왼쪽
+    assert client_ip(request("10.1.2.3")) == "10.1.2.3"
@@ -0,0 +1,91 @@
+# backend/tests/test_refresh_tokens.py
+import pytest
+
+from app import refresh_tokens
+from tests.conftest import PASSWORD
+
+pytestmark = pytest.mark.anyio
+
+PHONE = "01077770000"
+
+
+@pytest.fixture
+def user(make_user):
+    return make_user(phone=PHONE, password=PASSWORD)
+
+
+async def login(client, password=PASSWORD):
+    return await client.post("/api/auth/login", json={"phone_number": PHONE, "password": password})
+
+
+async def refresh(client, token):
+    return await client.post("/api/auth/refresh", json={"refresh_token": token})
+
+
+async def test_login_returns_token_pair(client, user):
+    response = await login(client)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["refresh_token"] and body["expires_in"] > 0
+    me = await client.get("/api/mypage/me", headers={"Authorization": f"Bearer {body['access_token']}"})
+    assert me.json()["id"] == user
+
+
+async def test_wrong_password(client, user):
+    assert (await login(client, "wrong")).status_code == 400
+
+
+async def test_refresh_rotates(client, user):
+    first = (await login(client)).json()["refresh_token"]
+    rotated = await refresh(client, first)
+    assert rotated.status_code == 200
+    second = rotated.json()["refresh_token"]
+    assert second != first
+    assert (await refresh(client, second)).status_code == 200
+
+
+async def test_reuse_within_grace_returns_current_token(client, user):
+    first = (await login(client)).json()["refresh_token"]
+    second = (await refresh(client, first)).json()["refresh_token"]
+    # 다른 탭이 같은 토큰으로 동시에 갱신 - 폐기하지 않고 현재 세대를 다시 준다
+    again = await refresh(client, first)
+    assert again.status_code == 200
+    assert again.json()["refresh_token"] == second
+
+
+async def test_reuse_revokes_family(client, user, monkeypatch):
+    monkeypatch.setattr(refresh_tokens, "REFRESH_REUSE_GRACE", 0)
+    first = (await login(client)).json()["refresh_token"]
+    second = (await refresh(client, first)).json()["refresh_token"]
+
+    assert (await refresh(client, first)).status_code == 401
+    # 탈취 의심 - 정상 사용자의 최신 토큰도 함께 폐기된다
+    assert (await refresh(client, second)).status_code == 401
+
+
+async def test_forged_token_rejected(client, user):
+    token = (await login(client)).json()["refresh_token"]
+    family, generation, _ = token.split(".")
+    assert (await refresh(client, f"{family}.{generation}.{'0' * 64}")).status_code == 401
+    assert (await refresh(client, "garbage")).status_code == 401
+
+
+async def test_logout_revokes_only_that_login(client, user):
+    phone_token = (await login(client)).json()["refresh_token"]
+    laptop_token = (await login(client)).json()["refresh_token"]
+    assert (await client.post("/api/auth/logout", json={"refresh_token": phone_token})).status_code == 204
+    assert (await refresh(client, phone_token)).status_code == 401
+    assert (await refresh(client, laptop_token)).status_code == 200
+
+
+async def test_password_change_revokes_other_logins(client, user):
+    other_login = (await login(client)).json()
+    response = await client.put(
+        "/api/auth/change-password",
+        json={"old_password": PASSWORD, "new_password": "new-password"},
+        headers={"Authorization": f"Bearer {other_login['access_token']}"},
+    )
+    assert response.status_code == 200
+    assert (await refresh(client, other_login["refresh_token"])).status_code == 401
+    assert (await refresh(client, response.json()["refresh_token"])).status_code == 200
+    assert (await login(client, "new-password")).status_code == 200
@@ -0,0 +1,69 @@
+# backend/tests/test_retention.py
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.database import engine
+from app.models import ApplicationStatusEnum
+from app.retention import ScheduleRetention
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def seeded(make_schedule, make_user, make_application):
+    """보존 기간(45일)이 지난 스케줄 5건과 남을 스케줄 2건, 각각에 신청서"""
+    old = [make_schedule(days=-60 - n) for n in range(5)]
+    new = [make_schedule(days=-10), make_schedule(days=3)]
+    user = make_user()
+    statuses = [ApplicationStatusEnum.approved, ApplicationStatusEnum.pending] * 4
+    applications = {
+        schedule_id: (make_application(user, schedule_id, status), status)
+        for schedule_id, status in zip(old + new, statuses)
+    }
+    return old, new, applications
+
+
+def ids(column) -> set:
+    with engine.connect() as conn:
+        return set(conn.scalars(select(column)))
+
+
+def retention(archive=True) -> ScheduleRetention:
+    return ScheduleRetention(days=45, batch_size=2, archive=archive, interval=3600, pause=0)
+
+
+async def test_run_once_archives_and_deletes_only_old_rows(anyio_backend, seeded, monkeypatch):
+    old, new, applications = seeded
+    job = retention()
+    batches = []
+    delete_batch = job._delete_batch
+
+    async def counted(cutoff):
+        batches.append(await delete_batch(cutoff))
+        return batches[-1]
+
+    monkeypatch.setattr(job, "_delete_batch", counted)
+    assert await job.run_once() == 5
+    assert batches == [2, 2, 1, 0]
+
+    assert ids(models.Schedule.id) == set(new)
+    assert ids(models.Application.id) == {applications[schedule_id][0] for schedule_id in new}
+    assert ids(models.ScheduleArchive.schedule_id) == set(old)
+    with engine.connect() as conn:
+        archived = conn.execute(select(
+            models.ApplicationArchive.schedule_id, models.ApplicationArchive.application_id, models.ApplicationArchive.status,
+        )).all()
+    # 신청서는 자기 스케줄과 함께, 상태 그대로 옮겨진다
+    assert {row.schedule_id: (row.application_id, row.status) for row in archived} == {
+        schedule_id: applications[schedule_id] for schedule_id in old
+    }
+
+    assert await retention().run_once() == 0  # 다시 돌려도 남은 것이 없다
+
+
+async def test_run_once_without_archive(anyio_backend, seeded):
+    old, new, _ = seeded
+    assert await retention(archive=False).run_once() == 5
+    assert ids(models.Schedule.id) == set(new)
+    assert ids(models.ScheduleArchive.id) == set() and ids(models.ApplicationArchive.id) == set()
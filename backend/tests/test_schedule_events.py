@@ -0,0 +1,52 @@
+# backend/tests/test_schedule_events.py
+import pytest
+
+from app.schedule_events import SSE_CLIENT_QUEUE_SIZE, ScheduleEventBroker
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def broker():
+    return ScheduleEventBroker("local", "test", interval=0)
+
+
+def test_fan_out_drops_only_the_slow_subscriber(broker):
+    fast, slow = broker.subscribe(), broker.subscribe()
+    filtered = broker.subscribe([2])
+    for n in range(SSE_CLIENT_QUEUE_SIZE):
+        slow.queue.put_nowait([{"id": n}])  # 읽지 않아 밀린 클라이언트
+
+    broker.fan_out([{"id": 1, "current": 1}])
+    assert fast.queue.get_nowait() == [{"id": 1, "current": 1}]
+    assert filtered.queue.empty()  # 구독하지 않은 스케줄은 받지 않는다
+    assert slow.dropped and slow.queue.get_nowait() is None  # 스트림을 끝내라는 표시만 남는다
+    assert broker.subscribers == {fast, filtered}
+
+    broker.fan_out([{"id": 2, "current": 0}])
+    assert fast.queue.get_nowait() == filtered.queue.get_nowait() == [{"id": 2, "current": 0}]
+
+
+async def test_failed_publish_keeps_ids_for_next_flush(anyio_backend, broker, make_schedule, monkeypatch):
+    schedule_id = make_schedule(capacity=4)
+    subscription = broker.subscribe()
+    broker.changed(schedule_id)
+
+    async def broken(deltas):
+        raise ConnectionError("db gone")
+
+    monkeypatch.setattr(broker, "_publish", broken)
+    with pytest.raises(ConnectionError):
+        await broker.flush()
+    monkeypatch.undo()
+
+    assert await broker.flush() == 1
+    assert subscription.queue.get_nowait() == [{"id": schedule_id, "current": 0, "pending": 0, "capacity": 4}]
+    assert await broker.flush() == 0
+
+
+async def test_deleted_schedule_is_published_as_deleted(anyio_backend, broker):
+    subscription = broker.subscribe()
+    broker.changed(987654)
+    await broker.flush()
+    assert subscription.queue.get_nowait() == [{"id": 987654, "deleted": True}]
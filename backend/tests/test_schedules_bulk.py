@@ -0,0 +1,104 @@
+# backend/tests/test_schedules_bulk.py
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app import models
+from app.database import async_engine, engine
+from app.models import UserRoleEnum
+from app.routers import schedules
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def admin(make_user, auth_headers):
+    return auth_headers(make_user(role=UserRoleEnum.admin))
+
+
+@pytest.fixture
+def statements():
+    """요청 중 실행된 SQL 문 목록"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+def schedule_count() -> int:
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count(models.Schedule.id)))
+
+
+def item(day: int, start_hour=9, end_hour=18) -> dict:
+    base = datetime(2030, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)
+    return {
+        "title": f"shift {day}",
+        "start_time": (base + timedelta(hours=start_hour)).isoformat(),
+        "end_time": (base + timedelta(hours=end_hour)).isoformat(),
+        "start_time_str": f"{start_hour:02d}:00",
+        "end_time_str": f"{end_hour:02d}:00",
+        "work_date": base.isoformat(),
+        "capacity": 2,
+    }
+
+
+def weekly(date_from: date, date_to: date, weekdays=(0, 2)) -> dict:
+    return {"recurrence": {
+        "title": "weekly", "weekdays": list(weekdays),
+        "date_from": date_from.isoformat(), "date_to": date_to.isoformat(),
+        "start_time_str": "22:00", "end_time_str": "06:00", "capacity": 3,
+    }}
+
+
+async def test_weekly_rule_expands_to_matching_dates(client, admin, statements):
+    # 2030-01-07 은 월요일 - 2주 동안 월/수
+    response = await client.post("/api/schedules/bulk", json=weekly(date(2030, 1, 7), date(2030, 1, 20)), headers=admin)
+    assert response.status_code == 200
+    created = response.json()
+    assert [row["work_date"][:10] for row in created] == ["2030-01-07", "2030-01-09", "2030-01-14", "2030-01-16"]
+    # 야간 근무는 다음 날 종료
+    first = created[0]
+    assert datetime.fromisoformat(first["end_time"]) - datetime.fromisoformat(first["start_time"]) == timedelta(hours=8)
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO SCHEDULES")]
+    assert len(inserts) == 1 and "RETURNING" in inserts[0].upper()  # 여러 행을 INSERT 한 번으로
+    assert schedule_count() == 4
+
+
+async def test_invalid_items_return_every_error_and_insert_nothing(client, admin):
+    items = [item(0), item(1, start_hour=18, end_hour=9), item(2), item(3, start_hour=20, end_hour=20)]
+    response = await client.post("/api/schedules/bulk", json={"items": items}, headers=admin)
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert [(error["index"], error["field"]) for error in errors] == [(1, "end_time"), (3, "end_time")]
+    assert schedule_count() == 0
+
+
+async def test_over_limit_is_rejected(client, admin, monkeypatch):
+    monkeypatch.setattr(schedules, "SCHEDULE_BULK_MAX_ITEMS", 3)
+    response = await client.post("/api/schedules/bulk", json=weekly(date(2030, 1, 7), date(2030, 1, 27)), headers=admin)
+    assert response.status_code == 422
+    assert "최대 3건" in response.json()["detail"][0]["msg"]
+    assert schedule_count() == 0
+
+    response = await client.post("/api/schedules/bulk", json={"items": [item(n) for n in range(3)]}, headers=admin)
+    assert response.status_code == 200 and len(response.json()) == 3
+
+
+async def test_invalid_rule_is_rejected(client, admin):
+    payload = weekly(date(2030, 1, 20), date(2030, 1, 7), weekdays=(1, 9))
+    response = await client.post("/api/schedules/bulk", json=payload, headers=admin)
+    assert response.status_code == 422
+    assert [error["field"] for error in response.json()["detail"]] == ["date_to", "weekdays"]
+    assert schedule_count() == 0
+
+
+async def test_bulk_requires_admin(client, make_user, auth_headers):
+    response = await client.post("/api/schedules/bulk", json={"items": [item(0)]}, headers=auth_headers(make_user()))
+    assert response.status_code == 403
+    assert schedule_count() == 0
@@ -0,0 +1,61 @@
+# backend/tests/test_user_cache.py
+import pytest
+from sqlalchemy import update
+
+from app import models, user_cache as user_cache_module
+from app.database import engine
+from app.models import UserRoleEnum, UserStatusEnum
+from app.user_cache import user_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def admin(make_user, auth_headers):
+    return auth_headers(make_user(role=UserRoleEnum.super_admin))
+
+
+async def me(client, headers) -> int:
+    return (await client.get("/api/mypage/me", headers=headers)).status_code
+
+
+async def test_approve_user_takes_effect_immediately(client, admin, make_user, auth_headers):
+    user_id = make_user(status=UserStatusEnum.pending)
+    headers = auth_headers(user_id)
+    assert await me(client, headers) == 403  # pending 상태가 캐시된다
+    assert user_id in user_cache._entries
+
+    response = await client.post("/api/admin/approve-user", json={"user_id": user_id, "status": "approved"}, headers=admin)
+    assert response.status_code == 200
+    assert await me(client, headers) == 200
+
+
+async def test_bulk_status_change_invalidates_each_user(client, admin, make_user, auth_headers):
+    users = [make_user() for _ in range(2)]
+    for user_id in users:
+        assert await me(client, auth_headers(user_id)) == 200
+    response = await client.post("/api/admin/approve-users", json={"user_ids": users, "status": "rejected"}, headers=admin)
+    assert response.json()["updated"] == 2
+    assert [await me(client, auth_headers(user_id)) for user_id in users] == [403, 403]
+
+
+async def test_grant_admin_takes_effect_immediately(client, admin, make_user, auth_headers):
+    user_id = make_user()
+    headers = auth_headers(user_id)
+    assert (await client.get("/api/admin/users", headers=headers)).status_code == 403
+    response = await client.post("/api/admin/grant-admin", json={"user_id": user_id, "username": "newadmin"}, headers=admin)
+    assert response.status_code == 200
+    assert (await client.get("/api/admin/users", headers=headers)).status_code == 200
+
+
+async def test_change_outside_the_api_is_seen_after_ttl(client, make_user, auth_headers, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: now[0])
+    user_id = make_user()
+    headers = auth_headers(user_id)
+    assert await me(client, headers) == 200
+    with engine.begin() as conn:  # 다른 워커의 변경처럼 캐시를 건드리지 않는다
+        conn.execute(update(models.User).where(models.User.id == user_id).values(status=UserStatusEnum.rejected))
+    assert await me(client, headers) == 200  # TTL 안에서는 캐시된 상태
+    now[0] += user_cache.ttl + 1
+    assert await me(client, headers) == 403
@@ -0,0 +1,76 @@
+# backend/tests/test_view_counter.py
+import pytest
+from sqlalchemy import insert, select, text
+
+from app import main, models
+from app.database import engine
+from app.models import UserRoleEnum
+from app.view_counter import ViewCounter, notice_views
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def make_notice():
+    def create(view_count=0) -> int:
+        with engine.begin() as conn:
+            return conn.execute(insert(models.Notice).values(
+                title="notice", content="body", view_count=view_count,
+            ).returning(models.Notice.id)).scalar_one()
+    return create
+
+
+def stored_views(notice_id: int) -> int:
+    with engine.connect() as conn:
+        return conn.scalar(select(models.Notice.view_count).where(models.Notice.id == notice_id))
+
+
+async def test_views_are_buffered_then_flushed(client, make_notice, make_user, auth_headers):
+    notice_id, other_id = make_notice(view_count=5), make_notice(view_count=None)
+    headers = auth_headers(make_user())
+    for _ in range(3):
+        response = await client.get(f"/api/notices/{notice_id}", headers=headers)
+    assert response.json()["view_count"] == 8  # 저장된 값 + 아직 반영되지 않은 증가분
+    await client.get(f"/api/notices/{other_id}", headers=headers)
+    assert stored_views(notice_id) == 5
+
+    assert await notice_views.flush() == 2  # 공지 두 건을 UPDATE 한 번에
+    assert (stored_views(notice_id), stored_views(other_id)) == (8, 1)
+    assert notice_views.pending(notice_id) == 0
+    listed = (await client.get("/api/notices/", headers=headers)).json()
+    assert {row["id"]: row["view_count"] for row in listed} == {notice_id: 8, other_id: 1}
+
+
+async def test_failed_flush_keeps_deltas_for_next_flush(anyio_backend, make_notice, monkeypatch):
+    counter = ViewCounter(interval=10)
+    notice_id = make_notice()
+    for _ in range(2):
+        counter.increment(notice_id)
+
+    monkeypatch.setattr(ViewCounter, "_statement", staticmethod(lambda batch: (text("UPDATE missing_table SET x = 1"),)))
+    with pytest.raises(Exception):
+        await counter.flush()
+    monkeypatch.undo()
+
+    counter.increment(notice_id)  # 실패한 사이에 들어온 조회도 합쳐진다
+    assert counter.pending(notice_id) == 3
+    assert await counter.flush() == 1
+    assert stored_views(notice_id) == 3 and counter.pending(notice_id) == 0
+
+
+async def test_shutdown_flushes_pending_views(anyio_backend, make_notice, monkeypatch):
+    monkeypatch.setattr(main.hash_pool, "shutdown", lambda: None)
+    monkeypatch.setattr(main, "shutdown_logging", lambda: None)
+    notice_id = make_notice()
+    notice_views.increment(notice_id)
+    await main.shutdown_event()
+    assert stored_views(notice_id) == 1
+
+
+async def test_deleted_notice_drops_pending_views(client, make_notice, make_user, auth_headers):
+    notice_id = make_notice()
+    admin = auth_headers(make_user(role=UserRoleEnum.admin))
+    await client.get(f"/api/notices/{notice_id}", headers=admin)
+    assert (await client.delete(f"/api/notices/{notice_id}", headers=admin)).status_code == 204
+    assert notice_views.pending(notice_id) == 0
+    assert await notice_views.flush() == 0
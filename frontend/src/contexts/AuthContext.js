@@ -1,5 +1,5 @@
 import React, { createContext, useContext, useState, useEffect } from 'react';
-import api from '../services/api';
+import api, { clearTokens, refreshAccessToken, saveTokens } from '../services/api';
 import { jwtDecode } from 'jwt-decode';
 
 const AuthContext = createContext(null);
@@ -14,20 +14,14 @@ export const AuthProvider = ({ children }) => {
       if (token) {
         try {
           const decodedToken = jwtDecode(token);
-          if (decodedToken.exp * 1000 > Date.now()) {
-            try {
-              const response = await api.get('/mypage/me');
-              setUser(response.data);
-            } catch (err) {
-              localStorage.removeItem('token');
-              setUser(null);
-            }
-          } else {
-            localStorage.removeItem('token');
-            setUser(null);
+          if (decodedToken.exp * 1000 <= Date.now()) {
+            // access token 만료 - refresh token 으로 재발급 (없거나 만료면 예외 -> 로그아웃 상태)
+            await refreshAccessToken();
           }
+          const response = await api.get('/mypage/me');
+          setUser(response.data);
         } catch (err) {
-          localStorage.removeItem('token');
+          clearTokens();
           setUser(null);
         }
       }
@@ -38,22 +32,25 @@ export const AuthProvider = ({ children }) => {
 
   const login = async (phone_number, password) => {
     const response = await api.post('/auth/login', { phone_number, password });
-    const { access_token } = response.data;
-    localStorage.setItem('token', access_token);
+    saveTokens(response.data);
     const userResponse = await api.get('/mypage/me');
     setUser(userResponse.data);
   };
 
   const adminLogin = async (username, password) => {
     const response = await api.post('/auth/super-admin-login', { username, password });
-    const { access_token } = response.data;
-    localStorage.setItem('token', access_token);
+    saveTokens(response.data);
     const userResponse = await api.get('/mypage/me');
     setUser(userResponse.data);
   };
 
   const logout = () => {
-    localStorage.removeItem('token');
+    const refreshToken = localStorage.getItem('refreshToken');
+    if (refreshToken) {
+      // 서버에서 이 로그인의 refresh token 폐기 (실패해도 로그아웃은 진행)
+      api.post('/auth/logout', { refresh_token: refreshToken }).catch(() => {});
+    }
+    clearTokens();
     setUser(null);
   };
 
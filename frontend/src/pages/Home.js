@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import Slider from 'react-slick'; // react-slick 임포트
 import api from '../services/api';
+import { subscribeScheduleAvailability, applyAvailabilityDelta } from '../services/scheduleStream';
 import { Link } from 'react-router-dom';
 import './Home.css'; // 별도 CSS 파일 필요
 
@@ -34,6 +35,17 @@ const Home = () => {
     };
     fetchSchedules();
   }, []);  // 수정: 빈 배열 추가
+  // 신청 현황은 다시 불러오지 않고 실시간 이벤트로 갱신
+  useEffect(() => {
+    return subscribeScheduleAvailability((deltas) => {
+      setSchedules((current) => {
+        const byId = new Map(deltas.map((delta) => [delta.id, delta]));
+        return current
+          .map((job) => (byId.has(job.id) ? applyAvailabilityDelta(job, byId.get(job.id)) : job))
+          .filter(Boolean);
+      });
+    });
+  }, []);
   // [신규] 마감 여부 계산 함수
   const getScheduleStatus = (schedule) => {
     // current_applicants (승인됨) + pending_applicants (대기중)
@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import api from '../services/api';
+import { subscribeScheduleAvailability, applyAvailabilityDelta } from '../services/scheduleStream';
 import { useAuth } from '../contexts/AuthContext';
 // [수정] 관리자용 신청자 목록 (승인/거절 기능 포함)
 const AdminApplicantList = ({ scheduleId, onStatusChange }) => {
@@ -116,6 +117,18 @@ const ScheduleDetail = () => {
   useEffect(() => {
     fetchSchedule();
   }, [fetchSchedule]);  // 수정: [fetchSchedule]
+  // 이 스케줄의 신청 현황 변경만 실시간으로 받는다
+  useEffect(() => {
+    return subscribeScheduleAvailability((deltas) => {
+      const delta = deltas.find((item) => String(item.id) === String(id));
+      if (!delta) return;
+      if (delta.deleted) {
+        setError('삭제된 스케줄입니다.');
+        return;
+      }
+      setSchedule((current) => (current ? applyAvailabilityDelta(current, delta) : current));
+    }, [id]);
+  }, [id]);
   const handleApply = async () => {
     if (!user) {
       alert('로그인이 필요합니다.');
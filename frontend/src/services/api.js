@@ -27,6 +27,17 @@ api.interceptors.request.use(
     if (token) {
       config.headers['Authorization'] = `Bearer ${token}`;
     }
+    // 방금 쓰기를 했다면 서버가 준 값을 다시 보내 조회가 복제본 대신 주 DB 에서 읽히도록 함
+    // (비표준 헤더라 교차 출처 GET 도 preflight 가 생기므로 만료 전에만 보내고, 지나면 지움)
+    const primaryUntil = sessionStorage.getItem('primaryUntil');
+    if (primaryUntil) {
+      const expires = Number(primaryUntil.split('.')[0]) * 1000; // '만료 unix time.서명'
+      if (expires > Date.now()) {
+        config.headers['X-Primary-Until'] = primaryUntil;
+      } else {
+        sessionStorage.removeItem('primaryUntil');
+      }
+    }
     return config;
   },
   (error) => {
@@ -34,4 +45,80 @@ api.interceptors.request.use(
   }
 );
 
+// 토큰 저장/삭제 (access token + refresh token)
+export const saveTokens = ({ access_token, refresh_token }) => {
+  localStorage.setItem('token', access_token);
+  if (refresh_token) {
+    localStorage.setItem('refreshToken', refresh_token);
+  }
+};
+
+export const clearTokens = () => {
+  localStorage.removeItem('token');
+  localStorage.removeItem('refreshToken');
+};
+
+// refresh token 은 1회용이므로 동시에 여러 요청이 401 을 받아도 갱신 요청은 한 번만 보냄
+let refreshing = null;
+export const refreshAccessToken = () => {
+  const refreshToken = localStorage.getItem('refreshToken');
+  if (!refreshToken) {
+    return Promise.reject(new Error('No refresh token'));
+  }
+  if (!refreshing) {
+    refreshing = axios
+      .post(`${getApiBaseUrl()}/auth/refresh`, { refresh_token: refreshToken })
+      .then((response) => {
+        saveTokens(response.data);
+        return response.data.access_token;
+      })
+      .catch((err) => {
+        if (err.response && err.response.status === 401) {
+          clearTokens();  // 만료/폐기됨 - 다시 로그인 필요
+        }
+        throw err;
+      })
+      .finally(() => {
+        refreshing = null;
+      });
+  }
+  return refreshing;
+};
+
+// 로그인/갱신 요청 자체의 401 은 다시 시도하지 않음
+const NO_REFRESH_URLS = ['/auth/login', '/auth/super-admin-login', '/auth/refresh', '/auth/logout'];
+
+// 응답 인터셉터: 쓰기 응답의 X-Primary-Until (서명된 만료 시각) 저장,
+// access token 만료(401) 시 refresh token 으로 재발급 후 원래 요청을 한 번 다시 보냄
+api.interceptors.response.use(
+  (response) => {
+    const primaryUntil = response.headers['x-primary-until'];
+    if (primaryUntil) {
+      sessionStorage.setItem('primaryUntil', primaryUntil);
+    }
+    return response;
+  },
+  async (error) => {
+    const original = error.config;
+    if (
+      error.response &&
+      error.response.status === 401 &&
+      original &&
+      !original._retried &&
+      !NO_REFRESH_URLS.includes(original.url) &&
+      localStorage.getItem('refreshToken')
+    ) {
+      original._retried = true;
+      try {
+        const accessToken = await refreshAccessToken();
+        original.headers['Authorization'] = `Bearer ${accessToken}`;
+        return api(original);
+      } catch (refreshError) {
+        return Promise.reject(error);
+      }
+    }
+    return Promise.reject(error);
+  }
+);
+
 export default api;
@@ -0,0 +1,33 @@
+import api from './api';
+
+// 스케줄 자리 현황 실시간 구독 (GET /schedules/stream, Server-Sent Events)
+// onDeltas 는 [{ id, current, pending, capacity }] (삭제된 스케줄은 { id, deleted: true }) 를 받는다.
+// 반환값을 호출하면 구독 해제. EventSource 가 끊기면 브라우저가 자동으로 재연결한다.
+export const subscribeScheduleAvailability = (onDeltas, ids = null) => {
+  if (typeof window === 'undefined' || !window.EventSource) {
+    return () => {};
+  }
+  const query = ids && ids.length > 0 ? `?ids=${ids.join(',')}` : '';
+  const source = new EventSource(`${api.defaults.baseURL}/schedules/stream${query}`);
+  source.addEventListener('availability', (event) => {
+    try {
+      onDeltas(JSON.parse(event.data));
+    } catch (err) {
+      console.error('자리 현황 이벤트 처리 실패', err);
+    }
+  });
+  return () => source.close();
+};
+
+// 델타를 스케줄 객체에 반영 (삭제된 스케줄은 null)
+export const applyAvailabilityDelta = (schedule, delta) => {
+  if (delta.deleted) {
+    return null;
+  }
+  return {
+    ...schedule,
+    current_applicants: delta.current,
+    pending_applicants: delta.pending,
+    capacity: delta.capacity,
+  };
+};